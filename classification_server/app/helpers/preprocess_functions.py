@@ -6,13 +6,17 @@ import re
 from nltk.corpus import stopwords
 from sklearn.preprocessing import LabelEncoder
 import json
+import os
+
+# Колонки датасета, нужные для обучения
+TRAINING_COLUMNS = ["category_name", "article_link", "article_title", "article_text"]
 
 def del_duplicates(df):
     df = df.drop_duplicates(subset=["article_link"])
     return df
 
 def del_columns(df):
-    df = df.drop(["news_source_name", "news_source_link", "category_link", "article_date", "article_link"], axis=1)
+    df = df.drop(["news_source_name", "news_source_link", "category_link", "article_date", "article_link"], axis=1, errors="ignore")
     return df
 
 def to_lower_str(df):
@@ -183,8 +187,12 @@ def preprocess_data(file_path):
     else:
         print("GPU not available, CPU used")
 
-    print("Reading csv file...")
-    df = pd.read_csv(file_path)
+    if os.path.isdir(file_path):
+        print("Reading parquet dataset...")
+        df = pd.read_parquet(file_path, columns=TRAINING_COLUMNS)
+    else:
+        print("Reading csv file...")
+        df = pd.read_csv(file_path)
 
     print("Removing duplicates...")
     df = del_duplicates(df)
@@ -17,8 +17,10 @@ async def periodic_model_training():
     while True:
         if not os.path.exists(MODEL_PATH):
             data = load_json_data(JSON_DIR_PATH)
-            dataset_size_str = data['dataset_size']
-            dataset_size = float(dataset_size_str.split()[0])
+            if 'dataset_bytes' in data:
+                dataset_size = data['dataset_bytes'] / 1e6
+            else:
+                dataset_size = float(data['dataset_size'].split()[0])
 
             if dataset_size < n:
                 system_logger.debug(f"Dataset size is less than {n} MB. Waiting for more data...")
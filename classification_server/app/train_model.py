@@ -1,5 +1,8 @@
-from settings.paths import DATA_FILE_PATH
+from settings.paths import DATA_FILE_PATH, JSON_DIR_PATH, PARQUET_DIR_PATH
+from settings.env_config import TRAINING_DATASET_FORMAT
+from settings.logger_setup import model_logger
 from app.helpers.preprocess_functions import preprocess_data
+import json
 import os
 from navec import Navec
 import numpy as np
@@ -44,9 +47,33 @@ async def download_file(url, dest):
             else:
                 print(f"Error while downloading: {response.status}")
     
+def get_training_data_path(dataset_format=TRAINING_DATASET_FORMAT, json_path=JSON_DIR_PATH):
+    """
+    Выбирает датасет для обучения по настроенному формату, а не по наличию каталога.
+
+    В режиме "auto" формат берется из info.json (dataset_formats): если парсер
+    пишет CSV, обучение идет по CSV — Parquet могли включить позже, и тогда в
+    нем только часть статей; Parquet выбирается, только если CSV не пишется.
+
+    Аргументы:
+        dataset_format (str): "csv", "parquet" или "auto".
+        json_path (Path): Путь к info.json парсера.
+
+    Возвращает:
+        Path: Путь к CSV файлу или к каталогу Parquet датасета.
+    """
+    if dataset_format == "auto":
+        dataset_formats = []
+        if os.path.exists(json_path):
+            with open(json_path, 'r', encoding='utf-8') as json_file:
+                dataset_formats = json.load(json_file).get("dataset_formats", [])
+        dataset_format = "parquet" if "parquet" in dataset_formats and "csv" not in dataset_formats else "csv"
+
+    return PARQUET_DIR_PATH if dataset_format == "parquet" else DATA_FILE_PATH
+
 async def train_model():
-    data_path = DATA_FILE_PATH
-    print(data_path)
+    data_path = get_training_data_path()
+    model_logger.info(f"Training on dataset: {data_path}")
 
     df = preprocess_data(data_path)
 
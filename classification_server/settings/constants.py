@@ -2,4 +2,5 @@ MODEL_NAME ="model.joblib"
 LOGS_DIR_NAME = "model"
 JSON_FILE_NAME = "info.json"
 DATA_DIR_NAME = "shared_data"
-DATA_FILE_NAME = "news_data.csv"
\ No newline at end of file
+DATA_FILE_NAME = "news_data.csv"
+PARQUET_DIR_NAME = "news_parquet"
\ No newline at end of file
@@ -1,3 +1,10 @@
 import os
 
 DEPLOY_MODE = os.environ.get("DEPLOY_MODE", "dev").lower()
+
+# Прореживание DEBUG логов: из каждой строки кода пишется одна запись из N; 1 — писать все
+LOG_DEBUG_SAMPLING = max(1, int(os.environ.get("LOG_DEBUG_SAMPLING", "1")))
+
+# Формат, из которого обучается модель: "csv", "parquet" или "auto" — по списку
+# форматов, которые парсер записал в info.json (dataset_formats)
+TRAINING_DATASET_FORMAT = os.environ.get("TRAINING_DATASET_FORMAT", "auto").lower()
@@ -1,5 +1,5 @@
 from pathlib import Path
-from settings.constants import MODEL_NAME, LOGS_DIR_NAME, JSON_FILE_NAME, DATA_DIR_NAME, DATA_FILE_NAME
+from settings.constants import MODEL_NAME, LOGS_DIR_NAME, JSON_FILE_NAME, DATA_DIR_NAME, DATA_FILE_NAME, PARQUET_DIR_NAME
 
 BASE_PROJECT_DIR = Path(__file__).resolve().parent.parent.parent
 MODEL_PATH = BASE_PROJECT_DIR / DATA_DIR_NAME / MODEL_NAME
@@ -8,4 +8,5 @@ LOGS_DIR_PATH = BASE_PROJECT_DIR / "logs" / LOGS_DIR_NAME
 
 JSON_DIR_PATH = BASE_PROJECT_DIR / DATA_DIR_NAME / JSON_FILE_NAME
 
-DATA_FILE_PATH = BASE_PROJECT_DIR / DATA_DIR_NAME / DATA_FILE_NAME
\ No newline at end of file
+DATA_FILE_PATH = BASE_PROJECT_DIR / DATA_DIR_NAME / DATA_FILE_NAME
+PARQUET_DIR_PATH = BASE_PROJECT_DIR / DATA_DIR_NAME / PARQUET_DIR_NAME
\ No newline at end of file
@@ -0,0 +1,256 @@
+import asyncio
+import csv
+import io
+import os
+import re
+import zlib
+from datetime import datetime
+from typing import Iterator, Optional, Set
+from aiohttp import web
+from settings.env_config import DATA_API_PORT, DATASET_FORMATS
+from settings.logger_setup import parser_logger
+from settings.paths import DATA_FILE_PATH
+from app.helpers.date_parser import MOSCOW_TZ
+from app.write_news_to_csv import csv_write_lock
+
+# HTTP API датасета. GET /data отдает CSV датасет потоком (chunked), при
+# Accept-Encoding: gzip — сжатым. Датасет только дописывается, поэтому
+# потребитель может забирать лишь новые строки: в заголовке X-Dataset-Cursor
+# каждого ответа — байтовая позиция конца отданного снимка, и запрос с
+# ?cursor=<позиция> вернет заголовок CSV и строки, дописанные после нее.
+# Параметры:
+#   source — источник (можно несколько, через запятую или повтором параметра);
+#   since  — ISO дата и время, строки с article_date не раньше (без часового пояса — московское время);
+#   offset — пропустить столько первых строк данных;
+#   cursor — байтовая позиция из X-Dataset-Cursor предыдущего ответа.
+# Без фильтров поддерживается Range: bytes=N-[M] для докачки (ответ без сжатия).
+
+CHUNK_SIZE = 256 * 1024
+CURSOR_HEADER = "X-Dataset-Cursor"
+
+_RANGE_PATTERN = re.compile(r"^bytes=(\d+)-(\d*)$")
+
+
+def _dataset_snapshot(path) -> int:
+    # Размер под блокировкой записи приходится на конец целой строки
+    with csv_write_lock:
+        return os.path.getsize(path) if os.path.exists(path) else -1
+
+
+def iter_raw_bytes(path, start: int, end: int, prefix: bytes = b"") -> Iterator[bytes]:
+    """
+    Читает байты файла датасета в диапазоне [start, end) кусками по CHUNK_SIZE.
+
+    Аргументы:
+        path (Path): Файл датасета.
+        start (int): Начальная позиция.
+        end (int): Конечная позиция (не включается).
+        prefix (bytes): Данные, которые отдаются перед диапазоном (заголовок CSV).
+    """
+    if prefix:
+        yield prefix
+    with open(path, "rb") as file:
+        file.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            chunk = file.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                return
+            remaining -= len(chunk)
+            yield chunk
+
+
+def iter_filtered_rows(path, start: int, end: int, header: bytes, sources: Set[str], since: Optional[datetime], offset: int) -> Iterator[bytes]:
+    """
+    Разбирает строки датасета в диапазоне [start, end) и отдает подходящие в виде CSV.
+
+    Аргументы:
+        path (Path): Файл датасета.
+        start (int): Позиция первой строки данных.
+        end (int): Позиция конца снимка.
+        header (bytes): Строка заголовка CSV.
+        sources (set): Источники; пустое множество — все.
+        since (datetime): Нижняя граница article_date; None — без ограничения.
+        offset (int): Сколько первых строк диапазона пропустить.
+    """
+    columns = next(csv.reader([header.decode("utf-8")]))
+    source_index = columns.index("news_source_name")
+    date_index = columns.index("article_date")
+
+    with open(path, "rb") as file:
+        file.seek(start)
+
+        def lines():
+            while file.tell() < end:
+                line = file.readline()
+                if not line:
+                    return
+                yield line.decode("utf-8")
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        buffer.write(header.decode("utf-8"))
+        for number, row in enumerate(csv.reader(lines())):
+            if number < offset:
+                continue
+            if sources and row[source_index] not in sources:
+                continue
+            if since is not None:
+                try:
+                    if datetime.fromisoformat(row[date_index]) < since:
+                        continue
+                except (ValueError, TypeError):
+                    continue
+            writer.writerow(row)
+            if buffer.tell() >= CHUNK_SIZE:
+                yield buffer.getvalue().encode("utf-8")
+                buffer.seek(0)
+                buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue().encode("utf-8")
+
+
+def gzip_chunks(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    """Сжимает поток кусков в один gzip поток."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def _parse_since(value: str) -> datetime:
+    since = datetime.fromisoformat(value)
+    if since.tzinfo is None:
+        since = MOSCOW_TZ.localize(since)
+    return since
+
+
+def _parse_non_negative(value: str, name: str) -> int:
+    number = int(value)
+    if number < 0:
+        raise ValueError(f"{name} must be non-negative")
+    return number
+
+
+async def _stream(request: web.Request, response: web.StreamResponse, chunks: Iterator[bytes]) -> web.StreamResponse:
+    # Чтение файла, разбор CSV и сжатие выполняются в пуле потоков, а не в цикле событий
+    loop = asyncio.get_running_loop()
+    await response.prepare(request)
+    try:
+        while True:
+            chunk = await loop.run_in_executor(None, next, chunks, None)
+            if chunk is None:
+                break
+            await response.write(chunk)
+        await response.write_eof()
+    finally:
+        chunks.close()
+    return response
+
+
+async def handle_data(request: web.Request) -> web.StreamResponse:
+    path = request.app["data_path"]
+    if "csv" not in DATASET_FORMATS:
+        raise web.HTTPNotFound(text="The data API serves the CSV dataset; DATASET_FORMAT does not include csv")
+
+    try:
+        sources = {
+            source.strip()
+            for value in request.query.getall("source", [])
+            for source in value.split(",")
+            if source.strip()
+        }
+        since = _parse_since(request.query["since"]) if "since" in request.query else None
+        offset = _parse_non_negative(request.query.get("offset", "0"), "offset")
+        cursor = _parse_non_negative(request.query.get("cursor", "0"), "cursor")
+    except ValueError as e:
+        raise web.HTTPBadRequest(text=f"Invalid query parameter: {e}")
+
+    loop = asyncio.get_running_loop()
+    end = await loop.run_in_executor(None, _dataset_snapshot, path)
+    if end <= 0:
+        raise web.HTTPNotFound(text="Dataset is empty")
+
+    with open(path, "rb") as file:
+        header = file.readline()
+        if cursor:
+            file.seek(cursor - 1)
+            at_row_boundary = file.read(1) == b"\n"
+    if cursor > end:
+        raise web.HTTPRequestRangeNotSatisfiable(headers={CURSOR_HEADER: str(end)}, text=f"Cursor is beyond the dataset end ({end})")
+    if cursor and (cursor < len(header) or not at_row_boundary):
+        raise web.HTTPBadRequest(text="Cursor is not at a row boundary")
+    start = max(cursor, len(header))
+
+    headers = {
+        "Content-Type": "text/csv; charset=utf-8",
+        "Accept-Ranges": "bytes",
+        CURSOR_HEADER: str(end),
+    }
+    filtered = bool(sources or since or offset)
+
+    range_header = request.headers.get("Range")
+    if range_header:
+        match = _RANGE_PATTERN.match(range_header.strip())
+        if filtered or cursor or match is None:
+            raise web.HTTPBadRequest(text="Only Range: bytes=N-[M] without filters or cursor is supported")
+        range_start = int(match.group(1))
+        range_end = min(int(match.group(2)) + 1, end) if match.group(2) else end
+        if range_start >= end or range_start >= range_end:
+            raise web.HTTPRequestRangeNotSatisfiable(headers={"Content-Range": f"bytes */{end}"})
+        headers["Content-Range"] = f"bytes {range_start}-{range_end - 1}/{end}"
+        headers["Content-Length"] = str(range_end - range_start)
+        response = web.StreamResponse(status=206, headers=headers)
+        return await _stream(request, response, iter_raw_bytes(path, range_start, range_end))
+
+    if filtered:
+        chunks = iter_filtered_rows(path, start, end, header, sources, since, offset)
+    else:
+        chunks = iter_raw_bytes(path, start, end, prefix=header)
+
+    if "gzip" in request.headers.get("Accept-Encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        chunks = gzip_chunks(chunks)
+        response = web.StreamResponse(headers=headers)
+        response.enable_chunked_encoding()
+    elif filtered:
+        response = web.StreamResponse(headers=headers)
+        response.enable_chunked_encoding()
+    else:
+        headers["Content-Length"] = str(len(header) + end - start)
+        response = web.StreamResponse(headers=headers)
+    return await _stream(request, response, chunks)
+
+
+async def start_data_server(port: int = DATA_API_PORT, host: str = "0.0.0.0", data_path=DATA_FILE_PATH) -> Optional[web.AppRunner]:
+    """
+    Запускает HTTP API датасета (/data) в текущем цикле событий.
+
+    Аргументы:
+        port (int): Порт сервера; 0 — сервер не запускается.
+        host (str): Адрес, на котором принимаются соединения.
+        data_path (Path): CSV файл датасета.
+
+    Возвращает:
+        web.AppRunner: Запущенный сервер (для остановки через cleanup()).
+        None: Если сервер выключен или не удалось занять порт.
+    """
+    if port <= 0:
+        return None
+
+    app = web.Application()
+    app["data_path"] = data_path
+    app.router.add_get("/data", handle_data, allow_head=False)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    try:
+        await web.TCPSite(runner, host, port).start()
+    except OSError as e:
+        parser_logger.error(f"Failed to start data API on port {port}: {e}")
+        await runner.cleanup()
+        return None
+
+    parser_logger.info(f"📤 Dataset available at http://{host}:{port}/data")
+    return runner
@@ -1,13 +1,14 @@
+from asyncio import Queue
 from aiohttp import ClientSession
-from typing import Callable, List, Dict
+from typing import Awaitable, Callable
 from settings.logger_setup import parser_logger
 
-async def fetch_news_from_source(session: ClientSession, scrapper_name: str, scrapper_function: Callable[[ClientSession], List[Dict]]) -> List[Dict]:
+async def fetch_news_from_source(session: ClientSession, scrapper_name: str, scrapper_function: Callable[[ClientSession, Queue], Awaitable[int]], queue: Queue) -> int:
     try:
         parser_logger.debug(f"Start scraping {scrapper_name}")
-        news = await scrapper_function(session)
-        parser_logger.debug(f"Fetched {len(news)} articles from {scrapper_name}.")
-        return news
+        articles_count = await scrapper_function(session, queue)
+        parser_logger.debug(f"Fetched {articles_count} articles from {scrapper_name}.")
+        return articles_count
     except Exception as e:
         parser_logger.error(f"Error fetching {scrapper_name} news: {e}", exc_info=True)
-        return []
\ No newline at end of file
+        return 0
@@ -0,0 +1,95 @@
+import random
+import threading
+import time
+from typing import Dict, Optional
+from settings.constants import (
+    SCHEDULER_JITTER,
+    SCHEDULER_MAX_INTERVAL,
+    SCHEDULER_MIN_INTERVAL,
+    SCHEDULER_SLOWDOWN,
+    SCHEDULER_SPEEDUP,
+    SLEEPING_TIME,
+)
+
+
+class AdaptiveScheduler:
+    """
+    Подбирает интервалы опроса источников и категорий по числу новых статей.
+
+    Если при очередном опросе найдены новые статьи, интервал уменьшается в
+    SCHEDULER_SPEEDUP раз, если нет — увеличивается в SCHEDULER_SLOWDOWN раз.
+    Интервал ограничен [min_interval, max_interval], к задержке добавляется
+    случайный разброс, чтобы запросы к сайтам не шли синхронно.
+    """
+
+    def __init__(
+        self,
+        initial_interval: float = SLEEPING_TIME,
+        min_interval: float = SCHEDULER_MIN_INTERVAL,
+        max_interval: float = SCHEDULER_MAX_INTERVAL,
+        jitter: float = SCHEDULER_JITTER,
+    ):
+        self.initial_interval = initial_interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.jitter = jitter
+        self.intervals: Dict[str, float] = {}
+        self.category_next_due: Dict[str, float] = {}
+
+    def _adapt(self, key: str, new_count: int) -> float:
+        interval = self.intervals.get(key, self.initial_interval)
+        interval *= SCHEDULER_SPEEDUP if new_count > 0 else SCHEDULER_SLOWDOWN
+        interval = min(max(interval, self.min_interval), self.max_interval)
+        self.intervals[key] = interval
+        return interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def record_source(self, source_name: str, new_count: int) -> float:
+        """
+        Учитывает результат опроса источника.
+
+        Аргументы:
+            source_name (str): Название источника.
+            new_count (int): Число новых статей за опрос.
+
+        Возвращает:
+            float: Задержка в секундах до следующего опроса источника.
+        """
+        return self._adapt(f"source:{source_name}", new_count)
+
+    def category_due(self, category_link: str) -> bool:
+        """Проверяет, пора ли снова опрашивать категорию."""
+        return time.monotonic() >= self.category_next_due.get(category_link, 0)
+
+    def record_category(self, category_link: str, new_count: int):
+        """
+        Учитывает результат опроса категории и назначает время следующего опроса.
+
+        Аргументы:
+            category_link (str): Ссылка на категорию.
+            new_count (int): Число новых ссылок на статьи в категории.
+        """
+        delay = self._adapt(f"category:{category_link}", new_count)
+        self.category_next_due[category_link] = time.monotonic() + delay
+
+    def get_intervals(self) -> Dict[str, float]:
+        """Возвращает текущие интервалы опроса по источникам и категориям."""
+        return dict(self.intervals)
+
+
+_scheduler: Optional[AdaptiveScheduler] = None
+_scheduler_lock = threading.Lock()
+
+def get_scheduler() -> AdaptiveScheduler:
+    """Возвращает планировщик опроса, общий для всего процесса."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = AdaptiveScheduler()
+    return _scheduler
+
+
+def set_scheduler(scheduler: AdaptiveScheduler):
+    """Заменяет общий планировщик (например, с другим начальным интервалом)."""
+    global _scheduler
+    with _scheduler_lock:
+        _scheduler = scheduler
@@ -0,0 +1,158 @@
+import math
+import mmap
+import os
+import struct
+from hashlib import blake2b
+from pathlib import Path
+from typing import Iterable, List, Tuple
+
+# Заголовок файла слоя: сигнатура, емкость, доля ложных срабатываний, число
+# хеш-функций, число бит, число добавленных элементов
+_HEADER = struct.Struct("<8sQdIQQ")
+_MAGIC = b"NCBLOOM1"
+_LAYER_PATTERN = "layer_{:03d}.bloom"
+
+
+def item_hashes(item: str) -> Tuple[int, int]:
+    """Два независимых 64-битных хеша элемента; позиции бит строятся из них двойным хешированием."""
+    digest = blake2b(item.encode("utf-8"), digest_size=16).digest()
+    return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+
+
+class BloomFilter:
+    """
+    Фильтр Блума фиксированной емкости в файле, отображенном в память (mmap).
+
+    В памяти процесса находятся только затронутые страницы файла, а изменения
+    сохраняются на диск операционной системой; flush() записывает счетчик
+    элементов и сбрасывает страницы.
+
+    Аргументы:
+        path (Path): Файл слоя; создается, если его нет.
+        capacity (int): Число элементов, на которое рассчитан фильтр.
+        error_rate (float): Доля ложных срабатываний при заполнении до capacity.
+    """
+
+    def __init__(self, path, capacity: int, error_rate: float):
+        self.path = Path(path)
+        if not self.path.exists():
+            bit_count = max(8, int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)))
+            hash_count = max(1, int(round(bit_count / capacity * math.log(2))))
+            with open(self.path, "wb") as f:
+                f.write(_HEADER.pack(_MAGIC, capacity, error_rate, hash_count, bit_count, 0))
+                f.truncate(_HEADER.size + (bit_count + 7) // 8)
+
+        self.file = open(self.path, "r+b")
+        self.map = mmap.mmap(self.file.fileno(), 0)
+        magic, self.capacity, self.error_rate, self.hash_count, self.bit_count, self.count = _HEADER.unpack_from(self.map, 0)
+        if magic != _MAGIC:
+            self.close()
+            raise ValueError(f"{self.path} is not a bloom filter file")
+
+    def _positions(self, hashes: Tuple[int, int]):
+        h1, h2 = hashes
+        bit_count = self.bit_count
+        return [(h1 + i * h2) % bit_count for i in range(self.hash_count)]
+
+    def contains_hashes(self, hashes: Tuple[int, int]) -> bool:
+        data = self.map
+        offset = _HEADER.size
+        for position in self._positions(hashes):
+            if not data[offset + (position >> 3)] & (1 << (position & 7)):
+                return False
+        return True
+
+    def add_hashes(self, hashes: Tuple[int, int]):
+        data = self.map
+        offset = _HEADER.size
+        for position in self._positions(hashes):
+            data[offset + (position >> 3)] |= 1 << (position & 7)
+        self.count += 1
+
+    @property
+    def is_full(self) -> bool:
+        return self.count >= self.capacity
+
+    def flush(self):
+        _HEADER.pack_into(self.map, 0, _MAGIC, self.capacity, self.error_rate, self.hash_count, self.bit_count, self.count)
+        self.map.flush()
+
+    def close(self):
+        if not self.map.closed:
+            self.map.close()
+        self.file.close()
+
+
+class ScalableBloomFilter:
+    """
+    Масштабируемый фильтр Блума: цепочка слоев в каталоге.
+
+    Когда последний слой заполнен, добавляется новый, в growth раз больше и с
+    долей ложных срабатываний, уменьшенной в tightening раз, поэтому общая доля
+    ложных срабатываний ограничена примерно error_rate / (1 - tightening)
+    при любом числе элементов. Ложных отрицаний нет: если фильтр отвечает
+    "нет", элемента точно не добавляли. Фильтр не потокобезопасен, доступ
+    синхронизирует владелец.
+
+    Аргументы:
+        directory (Path): Каталог слоев.
+        initial_capacity (int): Емкость первого слоя.
+        error_rate (float): Доля ложных срабатываний первого слоя.
+        growth (int): Во сколько раз следующий слой больше предыдущего.
+        tightening (float): Множитель доли ложных срабатываний следующего слоя.
+    """
+
+    def __init__(self, directory, initial_capacity: int, error_rate: float, growth: int = 2, tightening: float = 0.5):
+        self.directory = Path(directory)
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        self.growth = growth
+        self.tightening = tightening
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.layers: List[BloomFilter] = []
+        while (self.directory / _LAYER_PATTERN.format(len(self.layers))).exists():
+            self.layers.append(BloomFilter(self.directory / _LAYER_PATTERN.format(len(self.layers)), 0, 1))
+        if not self.layers:
+            self._add_layer()
+
+    def _add_layer(self):
+        index = len(self.layers)
+        self.layers.append(BloomFilter(
+            self.directory / _LAYER_PATTERN.format(index),
+            self.initial_capacity * self.growth ** index,
+            self.error_rate * self.tightening ** index,
+        ))
+
+    def __contains__(self, item: str) -> bool:
+        hashes = item_hashes(item)
+        return any(layer.contains_hashes(hashes) for layer in self.layers)
+
+    def __len__(self):
+        return sum(layer.count for layer in self.layers)
+
+    def add_many(self, items: Iterable[str]):
+        """Добавляет элементы; вызывающий передает только элементы, которых в фильтре еще не было."""
+        for item in items:
+            if self.layers[-1].is_full:
+                self.layers[-1].flush()
+                self._add_layer()
+            self.layers[-1].add_hashes(item_hashes(item))
+
+    def size_bytes(self) -> int:
+        return sum(os.path.getsize(layer.path) for layer in self.layers)
+
+    def flush(self):
+        for layer in self.layers:
+            layer.flush()
+
+    def clear(self):
+        """Удаляет все слои и начинает с пустого первого слоя."""
+        self.close()
+        for layer in self.layers:
+            layer.path.unlink(missing_ok=True)
+        self.layers = []
+        self._add_layer()
+
+    def close(self):
+        for layer in self.layers:
+            layer.close()
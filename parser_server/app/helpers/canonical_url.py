@@ -0,0 +1,98 @@
+import re
+from functools import lru_cache
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Приведение ссылок к одному виду: одна и та же статья может встречаться на
+# сайте со служебными параметрами, якорем, в мобильной или AMP версии, со
+# слешем в конце или без него. Все ссылки, которые находят скрапперы, проходят
+# через canonicalize_url, поэтому индекс статей, очередь обхода и датасет
+# хранят одну ссылку на статью.
+
+# Зеркала хостов источников -> основной хост
+HOST_ALIASES = {
+    "www.lenta.ru": "lenta.ru",
+    "m.lenta.ru": "lenta.ru",
+    "www.ria.ru": "ria.ru",
+    "m.ria.ru": "ria.ru",
+    "rbc.ru": "www.rbc.ru",
+    "m.rbc.ru": "www.rbc.ru",
+    "gazeta.ru": "www.gazeta.ru",
+    "m.gazeta.ru": "www.gazeta.ru",
+}
+
+# Правила для хостов источников:
+#   drop_query     — у страниц нет значимых параметров, строка запроса отбрасывается целиком;
+#   trailing_slash — True: путь без расширения в последнем сегменте заканчивается слешем,
+#                    None: слеш в конце не меняется (у rbc статьи без слеша, а рубрики со слешем).
+HOST_RULES = {
+    "lenta.ru": {"drop_query": True, "trailing_slash": True},
+    "ria.ru": {"drop_query": True, "trailing_slash": True},
+    "www.rbc.ru": {"drop_query": True, "trailing_slash": None},
+    "www.gazeta.ru": {"drop_query": True, "trailing_slash": True},
+}
+DEFAULT_RULES = {"drop_query": False, "trailing_slash": None}
+
+# Параметры, которые не меняют содержимое страницы (для хостов без drop_query)
+TRACKING_QUERY_PARAMS = frozenset({"from", "ref", "rcmrclid", "yclid", "gclid", "fbclid", "_openstat", "amp"})
+TRACKING_QUERY_PREFIXES = ("utm_",)
+
+# Сегмент пути AMP версии страницы: /amp/..., .../amp/
+AMP_SEGMENT = "amp"
+
+_MULTIPLE_SLASHES = re.compile(r"/{2,}")
+
+CANONICAL_CACHE_SIZE = 65536
+
+
+def _is_tracking_param(name: str) -> bool:
+    name = name.lower()
+    return name in TRACKING_QUERY_PARAMS or name.startswith(TRACKING_QUERY_PREFIXES)
+
+
+@lru_cache(maxsize=CANONICAL_CACHE_SIZE)
+def canonicalize_url(url: str) -> str:
+    """
+    Приводит абсолютную ссылку к каноническому виду.
+
+    Хост приводится к нижнему регистру и основному зеркалу (у хостов источников
+    схема заменяется на https), убираются порт по умолчанию, якорь, повторные
+    слеши, сегмент AMP и служебные параметры запроса; слеш в конце пути
+    выравнивается по правилам хоста из HOST_RULES.
+
+    Аргументы:
+        url (str): Абсолютная ссылка.
+
+    Возвращает:
+        str: Каноническая ссылка; ссылка без схемы и хоста возвращается без изменений.
+    """
+    url = url.strip()
+    parts = urlsplit(url)
+    if not parts.netloc or parts.scheme not in ("http", "https"):
+        return url
+
+    host = (parts.hostname or "").rstrip(".")
+    host = HOST_ALIASES.get(host, host)
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+    rules = HOST_RULES.get(host, DEFAULT_RULES)
+    scheme = "https" if host in HOST_RULES else parts.scheme
+
+    path = _MULTIPLE_SLASHES.sub("/", parts.path or "/")
+    segments = path.split("/")
+    if len(segments) > 2 and segments[1] == AMP_SEGMENT:
+        del segments[1]
+    if len(segments) > 2 and segments[-1] == "" and segments[-2] == AMP_SEGMENT:
+        del segments[-2]
+    elif len(segments) > 2 and segments[-1] == AMP_SEGMENT:
+        segments[-1] = ""
+    path = "/".join(segments) or "/"
+
+    if rules["trailing_slash"] and not path.endswith("/") and "." not in segments[-1]:
+        path += "/"
+
+    query = ""
+    if parts.query and not rules["drop_query"]:
+        params = [(name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True) if not _is_tracking_param(name)]
+        query = urlencode(sorted(params))
+
+    return urlunsplit((scheme, host, path, query, ""))
@@ -0,0 +1,222 @@
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+from settings.constants import (
+    FRONTIER_DROPPED_RETENTION,
+    FRONTIER_FAILED_COOLDOWN,
+    FRONTIER_MAX_ATTEMPTS,
+    FRONTIER_MAX_TOTAL_ATTEMPTS,
+)
+from settings.env_config import WORKER_ID
+from settings.logger_setup import parser_logger
+from settings.paths import FRONTIER_FILE_PATH
+
+PENDING = "pending"
+FETCHED = "fetched"
+FAILED = "failed"
+DROPPED = "dropped"
+
+_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class CrawlFrontier:
+    """
+    Постоянная очередь обхода: найденные, но еще не записанные в датасет статьи.
+
+    Статья попадает в очередь со статусом pending, когда ее ссылка найдена в
+    категории, получает статус fetched, когда статья загружена и передана на
+    запись, и удаляется, когда она записана в датасет. Статья, которую не
+    удалось извлечь FRONTIER_MAX_ATTEMPTS раз, помечается как failed и через
+    FRONTIER_FAILED_COOLDOWN секунд снова становится pending; после
+    FRONTIER_MAX_TOTAL_ATTEMPTS попыток за все время — dropped и через
+    FRONTIER_DROPPED_RETENTION секунд удаляется. Временные ошибки загрузки
+    (circuit breaker, таймауты) попытками не считаются.
+
+    Файл очереди может быть общим для нескольких процессов (воркеров), поэтому
+    fetched статьи помечаются владельцем. При открытии pending снова становятся
+    только fetched статьи этого владельца: они не дошли до датасета до
+    перезапуска, а статьи других процессов еще в работе.
+
+    Аргументы:
+        frontier_path (Path): Путь к файлу SQLite.
+        owner (str): Владелец fetched статей (идентификатор воркера; "" — единственный процесс).
+    """
+
+    def __init__(self, frontier_path=FRONTIER_FILE_PATH, owner: str = ""):
+        self.frontier_path = frontier_path
+        self.owner = owner
+        self.lock = threading.Lock()
+        # Ожидание блокировки, которую держит другой процесс, вместо "database is locked"
+        self.connection = sqlite3.connect(str(frontier_path), timeout=30, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS frontier (
+                article_link TEXT PRIMARY KEY,
+                news_source_name TEXT NOT NULL,
+                category_name TEXT,
+                category_link TEXT,
+                article_title TEXT,
+                state TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                updated_at TEXT NOT NULL
+            )
+            """
+        )
+        columns = {row[1] for row in self.connection.execute("PRAGMA table_info(frontier)")}
+        with self.connection:
+            if "owner" not in columns:
+                self.connection.execute("ALTER TABLE frontier ADD COLUMN owner TEXT NOT NULL DEFAULT ''")
+            if "total_attempts" not in columns:
+                self.connection.execute("ALTER TABLE frontier ADD COLUMN total_attempts INTEGER NOT NULL DEFAULT 0")
+        self.connection.execute("CREATE INDEX IF NOT EXISTS frontier_source_state ON frontier (news_source_name, state)")
+        with self.connection:
+            self.connection.execute(
+                "UPDATE frontier SET state = ? WHERE state = ? AND owner = ?", (PENDING, FETCHED, owner)
+            )
+
+        counts = dict(self.connection.execute("SELECT state, COUNT(*) FROM frontier GROUP BY state"))
+        parser_logger.debug(f"Crawl frontier loaded: {counts}")
+
+    def add_many(self, source_name: str, category: Dict[str, str], articles: Iterable[Dict[str, str]]) -> List[Dict[str, str]]:
+        """
+        Добавляет найденные в категории статьи в очередь обхода.
+
+        Аргументы:
+            source_name (str): Название источника.
+            category (dict): Категория с ключами "name" и "link".
+            articles (Iterable[dict]): Статьи с ключом "link" (и "title", если он известен).
+
+        Возвращает:
+            list: Статьи, которых еще не было в очереди.
+        """
+        now = datetime.now().strftime(_TIME_FORMAT)
+        added = []
+        with self.lock, self.connection:
+            for article in articles:
+                cursor = self.connection.execute(
+                    "INSERT OR IGNORE INTO frontier "
+                    "(article_link, news_source_name, category_name, category_link, article_title, state, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (article["link"], source_name, category["name"], category["link"], article.get("title"), PENDING, now),
+                )
+                if cursor.rowcount:
+                    added.append(article)
+        return added
+
+    def pending(self, source_name: str) -> List[Dict[str, Dict[str, str]]]:
+        """
+        Возвращает незавершенные статьи источника.
+
+        Аргументы:
+            source_name (str): Название источника.
+
+        Возвращает:
+            list: Словари {"category": {"name", "link"}, "article": {"link"[, "title"]}}.
+        """
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT article_link, category_name, category_link, article_title FROM frontier "
+                "WHERE news_source_name = ? AND state = ?",
+                (source_name, PENDING),
+            ).fetchall()
+
+        entries = []
+        for link, category_name, category_link, title in rows:
+            article = {"link": link}
+            if title is not None:
+                article["title"] = title
+            entries.append({"category": {"name": category_name, "link": category_link}, "article": article})
+        return entries
+
+    def requeue_failed(self, source_name: str, cooldown: float = FRONTIER_FAILED_COOLDOWN) -> int:
+        """
+        Возвращает в очередь статьи со статусом failed, помеченные больше cooldown секунд назад.
+
+        Статьи, исчерпавшие FRONTIER_MAX_TOTAL_ATTEMPTS попыток (например, удаленные
+        страницы с ответом 404/410), вместо этого получают статус dropped, а
+        dropped статьи старше FRONTIER_DROPPED_RETENTION секунд удаляются, чтобы
+        очередь не росла без ограничений.
+
+        Аргументы:
+            source_name (str): Название источника.
+            cooldown (float): Сколько секунд статья остается failed.
+
+        Возвращает:
+            int: Число статей, снова поставленных в очередь.
+        """
+        now = datetime.now()
+        cutoff = (now - timedelta(seconds=cooldown)).strftime(_TIME_FORMAT)
+        dropped_cutoff = (now - timedelta(seconds=FRONTIER_DROPPED_RETENTION)).strftime(_TIME_FORMAT)
+        with self.lock, self.connection:
+            dropped = self.connection.execute(
+                "UPDATE frontier SET state = ?, updated_at = ? "
+                "WHERE news_source_name = ? AND state = ? AND total_attempts >= ?",
+                (DROPPED, now.strftime(_TIME_FORMAT), source_name, FAILED, FRONTIER_MAX_TOTAL_ATTEMPTS),
+            ).rowcount
+            cursor = self.connection.execute(
+                "UPDATE frontier SET state = ?, attempts = 0, updated_at = ? "
+                "WHERE news_source_name = ? AND state = ? AND updated_at <= ?",
+                (PENDING, now.strftime(_TIME_FORMAT), source_name, FAILED, cutoff),
+            )
+            purged = self.connection.execute(
+                "DELETE FROM frontier WHERE news_source_name = ? AND state = ? AND updated_at <= ?",
+                (source_name, DROPPED, dropped_cutoff),
+            ).rowcount
+        if dropped or purged:
+            parser_logger.info(f"Crawl frontier {source_name}: {dropped} articles dropped after {FRONTIER_MAX_TOTAL_ATTEMPTS} attempts, {purged} old dropped articles removed")
+        return cursor.rowcount
+
+    def mark_fetched(self, link: str):
+        """Отмечает, что статья загружена этим владельцем и передана на запись."""
+        now = datetime.now().strftime(_TIME_FORMAT)
+        with self.lock, self.connection:
+            self.connection.execute(
+                "UPDATE frontier SET state = ?, owner = ?, updated_at = ? WHERE article_link = ?",
+                (FETCHED, self.owner, now, link),
+            )
+
+    def mark_failed(self, link: str):
+        """Учитывает неудачную попытку извлечения; после FRONTIER_MAX_ATTEMPTS статья помечается как failed."""
+        now = datetime.now().strftime(_TIME_FORMAT)
+        with self.lock, self.connection:
+            self.connection.execute(
+                "UPDATE frontier SET attempts = attempts + 1, total_attempts = total_attempts + 1, updated_at = ?, "
+                "state = CASE WHEN attempts + 1 >= ? THEN ? ELSE ? END WHERE article_link = ?",
+                (now, FRONTIER_MAX_ATTEMPTS, FAILED, PENDING, link),
+            )
+
+    def remove_many(self, links: Iterable[str]):
+        """Удаляет из очереди статьи, записанные в датасет."""
+        with self.lock, self.connection:
+            self.connection.executemany("DELETE FROM frontier WHERE article_link = ?", ((link,) for link in links))
+
+    def get_counts(self) -> Dict[str, int]:
+        """Возвращает число статей в очереди по статусам."""
+        with self.lock:
+            return dict(self.connection.execute("SELECT state, COUNT(*) FROM frontier GROUP BY state"))
+
+    def close(self):
+        self.connection.close()
+
+
+_frontier: Optional[CrawlFrontier] = None
+_frontier_lock = threading.Lock()
+
+def get_frontier() -> CrawlFrontier:
+    """
+    Возвращает очередь обхода, общую для всего процесса.
+
+    Владелец загруженных статей — WORKER_ID, поэтому перезапуск воркера не
+    возвращает в очередь статьи, загруженные другими воркерами.
+
+    Возвращает:
+        CrawlFrontier: Очередь найденных, но еще не записанных статей.
+    """
+    global _frontier
+    with _frontier_lock:
+        if _frontier is None:
+            _frontier = CrawlFrontier(owner=WORKER_ID)
+    return _frontier
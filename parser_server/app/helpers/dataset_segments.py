@@ -0,0 +1,144 @@
+import csv
+import gzip
+import io
+import json
+import os
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterator, List
+from settings.constants import NEWS_COLUMNS, SEGMENT_MAX_BYTES, SEGMENTS_MANIFEST_NAME
+from settings.env_config import SEGMENT_COMPRESSION
+from settings.paths import SEGMENTS_DIR_PATH
+
+SEGMENT_EXTENSIONS = {"gzip": ".csv.gz", "zstd": ".csv.zst"}
+
+# Датасет хранится в виде сжатых CSV сегментов и manifest.json с их описанием.
+# Сегмент дописывается пакетами (каждый пакет — отдельный gzip member или zstd
+# frame) и закрывается, когда его размер достигает SEGMENT_MAX_BYTES. Закрытые
+# сегменты больше не меняются, поэтому потребители могут забирать только новые.
+
+
+@contextmanager
+def _open_segment_writer(path, compression):
+    if compression == "zstd":
+        import zstandard
+
+        with open(path, "ab") as raw, zstandard.ZstdCompressor().stream_writer(raw) as compressed:
+            with io.TextIOWrapper(compressed, encoding="utf-8", newline="") as file:
+                yield file
+    else:
+        with gzip.open(path, "at", encoding="utf-8", newline="") as file:
+            yield file
+
+
+@contextmanager
+def _open_segment_reader(path, compression):
+    if compression == "zstd":
+        import zstandard
+
+        with open(path, "rb") as raw:
+            reader = zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True)
+            with io.TextIOWrapper(reader, encoding="utf-8", newline="") as file:
+                yield file
+    else:
+        with gzip.open(path, "rt", encoding="utf-8", newline="") as file:
+            yield file
+
+
+def read_manifest(segments_dir=SEGMENTS_DIR_PATH) -> Dict:
+    """
+    Читает manifest.json сегментированного датасета.
+
+    Аргументы:
+        segments_dir (Path): Каталог сегментов.
+
+    Возвращает:
+        dict: Манифест со списком сегментов (пустой, если датасета еще нет).
+    """
+    manifest_path = os.path.join(segments_dir, SEGMENTS_MANIFEST_NAME)
+    if not os.path.exists(manifest_path):
+        return {"version": 1, "segments": []}
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write_manifest(manifest: Dict, segments_dir):
+    manifest_path = os.path.join(segments_dir, SEGMENTS_MANIFEST_NAME)
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=4, ensure_ascii=False)
+    os.replace(tmp_path, manifest_path)
+
+
+def _open_segment(manifest: Dict) -> Dict:
+    segments = manifest["segments"]
+    if segments and not segments[-1]["closed"]:
+        return segments[-1]
+
+    number = len(segments) + 1
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    segment = {
+        "name": f"segment-{number:06d}{SEGMENT_EXTENSIONS[SEGMENT_COMPRESSION]}",
+        "compression": SEGMENT_COMPRESSION,
+        "rows": 0,
+        "bytes": 0,
+        "closed": False,
+        "created_at": now,
+        "updated_at": now,
+    }
+    segments.append(segment)
+    return segment
+
+
+def write_news_to_segments(articles: List[Dict[str, str]], segments_dir=SEGMENTS_DIR_PATH):
+    """
+    Дописывает пакет статей в текущий сегмент и при необходимости закрывает его.
+
+    Аргументы:
+        articles (list): Статьи с ключами из NEWS_COLUMNS.
+        segments_dir (Path): Каталог сегментов.
+    """
+    if not articles:
+        return
+
+    os.makedirs(segments_dir, exist_ok=True)
+    manifest = read_manifest(segments_dir)
+    segment = _open_segment(manifest)
+    path = os.path.join(segments_dir, segment["name"])
+    write_header = not os.path.exists(path) or os.path.getsize(path) == 0
+
+    with _open_segment_writer(path, segment["compression"]) as file:
+        writer = csv.writer(file)
+        if write_header:
+            writer.writerow(NEWS_COLUMNS)
+        for article in articles:
+            writer.writerow([article.get(column, "") for column in NEWS_COLUMNS])
+
+    segment["rows"] += len(articles)
+    segment["bytes"] = os.path.getsize(path)
+    segment["updated_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    if segment["bytes"] >= SEGMENT_MAX_BYTES:
+        segment["closed"] = True
+    _write_manifest(manifest, segments_dir)
+
+
+def iter_segment_rows(segments_dir=SEGMENTS_DIR_PATH, start_segment: int = 0) -> Iterator[Dict[str, str]]:
+    """
+    Последовательно читает строки всех сегментов датасета, как один CSV.
+
+    Аргументы:
+        segments_dir (Path): Каталог сегментов.
+        start_segment (int): Индекс первого сегмента в манифесте, с которого читать.
+
+    Возвращает:
+        Iterator[dict]: Строки датасета с ключами из NEWS_COLUMNS.
+    """
+    for segment in read_manifest(segments_dir)["segments"][start_segment:]:
+        path = os.path.join(segments_dir, segment["name"])
+        with _open_segment_reader(path, segment["compression"]) as file:
+            yield from csv.DictReader(file)
+
+
+def get_segments_dataset_size(segments_dir=SEGMENTS_DIR_PATH) -> int:
+    """Возвращает суммарный размер сегментов датасета в байтах."""
+    return sum(segment["bytes"] for segment in read_manifest(segments_dir)["segments"])
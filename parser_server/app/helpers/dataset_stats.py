@@ -0,0 +1,120 @@
+import csv
+import os
+import threading
+from collections import Counter
+from datetime import datetime
+from typing import Dict, List, Optional
+from app.helpers.formats import human_readable_size
+from settings.env_config import DATASET_FORMATS
+from settings.json_setup import read_json_file, write_json_file
+from settings.logger_setup import system_logger
+from settings.paths import DATA_FILE_PATH
+
+
+def _count_csv_rows(data_path):
+    """Считает строки CSV датасета по источникам и по парам (источник, категория)."""
+    rows_by_source = Counter()
+    rows_by_category = Counter()
+    if os.path.exists(data_path):
+        system_logger.debug(f"Building dataset stats from {data_path}")
+        with open(data_path, mode="r", encoding="utf-8", newline="") as file:
+            for row in csv.DictReader(file):
+                source = row.get("news_source_name", "")
+                rows_by_source[source] += 1
+                rows_by_category[(source, row.get("category_name", ""))] += 1
+    return rows_by_source, rows_by_category
+
+
+def _nest(rows_by_category) -> Dict[str, Dict[str, int]]:
+    """Переводит счетчик по парам (источник, категория) в вид для JSON: источник -> категория -> число."""
+    nested = {}
+    for (source, category), count in rows_by_category.items():
+        nested.setdefault(source, {})[category] = count
+    return nested
+
+
+def _is_nested(rows_by_category) -> bool:
+    return all(isinstance(categories, dict) for categories in rows_by_category.values())
+
+
+class DatasetStats:
+    """
+    Счетчики датасета, которые обновляются в памяти и сохраняются в info.json.
+
+    Хранит число строк, размер в байтах, число строк по источникам и по
+    категориям каждого источника (rows_by_category: источник -> категория -> число;
+    одноименные категории разных источников не смешиваются) и включенные форматы
+    датасета (по ним сервер классификации выбирает, что читать).
+    После каждого пакета info.json перезаписывается один раз и атомарно.
+    Если в info.json еще нет счетчиков, они однократно считаются по CSV файлу.
+    """
+
+    def __init__(self, data_path=DATA_FILE_PATH):
+        self.lock = threading.Lock()
+        self.info = read_json_file()
+
+        if "dataset_rows" not in self.info:
+            self._bootstrap_from_csv(data_path)
+        elif not _is_nested(self.info.get("rows_by_category", {})):
+            # Прежний формат: категории без источника; пересчитываем по CSV
+            self.info["rows_by_category"] = _nest(_count_csv_rows(data_path)[1])
+
+        self.rows_by_source = Counter(self.info.get("rows_by_source", {}))
+        self.rows_by_category = Counter({
+            (source, category): count
+            for source, categories in self.info.get("rows_by_category", {}).items()
+            for category, count in categories.items()
+        })
+        self.info["dataset_formats"] = sorted(DATASET_FORMATS)
+
+    def _bootstrap_from_csv(self, data_path):
+        rows_by_source, rows_by_category = _count_csv_rows(data_path)
+
+        self.info["dataset_rows"] = sum(rows_by_source.values())
+        self.info["rows_by_source"] = dict(rows_by_source)
+        self.info["rows_by_category"] = _nest(rows_by_category)
+
+    def record_batch(self, articles: List[Dict[str, str]], dataset_bytes: Optional[int]):
+        """
+        Учитывает записанный пакет статей и сохраняет счетчики.
+
+        Аргументы:
+            articles (list): Статьи, добавленные в датасет.
+            dataset_bytes (int): Текущий размер датасета в байтах, если известен.
+        """
+        with self.lock:
+            for article in articles:
+                self.rows_by_source[article.get("news_source_name", "")] += 1
+                self.rows_by_category[(article.get("news_source_name", ""), article.get("category_name", ""))] += 1
+
+            self.info["dataset_rows"] = self.info.get("dataset_rows", 0) + len(articles)
+            self.info["rows_by_source"] = dict(self.rows_by_source)
+            self.info["rows_by_category"] = _nest(self.rows_by_category)
+            if dataset_bytes is not None:
+                self.info["dataset_bytes"] = dataset_bytes
+                self.info["dataset_size"] = human_readable_size(dataset_bytes)
+            self.info["dataset_last_update"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+            write_json_file(self.info)
+
+    def snapshot(self) -> Dict:
+        """Возвращает копию текущих счетчиков."""
+        with self.lock:
+            return dict(self.info)
+
+
+_dataset_stats: Optional[DatasetStats] = None
+_dataset_stats_lock = threading.Lock()
+
+def get_dataset_stats() -> DatasetStats:
+    """
+    Возвращает счетчики датасета, общие для всего процесса.
+
+    Возвращает:
+        DatasetStats: Счетчики, загруженные из info.json при первом вызове.
+    """
+    global _dataset_stats
+    with _dataset_stats_lock:
+        if _dataset_stats is None:
+            _dataset_stats = DatasetStats()
+    return _dataset_stats
@@ -0,0 +1,141 @@
+import re
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Iterable, List, Optional
+import pytz
+
+# Разбор дат статей без locale: названия месяцев встроены, форматы источников
+# скомпилированы заранее. Регулярные выражения повторяют то, что строит
+# datetime.strptime для форматов, которые раньше использовались с ru_RU.UTF-8,
+# поэтому все строки, которые разбирал прежний parse_time_text, разбираются так
+# же. Дополнительно понимаются формы месяцев, которых нет в таблицах locale, и
+# 29 февраля у rbk (tests/test_date_parser.py).
+
+MOSCOW_TZ = pytz.timezone("Europe/Moscow")
+
+# С 26.10.2014 02:00 у Москвы постоянное смещение +03:00, для более поздних дат
+# часовой пояс pytz не нужен
+_MOSCOW_FIXED_TZ = timezone(timedelta(hours=3))
+_MOSCOW_FIXED_SINCE = datetime(2014, 10, 26, 2, 0)
+
+# Названия месяцев в родительном падеже (%B в ru_RU) и сокращения (%b)
+MONTHS = ("января", "февраля", "марта", "апреля", "мая", "июня", "июля", "августа", "сентября", "октября", "ноября", "декабря")
+MONTHS_SHORT = ("янв", "фев", "мар", "апр", "мая", "июн", "июл", "авг", "сен", "окт", "ноя", "дек")
+# Формы, которые встречаются на сайтах, но отсутствуют в таблицах locale
+MONTH_ALIASES = {
+    "январь": 1, "февраль": 2, "март": 3, "апрель": 4, "май": 5, "июнь": 6, "июль": 7,
+    "август": 8, "сентябрь": 9, "октябрь": 10, "ноябрь": 11, "декабрь": 12,
+    "сент": 9, "нояб": 11,
+}
+
+MONTH_NUMBERS = {
+    **MONTH_ALIASES,
+    **{name: number for number, name in enumerate(MONTHS_SHORT, start=1)},
+    **{name: number for number, name in enumerate(MONTHS, start=1)},
+}
+
+# Те же шаблоны полей, что у datetime.strptime
+_H = r"(?P<H>2[0-3]|[0-1]\d|\d)"
+_M = r"(?P<M>[0-5]\d|\d)"
+_D = r"(?P<d>3[01]|[12]\d|0[1-9]|[1-9]| [1-9])"
+_MON = r"(?P<m>1[0-2]|0[1-9]|[1-9])"
+_Y = r"(?P<Y>\d\d\d\d)"
+_MONTH_NAME = "(?P<B>" + "|".join(sorted(map(re.escape, MONTH_NUMBERS), key=len, reverse=True)) + ")"
+
+SOURCE_PATTERNS = {
+    # 14:35 17.10.2026
+    "ria": re.compile(rf"{_H}:{_M}\s+{_D}\.{_MON}\.{_Y}", re.IGNORECASE),
+    # 14:35, 17 октября 2026
+    "lenta": re.compile(rf"{_H}:{_M},\s+{_D}\s+{_MONTH_NAME}\s+{_Y}", re.IGNORECASE),
+    # 17 октября 2026, 14:35
+    "gazeta": re.compile(rf"{_D}\s+{_MONTH_NAME}\s+{_Y},\s+{_H}:{_M}", re.IGNORECASE),
+    # 17 окт, 14:35
+    "rbk": re.compile(rf"{_D}\s+{_MONTH_NAME},\s+{_H}:{_M}", re.IGNORECASE),
+}
+_RBK_TIME_PATTERN = re.compile(rf"{_H}:{_M}", re.IGNORECASE)
+
+PARSE_CACHE_SIZE = 65536
+
+
+def _match(pattern, time_text):
+    found = pattern.match(time_text)
+    if found is None or found.end() != len(time_text):
+        return None
+    return found.groupdict()
+
+
+def _moscow_isoformat(article_time: datetime) -> str:
+    if article_time >= _MOSCOW_FIXED_SINCE:
+        return article_time.replace(tzinfo=_MOSCOW_FIXED_TZ).isoformat()
+    return MOSCOW_TZ.localize(article_time).isoformat()
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_cached(time_text: str, name: str, today: Optional[tuple]) -> str:
+    if name == "rbk":
+        if len(time_text) == 5 and ":" in time_text:
+            fields = _match(_RBK_TIME_PATTERN, time_text)
+            if fields is None:
+                return time_text
+            year, month, day = today
+        else:
+            fields = _match(SOURCE_PATTERNS["rbk"], time_text)
+            if fields is None:
+                return time_text
+            year, month, day = today[0], MONTH_NUMBERS[fields["B"].lower()], int(fields["d"])
+    elif name in SOURCE_PATTERNS:
+        fields = _match(SOURCE_PATTERNS[name], time_text)
+        if fields is None:
+            return time_text
+        year = int(fields["Y"])
+        month = int(fields["m"]) if "m" in fields else MONTH_NUMBERS[fields["B"].lower()]
+        day = int(fields["d"])
+    else:
+        return time_text
+
+    try:
+        article_time = datetime(year, month, day, int(fields["H"]), int(fields["M"]))
+    except ValueError:
+        return time_text
+    return _moscow_isoformat(article_time)
+
+
+def parse_time_text(time_text, name):
+    """
+    Преобразует строку времени в формат ISO 8601 с учетом часового пояса Москвы.
+
+    Не зависит от системной locale и потокобезопасна; результаты кэшируются,
+    поэтому повторяющиеся строки разбираются за время поиска в словаре.
+
+    Аргументы:
+        time_text (str): Строка с временем статьи.
+        name (str): Название источника, чтобы определить формат строки времени.
+
+    Возвращает:
+        str: Время статьи в формате ISO 8601 с учетом часового пояса Москвы,
+             или оригинальную строку времени в случае ошибки парсинга.
+    """
+    today = None
+    if name == "rbk":
+        # У rbk год (и для "ЧЧ:ММ" — дата) берется из текущего дня, он входит в ключ кэша
+        now = datetime.now(MOSCOW_TZ)
+        today = (now.year, now.month, now.day)
+    return _parse_cached(time_text, name, today)
+
+
+def parse_time_texts(time_texts: Iterable[str], name: str) -> List[str]:
+    """
+    Преобразует несколько строк времени одного источника.
+
+    Аргументы:
+        time_texts (Iterable[str]): Строки с временем статей.
+        name (str): Название источника.
+
+    Возвращает:
+        list: Результаты parse_time_text в том же порядке.
+    """
+    today = None
+    if name == "rbk":
+        now = datetime.now(MOSCOW_TZ)
+        today = (now.year, now.month, now.day)
+    return [_parse_cached(time_text, name, today) for time_text in time_texts]
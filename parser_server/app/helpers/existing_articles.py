@@ -1,24 +1,196 @@
 import os
 import csv
+import sqlite3
+import threading
+from itertools import islice
+from typing import Iterable, Iterator, Optional
+from settings.constants import SEEN_FILTER_ERROR_RATE, SEEN_FILTER_INITIAL_CAPACITY
 from settings.logger_setup import parser_logger
+from settings.paths import DATA_FILE_PATH, INDEX_FILE_PATH, SEEN_FILTER_DIR_PATH
+from app.helpers.bloom_filter import ScalableBloomFilter
+from app.helpers.canonical_url import canonicalize_url
 
-def read_existing_articles(file_path):
+# Сколько ссылок добавляется в индекс за одну транзакцию при построении и миграции
+INDEX_BUILD_CHUNK = 10000
+
+
+def read_existing_articles(file_path) -> Iterator[str]:
     """
-    Читает существующие статьи из CSV файла и возвращает их ссылки в виде множества.
+    Читает ссылки на существующие статьи из CSV файла.
+
+    Ссылки возвращаются по одной в каноническом виде, без сборки множества в памяти.
 
     Аргументы:
         file_path (str): Путь к CSV файлу, содержащему данные об уже существующих статьях.
 
     Возвращает:
-        set: Множество ссылок на статьи, уже существующие в файле.
+        Iterator[str]: Ссылки на статьи, уже существующие в файле.
     """
-    existing_articles = set()
     if os.path.exists(file_path):
         with open(file_path, mode="r", encoding="utf-8", newline="") as file:
             reader = csv.DictReader(file)
             for row in reader:
-                if "article_link" in row:
-                    existing_articles.add(row["article_link"])
+                if row.get("article_link"):
+                    yield canonicalize_url(row["article_link"])
+
+
+def _chunks(items: Iterable[str], size: int = INDEX_BUILD_CHUNK) -> Iterator[list]:
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class ArticlesIndex:
+    """
+    Постоянный индекс ссылок на уже сохраненные статьи.
+
+    Ссылки хранятся в SQLite (только добавление), перед которым стоит
+    масштабируемый фильтр Блума в файлах, отображенных в память. Проверка
+    ссылки, которой нет в индексе (почти все новые ссылки), не обращается к
+    SQLite; положительный ответ фильтра подтверждается точным поиском по
+    первичному ключу. Поэтому память процесса не растет с числом ссылок.
+    Если фильтр не совпадает с SQLite (первый запуск, сбой между записями),
+    он перестраивается при открытии. Если индекс пуст, он однократно
+    заполняется из CSV файла с данными. Доступ потокобезопасен: CSV пишется
+    из пула потоков.
+
+    С read_only=True (воркеры, когда индекс пополняет процесс слияния) индекс
+    только проверяет ссылки точным поиском в SQLite: фильтр Блума в это время
+    может дописывать другой процесс.
+    """
+
+    def __init__(self, index_path=INDEX_FILE_PATH, data_path=DATA_FILE_PATH, filter_path=SEEN_FILTER_DIR_PATH, read_only: bool = False):
+        self.index_path = index_path
+        self.read_only = read_only
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(str(index_path), timeout=30, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS articles (article_link TEXT PRIMARY KEY)"
+        )
+        self.connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        if read_only:
+            self.filter = None
+            parser_logger.debug("Articles index opened read-only")
+            return
+        self.filter = ScalableBloomFilter(filter_path, SEEN_FILTER_INITIAL_CAPACITY, SEEN_FILTER_ERROR_RATE)
+
+        self._canonicalize_links()
+        self.count = self.connection.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+        if len(self.filter) != self.count:
+            self._rebuild_filter()
+
+        if not self.count and os.path.exists(data_path):
+            parser_logger.debug(f"Building articles index from {data_path}")
+            for chunk in _chunks(read_existing_articles(data_path)):
+                self.add_many(chunk)
+
+        parser_logger.debug(
+            f"Articles index loaded: {self.count} links, bloom filter {self.filter.size_bytes() / 1024 / 1024:.1f} MiB"
+        )
+
+    def _canonicalize_links(self):
+        # Ссылки, сохраненные до канонизации, дополняются каноническим видом (однократно)
+        if self.connection.execute("SELECT 1 FROM meta WHERE key = 'canonical_links'").fetchone():
+            return
+        added = 0
+        last_rowid = 0
+        while True:
+            rows = self.connection.execute(
+                "SELECT rowid, article_link FROM articles WHERE rowid > ? ORDER BY rowid LIMIT ?",
+                (last_rowid, INDEX_BUILD_CHUNK),
+            ).fetchall()
+            if not rows:
+                break
+            last_rowid = rows[-1][0]
+            with self.connection:
+                cursor = self.connection.executemany(
+                    "INSERT OR IGNORE INTO articles (article_link) VALUES (?)",
+                    ((canonicalize_url(link),) for _, link in rows),
+                )
+                added += cursor.rowcount
+        with self.connection:
+            self.connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('canonical_links', '1')")
+        if added:
+            parser_logger.info(f"Articles index: added {added} canonical links")
+
+    def _rebuild_filter(self):
+        parser_logger.info(f"Rebuilding articles bloom filter: {len(self.filter)} -> {self.count} links")
+        self.filter.clear()
+        cursor = self.connection.execute("SELECT article_link FROM articles")
+        while True:
+            rows = cursor.fetchmany(INDEX_BUILD_CHUNK)
+            if not rows:
+                break
+            self.filter.add_many(link for (link,) in rows)
+        self.filter.flush()
+
+    def __contains__(self, link):
+        with self.lock:
+            if self.filter is not None and link not in self.filter:
+                return False
+            return self.connection.execute(
+                "SELECT 1 FROM articles WHERE article_link = ?", (link,)
+            ).fetchone() is not None
+
+    def __len__(self):
+        if self.read_only:
+            with self.lock:
+                return self.connection.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+        return self.count
+
+    def add(self, link: str):
+        self.add_many([link])
+
+    def add_many(self, links: Iterable[str]):
+        if self.read_only:
+            raise RuntimeError("Articles index is opened read-only")
+        new_links = list(dict.fromkeys(link for link in links if link not in self))
+        if not new_links:
+            return
+        with self.lock:
+            # Сначала фильтр: при сбое до COMMIT он лишь даст ложные срабатывания
+            # и будет перестроен при следующем открытии
+            self.filter.add_many(new_links)
+            with self.connection:
+                self.connection.executemany(
+                    "INSERT OR IGNORE INTO articles (article_link) VALUES (?)",
+                    ((link,) for link in new_links),
+                )
+            self.count += len(new_links)
+            self.filter.flush()
+
+    def close(self):
+        if self.filter is not None:
+            self.filter.close()
+        self.connection.close()
+
+
+_articles_index: Optional[ArticlesIndex] = None
+_articles_index_lock = threading.Lock()
+
+def get_articles_index() -> ArticlesIndex:
+    """
+    Возвращает индекс ссылок на статьи, общий для всего процесса.
+
+    Индекс открывается (и при необходимости строится из CSV) при первом вызове,
+    последующие вызовы возвращают тот же объект.
+
+    Возвращает:
+        ArticlesIndex: Индекс ссылок на уже сохраненные статьи.
+    """
+    global _articles_index
+    with _articles_index_lock:
+        if _articles_index is None:
+            _articles_index = ArticlesIndex()
+    return _articles_index
+
 
-    # parser_logger.debug(f"ссылок на статьи, уже существующие в файле: {len(existing_articles)}")
-    return existing_articles
\ No newline at end of file
+def set_articles_index(articles_index: ArticlesIndex):
+    """Заменяет общий индекс ссылок (например, на открытый только для чтения)."""
+    global _articles_index
+    with _articles_index_lock:
+        _articles_index = articles_index
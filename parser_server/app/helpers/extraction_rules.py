@@ -0,0 +1,388 @@
+import re
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+import yaml
+from settings.paths import SCRAPPER_RULES_DIR_PATH
+from app.helpers.canonical_url import canonicalize_url
+from app.helpers.date_parser import SOURCE_PATTERNS, parse_time_text
+from app.helpers.html_parser import make_soup, strip_elements
+
+# Правила извлечения данных источников. Каждый источник описывается файлом
+# app/news_scrappers/rules/<источник>.yaml: селекторы категорий, ссылок на
+# статьи и полей статьи, вырезаемые блоки, формат даты и стоп-лист категорий.
+# При загрузке правила компилируются: селекторы разбираются в шаги, наборы
+# классов и стоп-листы становятся frozenset, поэтому разбор страницы — это
+# только обход дерева, общий для всех источников.
+#
+# Селектор — список шагов, каждый шаг ищет элементы внутри найденных на
+# предыдущем шаге. Шаг записывается как "тег.класс:модификатор...": класс
+# необязателен и сравнивается так же, как class_ в BeautifulSoup (один класс
+# или весь атрибут class целиком). Модификаторы:
+#   :first      — только первый найденный элемент;
+#   :nth(N)     — только N-й элемент (с нуля);
+#   :child      — только прямые потомки;
+#   :next       — первый такой элемент после текущего в документе (find_next);
+#   :text(...)  — только элементы с таким текстом;
+#   :skip-lead  — без первого элемента, если найдено несколько (главный блок страницы).
+
+_STEP_PATTERN = re.compile(r"^(?P<name>[a-z][a-z0-9]*)(?:\.(?P<class_>[^:.][^:]*))?(?P<modifiers>(?::[a-z-]+(?:\([^)]*\))?)*)$")
+_MODIFIER_PATTERN = re.compile(r":(?P<name>[a-z-]+)(?:\((?P<argument>[^)]*)\))?")
+_MODIFIERS = frozenset({"first", "nth", "child", "next", "text", "skip-lead"})
+
+RULES_FILE_SUFFIX = ".yaml"
+
+
+class Step:
+    """Один скомпилированный шаг селектора."""
+
+    __slots__ = ("name", "class_", "filters", "first", "nth", "recursive", "next", "text", "skip_lead")
+
+    def __init__(self, step: str):
+        match = _STEP_PATTERN.match(step.strip())
+        if match is None:
+            raise ValueError(f"Invalid selector step: {step!r}")
+        self.name = match.group("name")
+        self.class_ = match.group("class_")
+        # class_=None в BeautifulSoup означает "без атрибута class", поэтому без класса фильтр не передается
+        self.filters = {"class_": self.class_} if self.class_ is not None else {}
+        self.first = False
+        self.nth = None
+        self.recursive = True
+        self.next = False
+        self.text = None
+        self.skip_lead = False
+        for modifier in _MODIFIER_PATTERN.finditer(match.group("modifiers")):
+            name, argument = modifier.group("name"), modifier.group("argument")
+            if name not in _MODIFIERS:
+                raise ValueError(f"Unknown selector modifier :{name} in {step!r}")
+            if name == "first":
+                self.first = True
+            elif name == "nth":
+                self.nth = int(argument)
+            elif name == "child":
+                self.recursive = False
+            elif name == "next":
+                self.next = True
+            elif name == "text":
+                self.text = argument
+            else:
+                self.skip_lead = True
+
+    def apply(self, node) -> list:
+        if self.next:
+            found = node.find_next(self.name, **self.filters)
+            matches = [found] if found is not None else []
+        elif self.first and self.text is None and self.recursive:
+            found = node.find(self.name, **self.filters)
+            return [found] if found is not None else []
+        else:
+            matches = node.find_all(self.name, recursive=self.recursive, **self.filters)
+        if self.text is not None:
+            matches = [match for match in matches if match.get_text(strip=True) == self.text]
+        if self.skip_lead and len(matches) > 1:
+            matches = matches[1:]
+        if self.nth is not None:
+            matches = matches[self.nth:self.nth + 1]
+        if self.first:
+            matches = matches[:1]
+        return matches
+
+
+def compile_selector(steps) -> tuple:
+    """
+    Компилирует селектор из правил.
+
+    Аргументы:
+        steps (str | list): Шаг или список шагов.
+
+    Возвращает:
+        tuple: Шаги Step.
+    """
+    if isinstance(steps, str):
+        steps = [steps]
+    if not steps:
+        raise ValueError("Empty selector")
+    return tuple(Step(step) for step in steps)
+
+
+def select(root, selector: tuple) -> list:
+    """Возвращает элементы, найденные селектором от root, в порядке документа."""
+    nodes = [root]
+    for step in selector:
+        found = []
+        for node in nodes:
+            found.extend(step.apply(node))
+        nodes = found
+        if not nodes:
+            break
+    return nodes
+
+
+def _tag_class_pairs(entries, require_class: bool) -> tuple:
+    pairs = []
+    for entry in entries or ():
+        step = Step(entry)
+        if require_class and step.class_ is None:
+            raise ValueError(f"Exclusion needs a class: {entry!r}")
+        pairs.append((step.name, step.class_))
+    return tuple(pairs)
+
+
+class LinkRule:
+    """Скомпилированное правило поиска ссылок (категорий или статей) на странице."""
+
+    __slots__ = ("selector", "skip_classes", "rewrite", "drop_first_segment", "base", "with_title")
+
+    def __init__(self, rule: dict, source_url: str):
+        self.selector = compile_selector(rule["select"])
+        self.skip_classes = frozenset(rule.get("skip_classes", ()))
+        self.rewrite = dict(rule.get("rewrite", {}))
+        self.drop_first_segment = bool(rule.get("drop_first_segment", False))
+        base = rule.get("base", "page")
+        if base not in ("page", "source"):
+            raise ValueError(f"Link base must be 'page' or 'source', got {base!r}")
+        self.base = source_url if base == "source" else None
+        self.with_title = bool(rule.get("title", False))
+
+    def resolve(self, href: str, page_url: str) -> str:
+        href = self.rewrite.get(href, href)
+        if self.drop_first_segment and href.startswith("/"):
+            # "/раздел/путь" -> "/путь": путь относительно страницы раздела
+            parts = href.split("/", 2)
+            href = "/" + parts[2] if len(parts) > 2 else "/"
+        if href.startswith("https"):
+            return canonicalize_url(href)
+        base = self.base or page_url
+        return canonicalize_url(base.rstrip("/") + "/" + href.lstrip("/"))
+
+    def iter_links(self, root, page_url: str):
+        """Возвращает пары (элемент ссылки, каноническая ссылка) в порядке документа."""
+        for node in select(root, self.selector):
+            if self.skip_classes and not self.skip_classes.isdisjoint(node.get("class", ())):
+                continue
+            href = node.get("href")
+            if href is None:
+                continue
+            yield node, self.resolve(href, page_url)
+
+
+class FieldRule:
+    """Скомпилированное правило поля статьи (заголовка или даты)."""
+
+    __slots__ = ("name", "alternatives", "attribute", "separator", "date_format", "required")
+
+    def __init__(self, name: str, rule: dict):
+        self.name = name
+        selectors = rule["select"]
+        if isinstance(selectors, str) or (selectors and isinstance(selectors[0], str)):
+            selectors = [selectors]
+        self.alternatives = tuple(compile_selector(selector) for selector in selectors)
+        self.attribute = rule.get("attribute")
+        self.separator = rule.get("separator", "")
+        self.date_format = rule.get("format")
+        if self.date_format is not None and self.date_format not in SOURCE_PATTERNS:
+            raise ValueError(f"Unknown date format {self.date_format!r}, expected one of {sorted(SOURCE_PATTERNS)}")
+        self.required = bool(rule.get("required", True))
+
+    def extract(self, root) -> Optional[str]:
+        # Значение берется из первой альтернативы, которая нашла элемент
+        for selector in self.alternatives:
+            nodes = select(root, selector)
+            if not nodes:
+                continue
+            if self.attribute is not None:
+                value = nodes[0].get(self.attribute)
+                if value is None:
+                    continue
+            else:
+                value = nodes[0].get_text(separator=self.separator, strip=True)
+            if self.date_format is not None:
+                value = parse_time_text(value, self.date_format)
+            return value
+        if self.required:
+            raise ValueError(f"Article {self.name} not found")
+        return None
+
+
+class SourceRules:
+    """
+    Скомпилированные правила извлечения одного источника.
+
+    Аргументы:
+        rules (dict): Содержимое файла правил.
+    """
+
+    def __init__(self, rules: dict):
+        self.name = rules["name"]
+        self.scrapper_name = rules.get("scrapper_name", self.name)
+        self.url = rules["url"]
+
+        categories = rules["categories"]
+        self.categories_parse_only = _tag_class_pairs(categories.get("parse_only"), require_class=False)
+        self.category_links = tuple(LinkRule(rule, self.url) for rule in categories["links"])
+        self.stop_categories = frozenset(categories.get("stop", ()))
+
+        articles = rules["articles"]
+        self.articles_parse_only = _tag_class_pairs(articles.get("parse_only"), require_class=False)
+        self.article_links = tuple(LinkRule(rule, self.url) for rule in articles["links"])
+
+        article = rules["article"]
+        self.article_parse_only = _tag_class_pairs(article.get("parse_only"), require_class=False)
+        self.article_container = compile_selector(article["container"]) if article.get("container") else None
+        self.title = FieldRule("title", article["title"]) if article.get("title") else None
+        self.date = FieldRule("date", article["date"]) if article.get("date") else None
+        text = article.get("text", {})
+        self.text_parts = tuple(compile_selector(selector) for selector in text.get("parts", ()))
+        self.text_skip_attributes = {
+            attribute: frozenset(values) for attribute, values in text.get("skip_attributes", {}).items()
+        }
+        self.text_required = bool(text.get("required", False))
+        self.exclusions = frozenset(_tag_class_pairs(article.get("exclusions"), require_class=True))
+
+    def extract_categories(self, html: str, url: str) -> List[Dict[str, str]]:
+        soup = make_soup(html, parse_only=self.categories_parse_only)
+        categories = []
+        for rule in self.category_links:
+            for node, link in rule.iter_links(soup, url):
+                name = node.get_text(strip=True)
+                if name in self.stop_categories:
+                    continue
+                categories.append({"name": name, "link": link})
+        return categories
+
+    def extract_articles_in_category(self, html: str, url: str) -> List[Dict[str, str]]:
+        soup = make_soup(html, parse_only=self.articles_parse_only)
+        articles = []
+        for rule in self.article_links:
+            for node, link in rule.iter_links(soup, url):
+                article = {"link": link}
+                if rule.with_title:
+                    article["title"] = node.get_text(strip=True)
+                articles.append(article)
+        return articles
+
+    def extract_article(self, html: str, url: str) -> Dict[str, str]:
+        root = make_soup(html, parse_only=self.article_parse_only)
+        if self.article_container is not None:
+            containers = select(root, self.article_container)
+            if not containers:
+                return {}
+            root = containers[0]
+
+        article = {}
+        # Дата и заголовок извлекаются до текста: вырезание блоков меняет дерево
+        for field in (self.date, self.title):
+            if field is not None:
+                value = field.extract(root)
+                if value is not None:
+                    article[field.name] = value
+        if self.text_parts:
+            article["text"] = self._extract_text(root)
+        return article
+
+    def _extract_text(self, root) -> str:
+        all_text = []
+        found = False
+        for selector in self.text_parts:
+            for node in select(root, selector):
+                if any(node.get(attribute) in values for attribute, values in self.text_skip_attributes.items()):
+                    continue
+                found = True
+                if self.exclusions:
+                    strip_elements(node, self.exclusions)
+                all_text.append(node.get_text(separator=" ", strip=True))
+        if not found and self.text_required:
+            raise ValueError("Article text not found")
+        return " ".join(all_text)
+
+
+def load_rules_file(path) -> SourceRules:
+    """
+    Читает и компилирует файл правил источника.
+
+    Аргументы:
+        path (Path): YAML файл правил.
+
+    Возвращает:
+        SourceRules: Скомпилированные правила.
+
+    Исключения:
+        ValueError: Если в правилах нет обязательного раздела или селектор некорректен.
+    """
+    with open(path, encoding="utf-8") as file:
+        rules = yaml.safe_load(file)
+    try:
+        return SourceRules(rules)
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid scrapper rules {path}: {type(e).__name__}: {e}") from e
+
+
+def load_source_rules(rules_dir=SCRAPPER_RULES_DIR_PATH) -> Dict[str, SourceRules]:
+    """
+    Загружает правила всех источников из каталога (по файлу на источник).
+
+    Аргументы:
+        rules_dir (Path): Каталог с файлами *.yaml.
+
+    Возвращает:
+        dict: Название источника -> SourceRules, в порядке имен файлов.
+    """
+    source_rules = {}
+    for path in sorted(Path(rules_dir).glob(f"*{RULES_FILE_SUFFIX}")):
+        rules = load_rules_file(path)
+        if rules.name in source_rules:
+            raise ValueError(f"Duplicate scrapper rules for source {rules.name!r} in {path}")
+        source_rules[rules.name] = rules
+    return source_rules
+
+
+_source_rules: Optional[Dict[str, SourceRules]] = None
+_source_rules_lock = threading.Lock()
+
+def get_source_rules() -> Dict[str, SourceRules]:
+    """
+    Возвращает скомпилированные правила всех источников, общие для процесса.
+
+    Правила загружаются при первом вызове (в основном процессе — при запуске,
+    в процессах разбора — при первой задаче), дальше используется тот же объект.
+
+    Возвращает:
+        dict: Название источника -> SourceRules.
+    """
+    global _source_rules
+    with _source_rules_lock:
+        if _source_rules is None:
+            _source_rules = load_source_rules()
+    return _source_rules
+
+
+def get_rules(source: str) -> SourceRules:
+    """
+    Возвращает правила одного источника.
+
+    Исключения:
+        ValueError: Если правил для источника нет.
+    """
+    source_rules = get_source_rules()
+    if source not in source_rules:
+        raise ValueError(f"No scrapper rules for source {source!r}; expected one of {sorted(source_rules)}")
+    return source_rules[source]
+
+
+# Функции уровня модуля для run_parse: в пул процессов передается название
+# источника и HTML, правила компилируются в процессе разбора один раз
+
+def extract_categories(source: str, html: str, url: str) -> List[Dict[str, str]]:
+    """Извлекает категории с главной страницы источника: [{"name", "link"}]."""
+    return get_rules(source).extract_categories(html, url)
+
+
+def extract_articles_in_category(source: str, html: str, url: str) -> List[Dict[str, str]]:
+    """Извлекает ссылки на статьи со страницы категории: [{"link"[, "title"]}]."""
+    return get_rules(source).extract_articles_in_category(html, url)
+
+
+def extract_article(source: str, html: str, url: str) -> Dict[str, str]:
+    """Извлекает поля статьи: {"date", "title", "text"} (есть только найденные поля)."""
+    return get_rules(source).extract_article(html, url)
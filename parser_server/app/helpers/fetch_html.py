@@ -1,45 +1,374 @@
+import asyncio
+import hashlib
+import random
+import time
+from urllib.parse import urlsplit
+from aiohttp import ClientConnectionError, ClientPayloadError, ClientResponseError
+from settings.constants import (
+    CIRCUIT_BREAKER_COOLDOWN,
+    CIRCUIT_BREAKER_THRESHOLD,
+    FETCH_BACKOFF_BASE,
+    FETCH_BACKOFF_MAX,
+    FETCH_MAX_RETRIES,
+    HOST_CONCURRENCY_LIMIT,
+    HOST_RATE_BURST,
+    HOST_RATE_LIMIT,
+)
+from settings.logger_setup import parser_logger
+from app.helpers.extraction_rules import get_source_rules
+from app.helpers.metrics import (
+    CIRCUIT_OPEN,
+    DOWNLOADED_BYTES,
+    FETCH_DURATION,
+    FETCH_ERRORS,
+    FETCH_RESPONSES,
+    FETCH_RETRIES,
+    RESPONSE_BODY_BYTES,
+)
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+DEFAULT_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept-Encoding": "gzip, deflate, br",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Connection": "keep-alive",
+}
+
+# Заголовки по умолчанию для источников, которым нужен особый набор
+SOURCE_HEADERS = {
+    "lenta.ru": {"Host": "lenta.ru"},
+    "www.gazeta.ru": {"User-Agent": USER_AGENT},
+}
+
+# Ошибки, после которых запрос имеет смысл повторить
+RETRYABLE_ERRORS = (asyncio.TimeoutError, ClientConnectionError, ClientPayloadError)
+
+_host_semaphores = {}
+_host_rate_limiters = {}
+_host_breakers = {}
+_host_sources = {}
+
+# Валидаторы (ETag, Last-Modified) и хэш содержимого страниц категорий по URL
+_listing_validators = {}
+
+
+class FetchError(Exception):
+    """Ошибка загрузки страницы, не связанная с HTTP статусом ответа."""
+
+
+class CircuitOpenError(FetchError):
+    """Хост временно пропускается: circuit breaker разомкнут."""
+
+
+class TokenBucket:
+    """
+    Ограничитель частоты запросов: rate токенов в секунду, не больше capacity подряд.
+    """
+
+    def __init__(self, rate: float = HOST_RATE_LIMIT, capacity: float = HOST_RATE_BURST):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    async def acquire(self):
+        """Ждет, пока в корзине появится токен, и забирает его."""
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker хоста.
+
+    После threshold неудачных запросов подряд хост пропускается на cooldown секунд.
+    Если первый запрос после паузы снова неудачен, пауза начинается заново;
+    любой успешный запрос сбрасывает счетчик.
+    """
+
+    def __init__(self, host: str, threshold: int = CIRCUIT_BREAKER_THRESHOLD, cooldown: float = CIRCUIT_BREAKER_COOLDOWN):
+        self.host = host
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_until = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        return time.monotonic() < self.opened_until
+
+    def record_success(self):
+        self.failures = 0
+
+    def record_failure(self):
+        self.failures += 1
+        if self.failures >= self.threshold and not self.is_open:
+            self.opened_until = time.monotonic() + self.cooldown
+            parser_logger.warning(
+                f"Circuit opened for {self.host} after {self.failures} failures, "
+                f"skipping it for {self.cooldown} seconds"
+            )
+
+
+# Метрики читаются в пуле потоков, поэтому словарь копируется перед обходом
+CIRCUIT_OPEN.set_function(lambda: {host: int(breaker.is_open) for host, breaker in list(_host_breakers.items())})
+
+
+def get_source_headers(url):
+    """
+    Возвращает заголовки запроса для источника, которому принадлежит URL.
+
+    Аргументы:
+        url (str): URL, для которого нужны заголовки.
+
+    Возвращает:
+        dict: Заголовки источника или заголовки по умолчанию.
+    """
+    return SOURCE_HEADERS.get(urlsplit(url).netloc, DEFAULT_HEADERS)
+
+
+def get_host_source(host):
+    """
+    Возвращает имя источника, которому принадлежит хост, для меток метрик.
+
+    Хост относится к источнику, если совпадает с доменом url из его правил
+    (без "www.") или является поддоменом этого домена.
+
+    Аргументы:
+        host (str): Хост запроса (netloc URL).
+
+    Возвращает:
+        str: Имя скраппера источника (scrapper_name) или "other".
+    """
+    if host not in _host_sources:
+        hostname = host.split(":", 1)[0].lower()
+        source = "other"
+        for rules in get_source_rules().values():
+            domain = urlsplit(rules.url).hostname.removeprefix("www.")
+            if hostname == domain or hostname.endswith("." + domain):
+                source = rules.scrapper_name
+                break
+        _host_sources[host] = source
+    return _host_sources[host]
+
+
+def _wire_size(response, body):
+    """
+    Возвращает размер тела ответа в сети или None, если он неизвестен.
+
+    aiohttp распаковывает тело до того, как оно становится доступно, поэтому
+    размер в сети берется из Content-Length. Без него он известен только для
+    ответов без сжатия, у которых он совпадает с длиной тела.
+    """
+    if not body:
+        return 0
+    if response.content_length is not None:
+        return response.content_length
+    if response.headers.get("Content-Encoding", "identity").lower() == "identity":
+        return len(body)
+    return None
+
+
+def get_host_semaphore(url):
+    """
+    Возвращает семафор, ограничивающий число одновременных запросов к хосту URL.
+
+    Аргументы:
+        url (str): URL, для хоста которого нужен семафор.
+
+    Возвращает:
+        asyncio.Semaphore: Семафор, общий для всех запросов к этому хосту.
+    """
+    host = urlsplit(url).netloc
+    if host not in _host_semaphores:
+        _host_semaphores[host] = asyncio.Semaphore(HOST_CONCURRENCY_LIMIT)
+    return _host_semaphores[host]
+
+
+def get_host_rate_limiter(url):
+    """Возвращает token bucket, общий для всех запросов к хосту URL."""
+    host = urlsplit(url).netloc
+    if host not in _host_rate_limiters:
+        _host_rate_limiters[host] = TokenBucket()
+    return _host_rate_limiters[host]
+
+
+def get_host_breaker(url):
+    """Возвращает circuit breaker хоста URL."""
+    host = urlsplit(url).netloc
+    if host not in _host_breakers:
+        _host_breakers[host] = CircuitBreaker(host)
+    return _host_breakers[host]
+
+
+def _is_retryable(error):
+    if isinstance(error, ClientResponseError):
+        return error.status == 429 or error.status >= 500
+    return isinstance(error, RETRYABLE_ERRORS)
+
+
+def is_transient_fetch_error(error) -> bool:
+    """
+    Проверяет, что загрузка не удалась по временной причине.
+
+    Временные — разомкнутый circuit breaker хоста, таймауты, ошибки соединения,
+    ответы 429 и 5xx. Такие ошибки не говорят ничего о самой странице, и
+    попытка загрузки статьи из очереди обхода для них не засчитывается.
+    """
+    return isinstance(error, CircuitOpenError) or _is_retryable(error)
+
+
+def _backoff_delay(attempt, error):
+    delay = min(FETCH_BACKOFF_MAX, FETCH_BACKOFF_BASE * 2 ** attempt)
+    delay = random.uniform(delay / 2, delay)
+    if isinstance(error, ClientResponseError) and error.headers:
+        retry_after = error.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            delay = max(delay, min(FETCH_BACKOFF_MAX, int(retry_after)))
+    return delay
+
+
+async def _fetch(session, url, headers, read_response):
+    """
+    Выполняет GET запрос с ограничением частоты, повторами и circuit breaker.
+
+    Аргументы:
+        session (aiohttp.ClientSession): Сессия для выполнения HTTP запросов.
+        url (str): URL запроса.
+        headers (dict): Заголовки запроса.
+        read_response: Корутина-функция, которая получает ответ и возвращает результат.
+
+    Возвращает:
+        Результат read_response.
+
+    Исключения:
+        CircuitOpenError: Если хост временно пропускается.
+        aiohttp.ClientResponseError, asyncio.TimeoutError и др.: Последняя ошибка,
+            если запрос не удался и после всех повторов.
+    """
+    breaker = get_host_breaker(url)
+    host = breaker.host
+    source = get_host_source(host)
+    for attempt in range(FETCH_MAX_RETRIES + 1):
+        if breaker.is_open:
+            raise CircuitOpenError(f"Circuit open for {host}")
+
+        await get_host_rate_limiter(url).acquire()
+        try:
+            async with get_host_semaphore(url):
+                started = time.perf_counter()
+                try:
+                    async with session.get(url, headers=headers) as response:
+                        FETCH_RESPONSES.inc(source=source, host=host, status=response.status)
+                        if response.status == 429 or response.status >= 500:
+                            response.raise_for_status()
+                        result = await read_response(response)
+                        # Тело уже прочитано read_response, read() возвращает его из ответа
+                        body = await response.read()
+                        RESPONSE_BODY_BYTES.inc(len(body), source=source, host=host)
+                        wire_size = _wire_size(response, body)
+                        if wire_size is not None:
+                            DOWNLOADED_BYTES.inc(wire_size, source=source, host=host)
+                finally:
+                    FETCH_DURATION.observe(time.perf_counter() - started, source=source, host=host)
+        except Exception as e:
+            if not isinstance(e, ClientResponseError):
+                FETCH_ERRORS.inc(source=source, host=host, error=type(e).__name__)
+            if not _is_retryable(e):
+                raise
+            breaker.record_failure()
+            if attempt == FETCH_MAX_RETRIES:
+                raise
+            FETCH_RETRIES.inc(source=source, host=host)
+            delay = _backoff_delay(attempt, e)
+            parser_logger.debug(f"Retrying {url} in {delay:.1f}s after error: {e} ({attempt + 1}/{FETCH_MAX_RETRIES})")
+            await asyncio.sleep(delay)
+        else:
+            breaker.record_success()
+            return result
+
+
+async def _read_html(response):
+    if response.status != 200:
+        response.raise_for_status()
+        raise FetchError(f"Unexpected status {response.status} for {response.url}")
+    return await response.text()
+
+
 async def async_fetch_html(session, url):
     """
     Асинхронно загружает HTML контент по указанному URL с использованием заданной сессии.
 
+    Число одновременных запросов к одному хосту ограничено HOST_CONCURRENCY_LIMIT,
+    частота — token bucket (HOST_RATE_LIMIT). Ответы 429/5xx и таймауты повторяются
+    до FETCH_MAX_RETRIES раз с экспоненциальной задержкой. Хост, который раз за разом
+    не отвечает, пропускается на CIRCUIT_BREAKER_COOLDOWN секунд.
+
     Аргументы:
         session (aiohttp.ClientSession): Сессия для выполнения HTTP запросов.
         url (str): URL, по которому нужно выполнить запрос.
 
     Возвращает:
-        str: HTML контент страницы, если запрос успешен.
-        None: Если произошла ошибка при выполнении запроса или статус ответа не равен 200.
+        str: HTML контент страницы.
 
     Исключения:
-        Если возникает ошибка при выполнении запроса, она выводится на печать.
-    """
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-        "Accept-Encoding": "gzip, deflate, br",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-        "Connection": "keep-alive",
-    }
-
-    try:
-        if "https://lenta.ru/" in url:
-            async with session.get(url, headers={"Host": "lenta.ru"}) as response:
-                if response.status == 200:
-                    return await response.text()
-                else:
-                    response.raise_for_status()
-        elif "https://www.gazeta.ru/" in url:
-            async with session.get(url, headers={
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-            }) as response:
-                if response.status == 200:
-                    return await response.text()
-                else:
-                    response.raise_for_status()
-        else:
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    return await response.text()
-                else:
-                    response.raise_for_status()
-    except Exception as e:
-        return e
+        CircuitOpenError: Если хост временно пропускается.
+        Exception: Ошибка запроса или статус ответа, отличный от 200.
+    """
+    return await _fetch(session, url, get_source_headers(url), _read_html)
+
+
+async def async_fetch_listing_html(session, url):
+    """
+    Загружает страницу категории, пропуская ее, если она не изменилась с прошлого запроса.
+
+    Для каждого URL запоминаются ETag, Last-Modified и хэш содержимого. Запрос
+    отправляется с заголовками If-None-Match / If-Modified-Since; ответ 304 или
+    совпадение хэша означают, что страница не изменилась. Ограничения частоты,
+    повторы и circuit breaker — как в async_fetch_html.
+
+    Аргументы:
+        session (aiohttp.ClientSession): Сессия для выполнения HTTP запросов.
+        url (str): URL страницы категории.
+
+    Возвращает:
+        str: HTML контент страницы, если она изменилась.
+        None: Если страница не изменилась с прошлого запроса.
+
+    Исключения:
+        CircuitOpenError: Если хост временно пропускается.
+        Exception: Ошибка запроса или статус ответа, отличный от 200 и 304.
+    """
+    cached = _listing_validators.get(url, {})
+    headers = dict(get_source_headers(url))
+    if cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
+
+    async def read_listing(response):
+        if response.status == 304:
+            return None
+        if response.status != 200:
+            response.raise_for_status()
+            raise FetchError(f"Unexpected status {response.status} for {url}")
+
+        body = await response.read()
+        content_hash = hashlib.sha1(body).hexdigest()
+        _listing_validators[url] = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "hash": content_hash,
+        }
+        if cached.get("hash") == content_hash:
+            return None
+        return await response.text()
+
+    return await _fetch(session, url, headers, read_listing)
@@ -0,0 +1,175 @@
+import asyncio
+import gzip
+import hashlib
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+from settings.constants import HTML_ARCHIVE_INDEX_NAME
+from settings.env_config import HTML_ARCHIVE_ENABLED
+from settings.logger_setup import parser_logger
+from settings.paths import HTML_ARCHIVE_DIR_PATH
+
+
+class HtmlArchive:
+    """
+    Архив HTML загруженных статей.
+
+    Содержимое хранится в сжатых gzip файлах objects/<xx>/<sha256>.html.gz, имя
+    файла — хэш HTML, поэтому одинаковые страницы хранятся один раз. В SQLite
+    индексе каждая загрузка описывается URL, временем загрузки, источником,
+    категорией и хэшем содержимого — этого достаточно, чтобы заново собрать
+    строку датасета без обращения к сайту.
+    """
+
+    def __init__(self, archive_dir=HTML_ARCHIVE_DIR_PATH):
+        self.archive_dir = Path(archive_dir)
+        self.objects_dir = self.archive_dir / "objects"
+        os.makedirs(self.objects_dir, exist_ok=True)
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(str(self.archive_dir / HTML_ARCHIVE_INDEX_NAME), check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pages (
+                article_link TEXT NOT NULL,
+                fetched_at TEXT NOT NULL,
+                news_source_name TEXT NOT NULL,
+                category_name TEXT,
+                category_link TEXT,
+                article_title TEXT,
+                content_hash TEXT NOT NULL,
+                PRIMARY KEY (article_link, fetched_at)
+            )
+            """
+        )
+        self.connection.execute("CREATE INDEX IF NOT EXISTS pages_source ON pages (news_source_name, fetched_at)")
+
+    def object_path(self, content_hash: str) -> Path:
+        """Возвращает путь к сжатому HTML с данным хэшем."""
+        return self.objects_dir / content_hash[:2] / f"{content_hash}.html.gz"
+
+    def add(self, source_name: str, url: str, html: str, category: Optional[Dict[str, str]] = None, title: Optional[str] = None) -> str:
+        """
+        Сохраняет HTML статьи в архив.
+
+        Аргументы:
+            source_name (str): Название источника.
+            url (str): Ссылка на статью.
+            html (str): HTML контент страницы.
+            category (dict): Категория с ключами "name" и "link", если известна.
+            title (str): Заголовок статьи из списка категории, если известен.
+
+        Возвращает:
+            str: Хэш содержимого (sha256).
+        """
+        body = html.encode("utf-8")
+        content_hash = hashlib.sha256(body).hexdigest()
+        path = self.object_path(content_hash)
+        if not path.exists():
+            os.makedirs(path.parent, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(gzip.compress(body, compresslevel=6))
+            os.replace(tmp_path, path)
+
+        category = category or {}
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO pages "
+                "(article_link, fetched_at, news_source_name, category_name, category_link, article_title, content_hash) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    url,
+                    datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f"),
+                    source_name,
+                    category.get("name"),
+                    category.get("link"),
+                    title,
+                    content_hash,
+                ),
+            )
+        return content_hash
+
+    def read(self, content_hash: str) -> str:
+        """Возвращает HTML по хэшу содержимого."""
+        return self.read_object(self.object_path(content_hash))
+
+    @staticmethod
+    def read_object(path) -> str:
+        """Читает и распаковывает HTML из файла архива."""
+        with open(path, "rb") as f:
+            return gzip.decompress(f.read()).decode("utf-8")
+
+    def iter_latest(self, source_name: Optional[str] = None, since: Optional[str] = None) -> Iterator[Dict[str, str]]:
+        """
+        Перебирает последнюю загрузку каждой статьи архива.
+
+        Аргументы:
+            source_name (str): Только статьи этого источника; None — все.
+            since (str): Только загрузки не раньше этой даты (YYYY-MM-DD[ HH:MM:SS]).
+
+        Возвращает:
+            Iterator[dict]: Записи индекса с ключами article_link, fetched_at,
+                news_source_name, category_name, category_link, article_title, content_hash.
+        """
+        query = (
+            "SELECT article_link, MAX(fetched_at) AS fetched_at, news_source_name, category_name, "
+            "category_link, article_title, content_hash FROM pages WHERE 1 = 1"
+        )
+        params = []
+        if source_name is not None:
+            query += " AND news_source_name = ?"
+            params.append(source_name)
+        if since is not None:
+            query += " AND fetched_at >= ?"
+            params.append(since)
+        query += " GROUP BY article_link ORDER BY fetched_at"
+
+        with self.lock:
+            cursor = self.connection.execute(query, params)
+            columns = [column[0] for column in cursor.description]
+            rows = cursor.fetchall()
+        for row in rows:
+            yield dict(zip(columns, row))
+
+    def close(self):
+        self.connection.close()
+
+
+_archive: Optional[HtmlArchive] = None
+_archive_lock = threading.Lock()
+
+def get_html_archive() -> HtmlArchive:
+    """Возвращает архив HTML, общий для всего процесса."""
+    global _archive
+    with _archive_lock:
+        if _archive is None:
+            _archive = HtmlArchive()
+    return _archive
+
+
+async def archive_article_html(source_name: str, url: str, html: str, category: Optional[Dict[str, str]] = None, element: Optional[Dict[str, str]] = None):
+    """
+    Сохраняет HTML статьи в архив в пуле потоков, если архив включен (HTML_ARCHIVE).
+
+    Ошибки записи только логируются и не мешают разбору статьи.
+
+    Аргументы:
+        source_name (str): Название источника.
+        url (str): Ссылка на статью.
+        html (str): HTML контент страницы.
+        category (dict): Категория статьи.
+        element (dict): Статья из списка категории (ключи "link" и, возможно, "title").
+    """
+    if not HTML_ARCHIVE_ENABLED:
+        return
+    title = (element or {}).get("title")
+    try:
+        await asyncio.get_running_loop().run_in_executor(
+            None, get_html_archive().add, source_name, url, html, category, title
+        )
+    except Exception as e:
+        parser_logger.error(f"Error archiving HTML of {url}: {e}", exc_info=False)
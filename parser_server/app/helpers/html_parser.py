@@ -0,0 +1,239 @@
+from functools import lru_cache
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.element import Tag
+from settings.env_config import PARSER_BACKEND
+
+PARSER_BACKENDS = ("lxml", "html.parser", "selectolax")
+
+# Теги, текст которых BeautifulSoup не включает в get_text()
+_SKIP_TEXT_TAGS = frozenset({"script", "style", "template", "-comment"})
+
+_parser_backend = PARSER_BACKEND
+
+
+def get_parser_backend() -> str:
+    """Возвращает имя текущего движка разбора HTML."""
+    return _parser_backend
+
+
+def set_parser_backend(name: str):
+    """
+    Выбирает движок разбора HTML для всех скрапперов.
+
+    Аргументы:
+        name (str): Один из PARSER_BACKENDS.
+
+    Исключения:
+        ValueError: Если движок неизвестен.
+    """
+    global _parser_backend
+    if name not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown parser backend: {name}")
+    _parser_backend = name
+
+
+def is_parser_backend_available(name: str) -> bool:
+    """Проверяет, установлена ли библиотека, нужная движку разбора HTML."""
+    module = {"lxml": "lxml", "selectolax": "selectolax.lexbor"}.get(name)
+    if module is None:
+        return name in PARSER_BACKENDS
+    try:
+        __import__(module)
+    except ImportError:
+        return False
+    return True
+
+
+def _classes_of(attrs):
+    value = attrs.get("class") or ()
+    return value.split() if isinstance(value, str) else value
+
+
+@lru_cache(maxsize=None)
+def _make_strainer(parse_only):
+    targets = {}
+    for name, class_ in parse_only:
+        targets.setdefault(name, set()).add(class_)
+
+    def matches(name, attrs):
+        classes = targets.get(name)
+        if classes is None:
+            return False
+        if None in classes:
+            return True
+        tag_classes = _classes_of(attrs)
+        return any(c in classes for c in tag_classes) or " ".join(tag_classes) in classes
+
+    return SoupStrainer(matches)
+
+
+def make_soup(html, parse_only=None):
+    """
+    Разбирает HTML выбранным движком.
+
+    Для "lxml" и "html.parser" возвращается BeautifulSoup, для "selectolax" —
+    обертка над деревом lexbor с теми же методами, что используют скрапперы.
+
+    Аргументы:
+        html (str): HTML контент страницы.
+        parse_only (tuple): Пары (тег, класс) поддеревьев, которые нужно разобрать;
+            класс None означает любой элемент с этим тегом. Остальная разметка
+            BeautifulSoup не строится. selectolax разбирает документ целиком.
+
+    Возвращает:
+        BeautifulSoup | SelectolaxElement: Корень разобранного документа.
+    """
+    if _parser_backend == "selectolax":
+        from selectolax.lexbor import LexborHTMLParser
+
+        return SelectolaxElement(LexborHTMLParser(html).root)
+    if parse_only:
+        return BeautifulSoup(html, _parser_backend, parse_only=_make_strainer(tuple(parse_only)))
+    return BeautifulSoup(html, _parser_backend)
+
+
+def strip_elements(root, exclusions):
+    """
+    Удаляет из поддерева все элементы, подходящие под набор исключений, за один обход.
+
+    Аргументы:
+        root: Элемент (Tag или SelectolaxElement), из которого удаляются блоки.
+        exclusions (frozenset): Пары (тег, класс) удаляемых элементов.
+    """
+    if isinstance(root, SelectolaxElement):
+        for node in _collect_selectolax_excluded(root.node, exclusions):
+            node.decompose()
+    else:
+        for tag in _collect_soup_excluded(root, exclusions):
+            tag.decompose()
+
+
+def _collect_soup_excluded(tag, exclusions):
+    found = []
+    for child in tag.children:
+        if not isinstance(child, Tag):
+            continue
+        name = child.name
+        if any((name, c) in exclusions for c in child.get("class", ())):
+            found.append(child)
+        else:
+            found.extend(_collect_soup_excluded(child, exclusions))
+    return found
+
+
+def _collect_selectolax_excluded(node, exclusions):
+    found = []
+    child = node.child
+    while child is not None:
+        tag = child.tag
+        if tag[0] != "-":
+            classes = (child.attributes.get("class") or "").split()
+            if any((tag, c) in exclusions for c in classes):
+                found.append(child)
+            else:
+                found.extend(_collect_selectolax_excluded(child, exclusions))
+        child = child.next
+    return found
+
+
+def _class_matches(node, class_):
+    if class_ is None:
+        return True
+    value = node.attributes.get("class")
+    if not value:
+        return False
+    classes = value.split()
+    return class_ in classes or " ".join(classes) == class_
+
+
+def _iter_strings(node):
+    child = node.child
+    while child is not None:
+        tag = child.tag
+        if tag == "-text":
+            yield child.text_content
+        elif tag not in _SKIP_TEXT_TAGS:
+            yield from _iter_strings(child)
+        child = child.next
+
+
+class SelectolaxElement:
+    """
+    Элемент дерева selectolax с подмножеством API BeautifulSoup.
+
+    Поддерживает find_all/find/find_next по тегу и классу, get_text, доступ к
+    атрибутам и decompose — ровно то, что вызывают скрапперы.
+    """
+
+    __slots__ = ("node",)
+
+    def __init__(self, node):
+        self.node = node
+
+    def __bool__(self):
+        return True
+
+    def __eq__(self, other):
+        return isinstance(other, SelectolaxElement) and self.node.mem_id == other.node.mem_id
+
+    def __hash__(self):
+        return self.node.mem_id
+
+    @property
+    def name(self):
+        return self.node.tag
+
+    def find_all(self, name=None, class_=None, recursive=True):
+        if recursive:
+            own_id = self.node.mem_id
+            candidates = (n for n in self.node.css(name or "*") if n.mem_id != own_id)
+        else:
+            candidates = (
+                n for n in self.node.iter(include_text=False)
+                if n.tag != "-comment" and (name is None or n.tag == name)
+            )
+        return [SelectolaxElement(n) for n in candidates if _class_matches(n, class_)]
+
+    def find(self, name=None, class_=None):
+        own_id = self.node.mem_id
+        for node in self.node.css(name or "*"):
+            if node.mem_id != own_id and _class_matches(node, class_):
+                return SelectolaxElement(node)
+        return None
+
+    def find_next(self, name=None, class_=None):
+        own_id = self.node.mem_id
+        seen = False
+        for node in self.node.parser.root.traverse():
+            if not seen:
+                seen = node.mem_id == own_id
+                continue
+            if (name is None or node.tag == name) and _class_matches(node, class_):
+                return SelectolaxElement(node)
+        return None
+
+    def get_text(self, separator="", strip=False):
+        strings = _iter_strings(self.node)
+        if strip:
+            return separator.join(s for s in (s.strip() for s in strings) if s)
+        return separator.join(strings)
+
+    def get(self, key, default=None):
+        attributes = self.node.attributes
+        if key not in attributes:
+            return default
+        value = attributes[key] or ""
+        if key == "class":
+            return value.split()
+        return value
+
+    def __getitem__(self, key):
+        if key not in self.node.attributes:
+            raise KeyError(key)
+        return self.get(key)
+
+    def __setitem__(self, key, value):
+        self.node.attrs[key] = value
+
+    def decompose(self):
+        self.node.decompose()
@@ -0,0 +1,135 @@
+from typing import Dict, Optional
+from aiohttp import ClientSession, ClientTimeout, TCPConnector, TraceConfig
+from app.helpers.metrics import HTTP_CONNECTIONS, HTTP_POOL_LIMIT, HTTP_POOL_WAITING, HTTP_REQUESTS_IN_FLIGHT
+from settings.constants import (
+    CONNECTION_POOL_LIMIT,
+    DNS_CACHE_TTL,
+    HOST_CONCURRENCY_LIMIT,
+    KEEPALIVE_TIMEOUT,
+    REQUEST_TIMEOUT,
+)
+from settings.logger_setup import parser_logger
+
+_session: Optional[ClientSession] = None
+
+# Состояние пула по событиям трассировки aiohttp: у TCPConnector нет публичного
+# API для числа занятых и простаивающих соединений. Обработчики выполняются в
+# цикле событий, поэтому блокировка не нужна.
+_pool_state = {"in_flight": 0, "waiting": 0, "connections_new": 0, "connections_reused": 0}
+
+
+async def _on_request_start(session, context, params):
+    _pool_state["in_flight"] += 1
+
+
+def _leave_pool_queue(context):
+    if getattr(context, "queued", False):
+        context.queued = False
+        _pool_state["waiting"] -= 1
+
+
+async def _on_request_done(session, context, params):
+    _pool_state["in_flight"] -= 1
+    # Если ожидание соединения прервали отмена или таймаут, aiohttp не
+    # отправляет on_connection_queued_end: запрос уходит из очереди здесь
+    _leave_pool_queue(context)
+
+
+async def _on_connection_queued_start(session, context, params):
+    context.queued = True
+    _pool_state["waiting"] += 1
+
+
+async def _on_connection_queued_end(session, context, params):
+    _leave_pool_queue(context)
+
+
+async def _on_connection_create_end(session, context, params):
+    _pool_state["connections_new"] += 1
+    HTTP_CONNECTIONS.inc(result="new")
+
+
+async def _on_connection_reuseconn(session, context, params):
+    _pool_state["connections_reused"] += 1
+    HTTP_CONNECTIONS.inc(result="reused")
+
+
+def _pool_trace_config() -> TraceConfig:
+    trace_config = TraceConfig()
+    trace_config.on_request_start.append(_on_request_start)
+    trace_config.on_request_end.append(_on_request_done)
+    trace_config.on_request_exception.append(_on_request_done)
+    trace_config.on_connection_queued_start.append(_on_connection_queued_start)
+    trace_config.on_connection_queued_end.append(_on_connection_queued_end)
+    trace_config.on_connection_create_end.append(_on_connection_create_end)
+    trace_config.on_connection_reuseconn.append(_on_connection_reuseconn)
+    return trace_config
+
+
+def get_session() -> ClientSession:
+    """
+    Возвращает HTTP сессию, общую для всего процесса.
+
+    Сессия создается при первом вызове (или если предыдущая была закрыта) и
+    переиспользуется между циклами скраппера, чтобы не повторять DNS запросы,
+    TCP соединения и TLS рукопожатия.
+
+    Возвращает:
+        aiohttp.ClientSession: Сессия с настроенным пулом соединений.
+    """
+    global _session
+    if _session is None or _session.closed:
+        connector = TCPConnector(
+            limit=CONNECTION_POOL_LIMIT,
+            limit_per_host=HOST_CONCURRENCY_LIMIT,
+            ttl_dns_cache=DNS_CACHE_TTL,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+        )
+        _session = ClientSession(
+            connector=connector,
+            timeout=ClientTimeout(total=REQUEST_TIMEOUT),
+            trace_configs=[_pool_trace_config()],
+        )
+        parser_logger.debug("HTTP session created")
+    return _session
+
+
+async def close_session():
+    """Закрывает общую HTTP сессию, если она была открыта."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+        parser_logger.debug("HTTP session closed")
+    _session = None
+
+
+def get_session_stats() -> Dict[str, int]:
+    """
+    Возвращает статистику пула соединений общей HTTP сессии.
+
+    Считается только через публичный API aiohttp: лимиты коннектора и события
+    трассировки. Те же значения экспортируются метриками parser_http_*.
+
+    Возвращает:
+        dict: Лимиты пула, число запросов в ожидании ответа и свободного
+              соединения, число новых и переиспользованных соединений.
+    """
+    if _session is None or _session.closed:
+        return {}
+
+    return {
+        "limit": _session.connector.limit,
+        "limit_per_host": _session.connector.limit_per_host,
+        **_pool_state,
+    }
+
+
+def _pool_limits() -> Dict[str, int]:
+    if _session is None or _session.closed:
+        return {}
+    return {"total": _session.connector.limit, "per_host": _session.connector.limit_per_host}
+
+
+HTTP_POOL_LIMIT.set_function(_pool_limits)
+HTTP_REQUESTS_IN_FLIGHT.set_function(lambda: _pool_state["in_flight"])
+HTTP_POOL_WAITING.set_function(lambda: _pool_state["waiting"])
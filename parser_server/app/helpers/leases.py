@@ -0,0 +1,184 @@
+import math
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List
+from settings.constants import LEASE_TTL
+from settings.logger_setup import parser_logger
+from settings.paths import LEASES_FILE_PATH
+
+
+class LeaseManager:
+    """
+    Аренда ресурсов (источников, роли слияния) между воркерами через общий SQLite файл.
+
+    Ресурс принадлежит воркеру, пока не истек срок аренды (LEASE_TTL); воркер
+    продлевает свои аренды через renew(). Аренда истекшего ресурса переходит к
+    первому воркеру, который его запросит. Каждый воркер держит не больше своей
+    доли балансируемых ресурсов: ceil(число ресурсов / число живых воркеров),
+    поэтому новый воркер получает источники, которые отпустят остальные.
+    SQLite блокирует файл на время транзакции, поэтому захват атомарен и между
+    процессами, и между узлами с общим томом, поддерживающим блокировки.
+
+    Аргументы:
+        worker_id (str): Имя воркера.
+        resources (Iterable[str]): Ресурсы, которые делятся поровну между воркерами.
+        ttl (float): Срок аренды в секундах.
+    """
+
+    def __init__(self, worker_id: str, resources: Iterable[str] = (), ttl: float = LEASE_TTL, leases_path=LEASES_FILE_PATH):
+        self.worker_id = worker_id
+        self.resources = list(resources)
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(str(leases_path), timeout=30, isolation_level=None, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS leases (
+                resource TEXT PRIMARY KEY,
+                owner TEXT NOT NULL,
+                acquired_at REAL NOT NULL,
+                expires_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS workers (
+                worker_id TEXT PRIMARY KEY,
+                heartbeat_at REAL NOT NULL
+            );
+            """
+        )
+        self.heartbeat()
+
+    def _transaction(self):
+        # BEGIN IMMEDIATE сразу берет блокировку записи: чтение и запись аренды не разделяются другим воркером
+        self.connection.execute("BEGIN IMMEDIATE")
+
+    def heartbeat(self):
+        """Отмечает, что воркер жив. Процесс без балансируемых ресурсов (слияние) не учитывается в долях."""
+        if not self.resources:
+            return
+        with self.lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO workers (worker_id, heartbeat_at) VALUES (?, ?)",
+                (self.worker_id, time.time()),
+            )
+
+    def live_workers(self) -> List[str]:
+        """Возвращает воркеров, которые отмечались в течение срока аренды."""
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT worker_id FROM workers WHERE heartbeat_at > ? ORDER BY worker_id", (time.time() - self.ttl,)
+            ).fetchall()
+        return [worker_id for (worker_id,) in rows]
+
+    def fair_share(self) -> int:
+        """Сколько балансируемых ресурсов может держать один воркер."""
+        return max(1, math.ceil(len(self.resources) / max(1, len(self.live_workers()))))
+
+    def _held(self, now: float) -> int:
+        placeholders = ",".join("?" * len(self.resources))
+        return self.connection.execute(
+            f"SELECT COUNT(*) FROM leases WHERE owner = ? AND expires_at > ? AND resource IN ({placeholders})",
+            (self.worker_id, now, *self.resources),
+        ).fetchone()[0]
+
+    def acquire(self, resource: str) -> bool:
+        """
+        Захватывает или продлевает аренду ресурса.
+
+        Аргументы:
+            resource (str): Имя ресурса.
+
+        Возвращает:
+            bool: True, если ресурс принадлежит этому воркеру.
+        """
+        share = self.fair_share() if resource in self.resources else None
+        with self.lock:
+            now = time.time()
+            self._transaction()
+            try:
+                row = self.connection.execute(
+                    "SELECT owner, expires_at FROM leases WHERE resource = ?", (resource,)
+                ).fetchone()
+                owned = row is not None and row[0] == self.worker_id
+                if row is not None and not owned and row[1] > now:
+                    self.connection.execute("ROLLBACK")
+                    return False
+                if not owned and share is not None and self._held(now) >= share:
+                    self.connection.execute("ROLLBACK")
+                    return False
+                self.connection.execute(
+                    "INSERT INTO leases (resource, owner, acquired_at, expires_at) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (resource) DO UPDATE SET expires_at = excluded.expires_at, "
+                    "acquired_at = CASE WHEN owner = excluded.owner THEN acquired_at ELSE excluded.acquired_at END, "
+                    "owner = excluded.owner",
+                    (resource, self.worker_id, now, now + self.ttl),
+                )
+                self.connection.execute("COMMIT")
+            except Exception:
+                self.connection.execute("ROLLBACK")
+                raise
+        if not owned:
+            parser_logger.info(f"Worker {self.worker_id} acquired lease {resource}")
+        return True
+
+    def renew(self) -> List[str]:
+        """
+        Продлевает все действующие аренды воркера и отмечает, что он жив.
+
+        Возвращает:
+            list: Ресурсы, которые по-прежнему принадлежат воркеру.
+        """
+        self.heartbeat()
+        with self.lock:
+            now = time.time()
+            self.connection.execute(
+                "UPDATE leases SET expires_at = ? WHERE owner = ? AND expires_at > ?",
+                (now + self.ttl, self.worker_id, now),
+            )
+            rows = self.connection.execute(
+                "SELECT resource FROM leases WHERE owner = ? AND expires_at > ?", (self.worker_id, now)
+            ).fetchall()
+        return [resource for (resource,) in rows]
+
+    def holds(self, resource: str) -> bool:
+        """Проверяет, что аренда ресурса принадлежит воркеру и не истекла."""
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT 1 FROM leases WHERE resource = ? AND owner = ? AND expires_at > ?",
+                (resource, self.worker_id, time.time()),
+            ).fetchone()
+        return row is not None
+
+    def over_share(self) -> bool:
+        """Проверяет, держит ли воркер больше своей доли балансируемых ресурсов."""
+        share = self.fair_share()
+        with self.lock:
+            return self._held(time.time()) > share
+
+    def release(self, resource: str):
+        """Отпускает аренду ресурса, если она принадлежит воркеру."""
+        with self.lock:
+            self.connection.execute(
+                "DELETE FROM leases WHERE resource = ? AND owner = ?", (resource, self.worker_id)
+            )
+        parser_logger.info(f"Worker {self.worker_id} released lease {resource}")
+
+    def release_all(self):
+        """Отпускает все аренды воркера и удаляет его из списка живых."""
+        with self.lock:
+            self.connection.execute("DELETE FROM leases WHERE owner = ?", (self.worker_id,))
+            self.connection.execute("DELETE FROM workers WHERE worker_id = ?", (self.worker_id,))
+
+    def get_leases(self) -> Dict[str, Dict[str, object]]:
+        """Возвращает действующие аренды: ресурс -> {"owner", "expires_in"}."""
+        with self.lock:
+            now = time.time()
+            rows = self.connection.execute(
+                "SELECT resource, owner, expires_at FROM leases WHERE expires_at > ? ORDER BY resource", (now,)
+            ).fetchall()
+        return {resource: {"owner": owner, "expires_in": round(expires_at - now, 1)} for resource, owner, expires_at in rows}
+
+    def close(self):
+        self.connection.close()
+
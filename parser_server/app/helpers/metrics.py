@@ -0,0 +1,202 @@
+import math
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Минимальная реализация метрик в текстовом формате Prometheus (без сторонних
+# зависимостей). Значения обновляются из цикла событий и из пула потоков записи,
+# поэтому все изменения выполняются под общей блокировкой.
+
+_lock = threading.Lock()
+_registry: List["Metric"] = []
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Iterable[str], values: Iterable) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Metric:
+    """
+    Базовый класс метрики с именем, описанием и набором меток.
+
+    Аргументы:
+        name (str): Имя метрики.
+        documentation (str): Описание (строка HELP).
+        labelnames (tuple): Имена меток.
+    """
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.values: Dict[Tuple, float] = {}
+        with _lock:
+            _registry.append(self)
+
+    def _key(self, labels: Dict[str, object]) -> Tuple:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> List[Tuple[str, Tuple, float]]:
+        return [(self.name, key, value) for key, value in self.values.items()]
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for name, key, value in self.samples():
+            labelnames = self.labelnames + (("le",) if len(key) > len(self.labelnames) else ())
+            lines.append(f"{name}{_format_labels(labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class Counter(Metric):
+    """Монотонно растущий счетчик."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with _lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+
+class Gauge(Metric):
+    """
+    Текущее значение. Вместо set() можно задать функцию, которая вызывается при
+    каждом чтении метрик и возвращает число или словарь {значения меток: число}.
+    """
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self.function: Optional[Callable[[], object]] = None
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with _lock:
+            self.values[key] = value
+
+    def set_function(self, function: Optional[Callable[[], object]]):
+        self.function = function
+
+    def samples(self):
+        if self.function is None:
+            return super().samples()
+        try:
+            value = self.function()
+        except Exception:
+            return []
+        if isinstance(value, dict):
+            return [
+                (self.name, key if isinstance(key, tuple) else (key,), number)
+                for key, number in value.items()
+            ]
+        return [(self.name, (), value)]
+
+
+class Histogram(Metric):
+    """Гистограмма с накопительными корзинами, суммой и числом наблюдений."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (), buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self.counts: Dict[Tuple, List[int]] = {}
+        self.sums: Dict[Tuple, float] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with _lock:
+            counts = self.counts.setdefault(key, [0] * len(self.buckets))
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[index] += 1
+            self.sums[key] = self.sums.get(key, 0.0) + value
+
+    def samples(self):
+        samples = []
+        for key, counts in self.counts.items():
+            for bound, count in zip(self.buckets, counts):
+                samples.append((f"{self.name}_bucket", key + (_format_value(bound),), count))
+            samples.append((f"{self.name}_sum", key, self.sums[key]))
+            samples.append((f"{self.name}_count", key, counts[-1]))
+        return samples
+
+
+def render_metrics() -> str:
+    """
+    Возвращает все зарегистрированные метрики в текстовом формате Prometheus.
+
+    Возвращает:
+        str: Текст для ответа на запрос /metrics.
+    """
+    with _lock:
+        metrics = list(_registry)
+        # Снимок значений под блокировкой; функции Gauge вызываются вне нее
+        static = {id(metric): metric.render() for metric in metrics if not isinstance(metric, Gauge) or metric.function is None}
+    lines = []
+    for metric in metrics:
+        lines.extend(static.get(id(metric)) or metric.render())
+    return "\n".join(lines) + "\n"
+
+
+FETCH_DURATION = Histogram(
+    "parser_fetch_duration_seconds", "HTTP request duration per attempt, including body download.", ("source", "host")
+)
+FETCH_RESPONSES = Counter("parser_http_responses_total", "HTTP responses by status code.", ("source", "host", "status"))
+FETCH_ERRORS = Counter("parser_fetch_errors_total", "Requests that failed without a response.", ("source", "host", "error"))
+FETCH_RETRIES = Counter("parser_fetch_retries_total", "Retried requests.", ("source", "host"))
+DOWNLOADED_BYTES = Counter(
+    "parser_downloaded_bytes_total",
+    "Response body bytes received over the network: Content-Length, or the body size of uncompressed "
+    "responses without it. Compressed responses without Content-Length are not counted.",
+    ("source", "host"),
+)
+RESPONSE_BODY_BYTES = Counter(
+    "parser_response_body_bytes_total", "Response body bytes after decompression.", ("source", "host")
+)
+CIRCUIT_OPEN = Gauge("parser_circuit_open", "1 if the host circuit breaker is open.", ("host",))
+HTTP_POOL_LIMIT = Gauge("parser_http_pool_limit", "Connection limits of the shared HTTP session.", ("scope",))
+HTTP_REQUESTS_IN_FLIGHT = Gauge("parser_http_requests_in_flight", "Requests started and not answered yet, including those waiting for a connection.")
+HTTP_POOL_WAITING = Gauge("parser_http_pool_waiting", "Requests waiting for a free connection in the pool.")
+HTTP_CONNECTIONS = Counter("parser_http_connections_total", "Connections taken from the pool: new or reused keep-alive.", ("result",))
+
+PARSE_DURATION = Histogram(
+    "parser_parse_duration_seconds", "HTML extraction time per call.", ("source", "function")
+)
+
+ARTICLES = Counter(
+    "parser_articles_total", "Articles passed to the writer: new, already in the dataset or a dropped near-duplicate.",
+    ("source", "result"),
+)
+NEAR_DUPLICATES = Counter(
+    "parser_near_duplicates_total", "Near-duplicate articles by source and the source of the earlier copy.",
+    ("source", "duplicate_source"),
+)
+WRITE_DURATION = Histogram("parser_write_duration_seconds", "Dataset batch write time.")
+
+QUEUE_DEPTH = Gauge("parser_queue_depth", "Articles waiting in the writer queue.")
+FRONTIER_ARTICLES = Gauge("parser_frontier_articles", "Articles in the crawl frontier by state.", ("state",))
+
+CYCLE_DURATION = Histogram(
+    "parser_cycle_duration_seconds", "Duration of one scrapper cycle.", ("source",),
+    buckets=(1, 5, 10, 30, 60, 120, 300, 600, 1200, 1800, 3600),
+)
+CYCLE_ARTICLES = Gauge("parser_cycle_articles", "Articles scraped in the last cycle.", ("source",))
+NEXT_RUN_DELAY = Gauge("parser_next_run_delay_seconds", "Delay before the next cycle chosen by the scheduler.", ("source",))
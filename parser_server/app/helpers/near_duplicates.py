@@ -0,0 +1,294 @@
+import re
+import sqlite3
+import threading
+import time
+from array import array
+from datetime import datetime
+from hashlib import blake2b
+from typing import Dict, Iterable, List, Optional, Tuple
+from settings.constants import (
+    NEAR_DUPLICATE_BANDS,
+    NEAR_DUPLICATE_MAX_CANDIDATES,
+    NEAR_DUPLICATE_PRUNE_EVERY,
+    NEAR_DUPLICATE_SIGNATURE_SIZE,
+    NEAR_DUPLICATE_RETENTION_DAYS,
+    NEAR_DUPLICATE_SHINGLE_SIZE,
+    NEAR_DUPLICATE_THRESHOLD,
+)
+from settings.logger_setup import parser_logger
+from settings.paths import NEAR_DUPLICATES_FILE_PATH
+
+# Поиск перепечаток одной новости разными источниками. Текст статьи разбивается
+# на шинглы (последовательности из NEAR_DUPLICATE_SHINGLE_SIZE слов), по ним
+# строится MinHash сигнатура, а сигнатура раскладывается по полосам LSH. Статьи,
+# у которых совпала хотя бы одна полоса, — кандидаты; дубликатом считается
+# кандидат с оценкой сходства Жаккара не ниже NEAR_DUPLICATE_THRESHOLD. Поиск
+# занимает NEAR_DUPLICATE_BANDS запросов по индексу, независимо от размера датасета.
+
+# Версия схемы хеширования: сигнатуры разных версий несравнимы
+_SIGNATURE_SCHEME = "oph-1"
+# Значения в сигнатуре — 64-битный хеш без младших бит номера корзины
+_VALUE_LIMIT = 1 << 64
+
+# Статьи короче этого числа слов (пустой текст, одна строка) не сравниваются
+MIN_WORDS = 20
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+def article_shingles(text: str, size: int = NEAR_DUPLICATE_SHINGLE_SIZE) -> set:
+    """
+    Возвращает хеши шинглов текста.
+
+    Аргументы:
+        text (str): Текст статьи.
+        size (int): Длина шингла в словах.
+
+    Возвращает:
+        set: 64-битные хеши шинглов; пустое множество, если в тексте меньше MIN_WORDS слов.
+    """
+    words = _WORD_PATTERN.findall(text.lower())
+    if len(words) < MIN_WORDS:
+        return set()
+    return {
+        int.from_bytes(blake2b(" ".join(words[i:i + size]).encode("utf-8"), digest_size=8).digest(), "big")
+        for i in range(len(words) - size + 1)
+    }
+
+
+def minhash_signature(shingles: Iterable[int], size: int = NEAR_DUPLICATE_SIGNATURE_SIZE) -> Optional[array]:
+    """
+    Строит MinHash сигнатуру множества шинглов хешированием с одной перестановкой.
+
+    Вместо size хеш-функций каждый хеш шингла попадает в одну из size корзин
+    (младшие биты) и участвует в минимуме только этой корзины, поэтому сигнатура
+    строится за один проход по шинглам. Пустые корзины заполняются значением
+    ближайшей непустой корзины справа со сдвигом на расстояние до нее
+    (densification), чтобы у похожих текстов совпадали и они.
+
+    Аргументы:
+        shingles (Iterable[int]): 64-битные хеши шинглов.
+        size (int): Длина сигнатуры.
+
+    Возвращает:
+        array: size значений; доля совпавших значений двух сигнатур оценивает сходство Жаккара.
+        None: Если шинглов нет.
+    """
+    bins = [_VALUE_LIMIT] * size
+    for h in shingles:
+        index = h % size
+        value = h // size
+        if value < bins[index]:
+            bins[index] = value
+    if all(value == _VALUE_LIMIT for value in bins):
+        return None
+
+    signature = list(bins)
+    for index in range(size):
+        if bins[index] != _VALUE_LIMIT:
+            continue
+        distance = 1
+        while bins[(index + distance) % size] == _VALUE_LIMIT:
+            distance += 1
+        signature[index] = (bins[(index + distance) % size] + distance * _VALUE_LIMIT // size) % _VALUE_LIMIT
+    return array("Q", signature)
+
+
+def signature_similarity(first: array, second: array) -> float:
+    """Оценка сходства Жаккара по двум сигнатурам: доля совпавших значений."""
+    return sum(x == y for x, y in zip(first, second)) / len(first)
+
+
+def band_buckets(signature: array) -> List[int]:
+    """
+    Возвращает ключи корзин LSH сигнатуры, по одному на полосу.
+
+    Ключ включает номер полосы, поэтому все корзины хранятся в одной колонке.
+    """
+    rows = len(signature) // NEAR_DUPLICATE_BANDS
+    data = signature.tobytes()
+    width = rows * signature.itemsize
+    return [
+        int.from_bytes(
+            blake2b(band.to_bytes(2, "big") + data[band * width:(band + 1) * width], digest_size=8).digest(),
+            "big",
+            signed=True,
+        )
+        for band in range(NEAR_DUPLICATE_BANDS)
+    ]
+
+
+class NearDuplicateIndex:
+    """
+    Постоянный LSH индекс MinHash сигнатур статей за последние NEAR_DUPLICATE_RETENTION_DAYS дней.
+
+    Хранится в SQLite: сигнатуры, корзины LSH и найденные пары дубликатов
+    (таблица duplicates — для разметки датасета в режиме "flag"). Статьи старше
+    срока хранения удаляются из индекса при открытии. Индекс потокобезопасен:
+    запись датасета выполняется из пула потоков.
+    """
+
+    def __init__(self, index_path=NEAR_DUPLICATES_FILE_PATH):
+        self.index_path = index_path
+        self.lock = threading.Lock()
+        self.checks_since_prune = 0
+        self.connection = sqlite3.connect(str(index_path), check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS signatures (
+                article_link TEXT PRIMARY KEY,
+                news_source_name TEXT,
+                signature BLOB NOT NULL,
+                added_at INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS buckets (
+                bucket INTEGER NOT NULL,
+                article_link TEXT NOT NULL,
+                added_at INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS buckets_bucket ON buckets (bucket);
+            CREATE INDEX IF NOT EXISTS buckets_added_at ON buckets (added_at);
+            CREATE INDEX IF NOT EXISTS signatures_added_at ON signatures (added_at);
+            CREATE TABLE IF NOT EXISTS duplicates (
+                article_link TEXT PRIMARY KEY,
+                news_source_name TEXT,
+                duplicate_of TEXT NOT NULL,
+                duplicate_source_name TEXT,
+                similarity REAL NOT NULL,
+                detected_at TEXT NOT NULL
+            );
+            """
+        )
+        self._check_parameters()
+        self.prune()
+
+        count = self.connection.execute("SELECT COUNT(*) FROM signatures").fetchone()[0]
+        parser_logger.debug(f"Near-duplicate index loaded: {count} signatures")
+
+    def _check_parameters(self):
+        # Сигнатуры, построенные с другими параметрами, несравнимы с новыми
+        parameters = f"{_SIGNATURE_SCHEME}:{NEAR_DUPLICATE_SHINGLE_SIZE}:{NEAR_DUPLICATE_SIGNATURE_SIZE}:{NEAR_DUPLICATE_BANDS}"
+        row = self.connection.execute("SELECT value FROM meta WHERE key = 'parameters'").fetchone()
+        if row is not None and row[0] == parameters:
+            return
+        if row is not None:
+            parser_logger.warning(f"Near-duplicate parameters changed ({row[0]} -> {parameters}), rebuilding index")
+        with self.connection:
+            self.connection.execute("DELETE FROM signatures")
+            self.connection.execute("DELETE FROM buckets")
+            self.connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('parameters', ?)", (parameters,))
+
+    def prune(self):
+        """Удаляет из индекса статьи старше NEAR_DUPLICATE_RETENTION_DAYS дней."""
+        cutoff = int(time.time()) - NEAR_DUPLICATE_RETENTION_DAYS * 86400
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM buckets WHERE added_at < ?", (cutoff,))
+            self.connection.execute("DELETE FROM signatures WHERE added_at < ?", (cutoff,))
+
+    def _find(self, link: str, signature: array, buckets: List[int]) -> Optional[Tuple[str, str, float]]:
+        placeholders = ",".join("?" * len(buckets))
+        # Сначала кандидаты, совпавшие со статьей в большем числе полос LSH
+        candidates = self.connection.execute(
+            f"SELECT article_link FROM buckets WHERE bucket IN ({placeholders}) "
+            "GROUP BY article_link ORDER BY COUNT(*) DESC LIMIT ?",
+            (*buckets, NEAR_DUPLICATE_MAX_CANDIDATES),
+        ).fetchall()
+
+        best = None
+        for (candidate,) in candidates:
+            if candidate == link:
+                continue
+            row = self.connection.execute(
+                "SELECT news_source_name, signature FROM signatures WHERE article_link = ?", (candidate,)
+            ).fetchone()
+            if row is None:
+                continue
+            other = array("Q")
+            other.frombytes(row[1])
+            similarity = signature_similarity(signature, other)
+            if similarity >= NEAR_DUPLICATE_THRESHOLD and (best is None or similarity > best[2]):
+                best = (candidate, row[0], similarity)
+        return best
+
+    def _add(self, article: Dict[str, str], signature: array, buckets: List[int]):
+        link = article["article_link"]
+        now = int(time.time())
+        self.connection.execute("DELETE FROM buckets WHERE article_link = ?", (link,))
+        self.connection.execute(
+            "INSERT OR REPLACE INTO signatures (article_link, news_source_name, signature, added_at) VALUES (?, ?, ?, ?)",
+            (link, article.get("news_source_name"), signature.tobytes(), now),
+        )
+        self.connection.executemany(
+            "INSERT INTO buckets (bucket, article_link, added_at) VALUES (?, ?, ?)",
+            ((bucket, link, now) for bucket in buckets),
+        )
+
+    def check_many(self, articles: Iterable[Dict[str, str]], drop: bool = False) -> List[Tuple[Dict[str, str], Optional[Tuple[str, str, float]]]]:
+        """
+        Ищет почти одинаковые статьи среди ранее добавленных и добавляет статьи в индекс.
+
+        Статьи проверяются по порядку, поэтому перепечатки внутри одного пакета
+        тоже находятся. Найденные пары сохраняются в таблицу duplicates. Каждый
+        NEAR_DUPLICATE_PRUNE_EVERY-й вызов сначала удаляет устаревшие статьи.
+
+        Аргументы:
+            articles (Iterable[dict]): Статьи с ключами article_link, article_title, article_text.
+            drop (bool): Дубликаты не будут записаны в датасет и не добавляются в индекс.
+
+        Возвращает:
+            list: Пары (статья, (ссылка оригинала, источник оригинала, сходство) или None).
+        """
+        with self.lock:
+            self.checks_since_prune += 1
+            prune_due = self.checks_since_prune >= NEAR_DUPLICATE_PRUNE_EVERY
+            if prune_due:
+                self.checks_since_prune = 0
+        if prune_due:
+            self.prune()
+
+        results = []
+        detected_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self.lock, self.connection:
+            for article in articles:
+                text = f"{article.get('article_title', '')} {article.get('article_text', '')}"
+                signature = minhash_signature(article_shingles(text))
+                if signature is None:
+                    results.append((article, None))
+                    continue
+
+                buckets = band_buckets(signature)
+                match = self._find(article["article_link"], signature, buckets)
+                if match is not None:
+                    self.connection.execute(
+                        "INSERT OR REPLACE INTO duplicates "
+                        "(article_link, news_source_name, duplicate_of, duplicate_source_name, similarity, detected_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (article["article_link"], article.get("news_source_name"), match[0], match[1], match[2], detected_at),
+                    )
+                if match is None or not drop:
+                    self._add(article, signature, buckets)
+                results.append((article, match))
+        return results
+
+    def close(self):
+        self.connection.close()
+
+
+_near_duplicate_index: Optional[NearDuplicateIndex] = None
+_near_duplicate_index_lock = threading.Lock()
+
+def get_near_duplicate_index() -> NearDuplicateIndex:
+    """
+    Возвращает индекс почти одинаковых статей, общий для всего процесса.
+
+    Возвращает:
+        NearDuplicateIndex: LSH индекс сигнатур недавних статей.
+    """
+    global _near_duplicate_index
+    with _near_duplicate_index_lock:
+        if _near_duplicate_index is None:
+            _near_duplicate_index = NearDuplicateIndex()
+    return _near_duplicate_index
@@ -0,0 +1,172 @@
+import os
+import re
+import uuid
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+from settings.constants import NEWS_COLUMNS, PARQUET_COMPACT_MIN_FILES
+from settings.paths import PARQUET_DIR_PATH
+
+# Колонки, по которым датасет разбит на каталоги (hive: колонка=значение)
+PARTITION_COLUMNS = ["news_source_name", "article_day"]
+UNKNOWN_DAY = "unknown"
+
+_DAY_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}")
+
+
+def _arrow():
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    return pa, ds
+
+
+def _schema():
+    pa, _ = _arrow()
+    return pa.schema([(column, pa.string()) for column in NEWS_COLUMNS + ["article_day"]])
+
+
+def _partitioning():
+    pa, ds = _arrow()
+    return ds.partitioning(
+        pa.schema([(column, pa.string()) for column in PARTITION_COLUMNS]), flavor="hive"
+    )
+
+
+def article_day(article_date: str) -> str:
+    """
+    Возвращает день статьи (YYYY-MM-DD) для раздела датасета.
+
+    Аргументы:
+        article_date (str): Дата статьи в формате ISO 8601.
+
+    Возвращает:
+        str: День статьи или UNKNOWN_DAY, если дату не удалось разобрать.
+    """
+    if article_date and _DAY_PATTERN.match(article_date):
+        return article_date[:10]
+    return UNKNOWN_DAY
+
+
+def write_news_to_parquet(articles: List[Dict[str, str]], dataset_dir=PARQUET_DIR_PATH, compact_min_files=PARQUET_COMPACT_MIN_FILES):
+    """
+    Дописывает пакет статей в Parquet датасет, разбитый по источнику и дню статьи.
+
+    Каждый пакет записывается отдельными файлами (по одному на раздел). Чтобы
+    файлов не становилось по одному на пакет, раздел, в котором набралось
+    compact_min_files файлов, сразу сливается в один (compact_parquet_partition).
+
+    Аргументы:
+        articles (list): Статьи с ключами из NEWS_COLUMNS.
+        dataset_dir (Path): Корневой каталог датасета.
+        compact_min_files (int): Число файлов в разделе, после которого он сливается.
+    """
+    if not articles:
+        return
+
+    pa, ds = _arrow()
+    columns = {column: [article.get(column, "") for article in articles] for column in NEWS_COLUMNS}
+    columns["article_day"] = [article_day(date) for date in columns["article_date"]]
+    table = pa.Table.from_pydict(columns, schema=_schema())
+    partitions = set()
+
+    ds.write_dataset(
+        table,
+        str(dataset_dir),
+        format="parquet",
+        partitioning=_partitioning(),
+        basename_template=f"part-{datetime.now():%Y%m%d%H%M%S}-{uuid.uuid4().hex}-{{i}}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+        file_options=ds.ParquetFileFormat().make_write_options(compression="zstd"),
+        file_visitor=lambda written_file: partitions.add(os.path.dirname(written_file.path)),
+    )
+
+    for partition_dir in partitions:
+        compact_parquet_partition(partition_dir, compact_min_files)
+
+
+def compact_parquet_partition(partition_dir, min_files=PARQUET_COMPACT_MIN_FILES) -> bool:
+    """
+    Сливает файлы раздела Parquet датасета в один файл.
+
+    Новый файл пишется под скрытым именем (такие файлы датасет не читает) и
+    переименовывается, после чего старые файлы удаляются. Если процесс
+    остановится между этими шагами, строки раздела будут прочитаны дважды;
+    обучение модели убирает такие повторы по article_link.
+
+    Аргументы:
+        partition_dir (str): Каталог раздела (news_source_name=.../article_day=...).
+        min_files (int): Сливать, только если в разделе не меньше стольких файлов.
+
+    Возвращает:
+        bool: True, если файлы раздела были слиты.
+    """
+    _, ds = _arrow()
+    import pyarrow.parquet as pq
+
+    files = sorted(
+        os.path.join(partition_dir, name)
+        for name in os.listdir(partition_dir)
+        if name.endswith(".parquet") and not name.startswith((".", "_"))
+    )
+    if len(files) < max(min_files, 2):
+        return False
+
+    table = ds.dataset(files, format="parquet").to_table()
+    name = f"part-{datetime.now():%Y%m%d%H%M%S}-{uuid.uuid4().hex}-compacted.parquet"
+    tmp_path = os.path.join(partition_dir, f".{name}.tmp")
+    pq.write_table(table, tmp_path, compression="zstd")
+    os.replace(tmp_path, os.path.join(partition_dir, name))
+    for file in files:
+        os.remove(file)
+    return True
+
+
+def read_news_dataset(
+    columns: Optional[List[str]] = None,
+    sources: Optional[Iterable[str]] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    dataset_dir=PARQUET_DIR_PATH,
+):
+    """
+    Читает Parquet датасет, загружая только нужные колонки и разделы.
+
+    Фильтры по источнику и дню применяются к разделам, поэтому файлы других
+    источников и дней не открываются.
+
+    Аргументы:
+        columns (list): Колонки, которые нужно прочитать; None — все.
+        sources (Iterable[str]): Источники (news_source_name); None — все.
+        date_from (str): Первый день (YYYY-MM-DD) включительно.
+        date_to (str): Последний день (YYYY-MM-DD) включительно.
+        dataset_dir (Path): Корневой каталог датасета.
+
+    Возвращает:
+        pyarrow.Table: Выбранные строки и колонки.
+    """
+    _, ds = _arrow()
+    dataset = ds.dataset(str(dataset_dir), format="parquet", partitioning=_partitioning())
+
+    expression = None
+    conditions = []
+    if sources is not None:
+        conditions.append(ds.field("news_source_name").isin(list(sources)))
+    if date_from is not None or date_to is not None:
+        conditions.append(ds.field("article_day") != UNKNOWN_DAY)
+    if date_from is not None:
+        conditions.append(ds.field("article_day") >= date_from)
+    if date_to is not None:
+        conditions.append(ds.field("article_day") <= date_to)
+    for condition in conditions:
+        expression = condition if expression is None else expression & condition
+
+    return dataset.to_table(columns=columns, filter=expression)
+
+
+def get_parquet_dataset_size(dataset_dir=PARQUET_DIR_PATH) -> int:
+    """Возвращает суммарный размер файлов Parquet датасета в байтах."""
+    total = 0
+    for root, _, files in os.walk(dataset_dir):
+        for name in files:
+            total += os.path.getsize(os.path.join(root, name))
+    return total
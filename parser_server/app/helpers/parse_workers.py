@@ -0,0 +1,74 @@
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Optional
+from app.helpers.metrics import PARSE_DURATION
+from app.helpers.html_parser import get_parser_backend, set_parser_backend
+from settings.env_config import PARSE_WORKERS
+from settings.logger_setup import parser_logger
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+def get_parse_executor() -> Optional[ProcessPoolExecutor]:
+    """
+    Возвращает пул процессов для разбора HTML, общий для всего процесса.
+
+    Возвращает:
+        ProcessPoolExecutor: Пул из PARSE_WORKERS процессов.
+        None: Если PARSE_WORKERS равен 0 и разбор выполняется в цикле событий.
+    """
+    global _executor
+    if PARSE_WORKERS <= 0:
+        return None
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=PARSE_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=set_parser_backend,
+            initargs=(get_parser_backend(),),
+        )
+        parser_logger.debug(f"Parse worker pool started with {PARSE_WORKERS} processes")
+    return _executor
+
+
+async def run_parse(function: Callable, *args, source: Optional[str] = None):
+    """
+    Выполняет функцию разбора HTML в пуле процессов (или на месте, если пул выключен).
+
+    Функция и аргументы должны сериализоваться pickle: передается сырой HTML,
+    обратно возвращаются обычные словари и списки.
+
+    Аргументы:
+        function (Callable): Функция уровня модуля, например extract_article.
+        *args: Аргументы функции.
+        source (str): Источник для метрики времени разбора; None — имя модуля функции.
+
+    Возвращает:
+        Результат функции.
+    """
+    executor = get_parse_executor()
+    started = time.perf_counter()
+    try:
+        if executor is None:
+            return function(*args)
+        return await asyncio.get_running_loop().run_in_executor(executor, function, *args)
+    except BrokenProcessPool:
+        parser_logger.error("Parse worker pool is broken, restarting it")
+        shutdown_parse_executor()
+        raise
+    finally:
+        PARSE_DURATION.observe(
+            time.perf_counter() - started,
+            source=source or function.__module__.rsplit(".", 1)[-1],
+            function=function.__name__,
+        )
+
+
+def shutdown_parse_executor():
+    """Останавливает пул процессов разбора HTML, если он был запущен."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
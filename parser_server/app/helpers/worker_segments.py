@@ -0,0 +1,58 @@
+import csv
+import os
+import time
+from pathlib import Path
+from typing import Dict, List
+from settings.constants import NEWS_COLUMNS
+from settings.paths import WORKER_SEGMENTS_DIR_PATH
+
+# В режиме нескольких воркеров каждый воркер пишет пакеты статей в свой каталог
+# shared_data/worker_segments/<worker_id>/ отдельными CSV файлами. Файл сначала
+# пишется под временным именем и переименовывается целиком, поэтому процесс
+# слияния видит только полностью записанные пакеты. Имена начинаются со времени
+# записи в наносекундах, так что сортировка по имени сохраняет порядок пакетов.
+
+SEGMENT_SUFFIX = ".csv"
+TEMP_SUFFIX = ".tmp"
+
+
+def write_worker_segment(worker_id: str, articles: List[Dict[str, str]], segments_dir=WORKER_SEGMENTS_DIR_PATH) -> Path:
+    """
+    Записывает пакет статей воркера в новый сегмент.
+
+    Аргументы:
+        worker_id (str): Имя воркера.
+        articles (list): Статьи с ключами из NEWS_COLUMNS.
+        segments_dir (Path): Каталог сегментов всех воркеров.
+
+    Возвращает:
+        Path: Путь к записанному сегменту.
+    """
+    worker_dir = Path(segments_dir) / worker_id
+    worker_dir.mkdir(parents=True, exist_ok=True)
+    path = worker_dir / f"{time.time_ns():020d}-{worker_id}{SEGMENT_SUFFIX}"
+    temp_path = path.with_suffix(TEMP_SUFFIX)
+
+    with open(temp_path, mode="w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(NEWS_COLUMNS)
+        for article in articles:
+            writer.writerow([article.get(column, "") for column in NEWS_COLUMNS])
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, path)
+    return path
+
+
+def list_worker_segments(segments_dir=WORKER_SEGMENTS_DIR_PATH) -> List[Path]:
+    """Возвращает записанные сегменты всех воркеров в порядке записи."""
+    segments_dir = Path(segments_dir)
+    if not segments_dir.exists():
+        return []
+    return sorted(segments_dir.glob(f"*/*{SEGMENT_SUFFIX}"), key=lambda path: path.name)
+
+
+def read_worker_segment(path) -> List[Dict[str, str]]:
+    """Читает статьи из сегмента воркера."""
+    with open(path, mode="r", encoding="utf-8", newline="") as file:
+        return list(csv.DictReader(file))
@@ -0,0 +1,101 @@
+import asyncio
+import os
+from functools import partial
+from typing import Callable, Optional
+from settings.constants import MERGE_INTERVAL, LEASE_RENEW_INTERVAL
+from settings.logger_setup import parser_logger
+from settings.paths import DATA_FILE_PATH
+from app.helpers.leases import LeaseManager
+from app.helpers.worker_segments import list_worker_segments, read_worker_segment
+from app.metrics_server import start_metrics_server
+from app.data_server import start_data_server
+from app.write_news_to_csv import write_news_to_csv
+
+MERGER_LEASE = "merger"
+
+
+def merge_worker_segments(file_path = DATA_FILE_PATH, keep_lease: Optional[Callable[[], bool]] = None) -> int:
+    """
+    Переносит записанные сегменты воркеров в датасет и удаляет их.
+
+    Каждый сегмент записывается через write_news_to_csv, то есть проходит ту же
+    проверку по индексу ссылок и поиск перепечаток, что и статьи однопроцессного
+    режима. Сегмент удаляется только после успешной записи; если запись не
+    удалась, слияние останавливается и сегмент (и все следующие) переносится при
+    следующем слиянии. Если процесс упадет между записью и удалением, статьи
+    сегмента будут отброшены как уже записанные.
+
+    Перед каждым сегментом вызывается keep_lease: он продлевает аренду слияния,
+    так что долгое слияние не теряет ее по LEASE_TTL, а если аренду уже забрал
+    другой процесс, слияние прекращается до записи.
+
+    Аргументы:
+        file_path (str): Путь к CSV файлу датасета.
+        keep_lease (Callable): Продлевает аренду слияния, False — аренда потеряна; None — без аренды.
+
+    Возвращает:
+        int: Число перенесенных сегментов.
+    """
+    merged = 0
+    for path in list_worker_segments():
+        if keep_lease is not None and not keep_lease():
+            parser_logger.warning("Merger lease lost, stopping the merge")
+            break
+        try:
+            articles = read_worker_segment(path)
+        except Exception as e:
+            parser_logger.error(f"Error reading worker segment {path}: {e}")
+            continue
+        if not write_news_to_csv(file_path, articles):
+            parser_logger.error(f"Worker segment {path} was not written, keeping it for the next merge")
+            break
+        os.remove(path)
+        merged += 1
+    if merged:
+        parser_logger.debug(f"Merged {merged} worker segments into the dataset")
+    return merged
+
+
+async def run_segment_merger(worker_id: str, file_path = DATA_FILE_PATH):
+    """
+    Процесс слияния для режима нескольких воркеров: единственный писатель датасета.
+
+    Слиянием занимается процесс, который держит аренду "merger", поэтому можно
+    запустить несколько таких процессов для отказоустойчивости. Держатель аренды
+    каждые MERGE_INTERVAL секунд переносит сегменты воркеров в датасет и отдает
+    датасет по HTTP (/data). Аренда продлевается перед записью каждого сегмента.
+    Обращения к SQLite аренды выполняются в пуле потоков.
+
+    Аргументы:
+        worker_id (str): Имя процесса для аренды.
+        file_path (str): Путь к CSV файлу датасета.
+    """
+    parser_logger.info(f"🟢 Segment merger {worker_id} started")
+    loop = asyncio.get_running_loop()
+    leases = await loop.run_in_executor(None, LeaseManager, worker_id)
+    metrics_runner = await start_metrics_server()
+    data_runner = None
+    try:
+        while True:
+            if not await loop.run_in_executor(None, leases.acquire, MERGER_LEASE):
+                if data_runner is not None:
+                    await data_runner.cleanup()
+                    data_runner = None
+                await asyncio.sleep(LEASE_RENEW_INTERVAL)
+                continue
+
+            if data_runner is None:
+                data_runner = await start_data_server(data_path=file_path)
+            try:
+                await loop.run_in_executor(
+                    None, merge_worker_segments, file_path, partial(leases.acquire, MERGER_LEASE)
+                )
+            except Exception as e:
+                parser_logger.exception(f"❌ Error merging worker segments: {e}")
+            await asyncio.sleep(MERGE_INTERVAL)
+    finally:
+        await loop.run_in_executor(None, leases.release, MERGER_LEASE)
+        if data_runner is not None:
+            await data_runner.cleanup()
+        if metrics_runner is not None:
+            await metrics_runner.cleanup()
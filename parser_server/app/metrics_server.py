@@ -0,0 +1,46 @@
+import asyncio
+from typing import Optional
+from aiohttp import web
+from settings.env_config import METRICS_PORT
+from settings.logger_setup import parser_logger
+from app.helpers.metrics import render_metrics
+
+
+async def handle_metrics(request: web.Request) -> web.Response:
+    # Функции Gauge обращаются к SQLite (очередь обхода) и могут ждать его
+    # блокировку, поэтому метрики собираются в пуле потоков, а не в цикле событий
+    text = await asyncio.get_running_loop().run_in_executor(None, render_metrics)
+    return web.Response(
+        text=text,
+        headers={"Content-Type": "text/plain; version=0.0.4; charset=utf-8"},
+    )
+
+
+async def start_metrics_server(port: int = METRICS_PORT, host: str = "0.0.0.0") -> Optional[web.AppRunner]:
+    """
+    Запускает HTTP сервер с эндпоинтом /metrics в текущем цикле событий.
+
+    Аргументы:
+        port (int): Порт сервера; 0 — сервер не запускается.
+        host (str): Адрес, на котором принимаются соединения.
+
+    Возвращает:
+        web.AppRunner: Запущенный сервер (для остановки через cleanup()).
+        None: Если сервер выключен или не удалось занять порт.
+    """
+    if port <= 0:
+        return None
+
+    app = web.Application()
+    app.router.add_get("/metrics", handle_metrics)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    try:
+        await web.TCPSite(runner, host, port).start()
+    except OSError as e:
+        parser_logger.error(f"Failed to start metrics server on port {port}: {e}")
+        await runner.cleanup()
+        return None
+
+    parser_logger.info(f"📈 Metrics available at http://{host}:{port}/metrics")
+    return runner
@@ -0,0 +1,178 @@
+import asyncio
+import sqlite3
+from functools import partial
+from aiohttp import ClientSession
+from typing import Awaitable, Callable, Dict, List, Optional
+from app.helpers.existing_articles import get_articles_index
+from app.helpers.extraction_rules import (
+    SourceRules,
+    extract_article,
+    extract_articles_in_category,
+    extract_categories,
+    get_rules,
+    get_source_rules,
+)
+from app.helpers.parse_workers import run_parse
+from app.helpers.adaptive_scheduler import get_scheduler
+from app.helpers.crawl_frontier import get_frontier
+from app.helpers.html_archive import archive_article_html
+from app.helpers.fetch_html import async_fetch_html, async_fetch_listing_html, is_transient_fetch_error
+from settings.logger_setup import parser_logger
+
+# Скраппер, общий для всех источников: что и откуда извлекать, описано в
+# правилах источника (app/news_scrappers/rules/<источник>.yaml), здесь —
+# только порядок обхода: категории, новые ссылки в категориях, статьи.
+
+
+async def frontier_call(function, *args, default=None):
+    """
+    Выполняет операцию с очередью обхода в пуле потоков.
+
+    Файл очереди общий для воркеров, и ожидание чужой блокировки не должно
+    останавливать цикл событий. Если блокировку так и не удалось получить,
+    ошибка записывается в лог и возвращается default: статья будет догружена
+    или записана позже, а обход источника продолжается.
+
+    Аргументы:
+        function (Callable): Метод CrawlFrontier.
+        *args: Аргументы метода.
+        default: Результат при ошибке SQLite.
+    """
+    try:
+        return await asyncio.get_running_loop().run_in_executor(None, function, *args)
+    except sqlite3.OperationalError as e:
+        parser_logger.warning(f"Crawl frontier {function.__name__} failed: {e}")
+        return default
+
+
+async def parse_categories(session: ClientSession, rules: SourceRules) -> List[Dict[str, str]]:
+    try:
+        html = await async_fetch_html(session, rules.url)
+        return await run_parse(extract_categories, rules.name, html, rules.url, source=rules.name)
+    except Exception as e:
+        parser_logger.error(f"Error parsing {rules.name} categories: {e}", exc_info=False)
+    return []
+
+
+async def parse_articles_in_category(session: ClientSession, rules: SourceRules, url: str) -> List[Dict[str, str]]:
+    existing_articles = get_articles_index()
+
+    try:
+        html = await async_fetch_listing_html(session, url)
+        if html is None:
+            parser_logger.debug(f"Category {url} not modified, skipping")
+            return []
+        articles = await run_parse(extract_articles_in_category, rules.name, html, url, source=rules.name)
+        return [article for article in articles if article["link"] not in existing_articles]
+    except Exception as e:
+        parser_logger.error(f"Error parsing articles in category {url}: {e}", exc_info=False)
+    return []
+
+
+async def parse_articles(session: ClientSession, rules: SourceRules, url: str, category: Optional[Dict[str, str]] = None, element: Optional[Dict[str, str]] = None) -> Optional[Dict[str, str]]:
+    """
+    Загружает статью и извлекает ее поля.
+
+    Возвращает:
+        dict: Поля статьи; пустой словарь, если статью не удалось загрузить или разобрать.
+        None: Если загрузка не удалась по временной причине (circuit breaker, таймаут,
+              429/5xx) — статью нужно загрузить позже, не засчитывая попытку.
+    """
+    try:
+        html = await async_fetch_html(session, url)
+    except Exception as e:
+        if is_transient_fetch_error(e):
+            parser_logger.debug(f"Article {url} postponed: {type(e).__name__}: {e}")
+            return None
+        parser_logger.error(f"Error fetching article {url}: {e}", exc_info=False)
+        return {}
+    try:
+        await archive_article_html(rules.name, url, html, category, element)
+        return await run_parse(extract_article, rules.name, html, url, source=rules.name)
+    except Exception as e:
+        parser_logger.error(f"Error parsing article {url}: {e}", exc_info=False)
+    return {}
+
+
+async def async_news_scrapper(source: str, session: ClientSession, queue: asyncio.Queue) -> int:
+    """
+    Выполняет один цикл обхода источника по его правилам.
+
+    Аргументы:
+        source (str): Название источника (name в файле правил).
+        session (ClientSession): HTTP сессия.
+        queue (asyncio.Queue): Очередь статей для записи.
+
+    Возвращает:
+        int: Число статей, переданных на запись.
+    """
+    rules = get_rules(source)
+    scheduler = get_scheduler()
+    frontier = get_frontier()
+    articles_count = 0
+
+    async def scrape_article(category: Dict[str, str], element: Dict[str, str]):
+        nonlocal articles_count
+        full_article = await parse_articles(session, rules, element["link"], category, element)
+        if full_article is None:
+            # Временная ошибка: статья остается pending до следующего цикла
+            return
+        if full_article:
+            single_article = {
+                "news_source_name": rules.name,
+                "news_source_link": rules.url,
+                "category_name": category["name"],
+                "category_link": category["link"],
+                "article_date": full_article.get("date", ""),
+                "article_link": element["link"],
+                # Если правила не извлекают заголовок со страницы статьи, он берется из списка
+                "article_title": full_article.get("title") or element.get("title") or "",
+                "article_text": full_article.get("text", ""),
+            }
+            await queue.put(single_article)
+            await frontier_call(frontier.mark_fetched, element["link"])
+            articles_count += 1
+        else:
+            await frontier_call(frontier.mark_failed, element["link"])
+
+    async def scrape_category(category: Dict[str, str]):
+        if not scheduler.category_due(category["link"]):
+            return
+        articles = await parse_articles_in_category(session, rules, category["link"])
+        scheduler.record_category(category["link"], len(articles))
+        # Если очередь недоступна, загружаются все новые ссылки категории
+        new_articles = await frontier_call(frontier.add_many, rules.name, category, articles, default=articles)
+        await asyncio.gather(*(scrape_article(category, element) for element in new_articles))
+
+    requeued = await frontier_call(frontier.requeue_failed, rules.name, default=0)
+    if requeued:
+        parser_logger.info(f"Requeued {requeued} failed {rules.name} articles after cooldown")
+    pending = await frontier_call(frontier.pending, rules.name, default=[])
+    if pending:
+        parser_logger.info(f"Resuming {len(pending)} pending {rules.name} articles from the crawl frontier")
+        await asyncio.gather(*(scrape_article(entry["category"], entry["article"]) for entry in pending))
+
+    categories = await parse_categories(session, rules)
+    if not categories:
+        parser_logger.warning(f"No {rules.name} categories found, aborting scraping.")
+        return articles_count
+
+    await asyncio.gather(*(scrape_category(category) for category in categories))
+
+    return articles_count
+
+
+def get_scrappers() -> Dict[str, Callable[[ClientSession, asyncio.Queue], Awaitable[int]]]:
+    """
+    Возвращает скрапперы всех источников, для которых есть файлы правил.
+
+    Правила загружаются и компилируются при первом вызове, поэтому ошибка в
+    файле правил видна сразу при запуске, а не при первом обходе источника.
+
+    Возвращает:
+        dict: Имя скраппера (scrapper_name) -> функция (session, queue) -> число статей.
+    """
+    return {
+        rules.scrapper_name: partial(async_news_scrapper, rules.name)
+        for rules in get_source_rules().values()
+    }
@@ -1,48 +1,159 @@
 import asyncio
-import aiohttp
+import time
+from typing import Optional
 
-from settings.constants import SLEEPING_TIME
+from settings.constants import SLEEPING_TIME, NEWS_QUEUE_SIZE, LEASE_RENEW_INTERVAL, LEASE_RETRY_INTERVAL
+from settings.env_config import WORKER_ID
 from settings.logger_setup import parser_logger
 from settings.paths import DATA_FILE_PATH
 from app.fetch_news_from_source import fetch_news_from_source
-from app.write_news_to_csv import write_news_to_csv
-from app.news_scrappers.rbk import async_rbk_news_scrapper
-from app.news_scrappers.lenta import async_lenta_news_scrapper
-from app.news_scrappers.ria import async_ria_news_scrapper
-from app.news_scrappers.gazeta import async_gazeta_news_scrapper
+from app.helpers.adaptive_scheduler import AdaptiveScheduler, get_scheduler, set_scheduler
+from app.helpers.crawl_frontier import get_frontier
+from app.helpers.existing_articles import ArticlesIndex, set_articles_index
+from app.helpers.leases import LeaseManager
+from app.helpers.worker_segments import write_worker_segment
+from app.helpers.metrics import CYCLE_ARTICLES, CYCLE_DURATION, FRONTIER_ARTICLES, NEXT_RUN_DELAY, QUEUE_DEPTH
+from app.helpers.http_session import get_session, close_session, get_session_stats
+from app.helpers.parse_workers import shutdown_parse_executor
+from app.metrics_server import start_metrics_server
+from app.data_server import start_data_server
+from app.write_news_to_csv import run_news_writer
+from app.news_scrappers.news_scrapper import get_scrappers
 
-SCRAPPERS = {
-    "RBK": async_rbk_news_scrapper,
-    "Lenta": async_lenta_news_scrapper,
-    "RIA": async_ria_news_scrapper,
-    "Gazeta": async_gazeta_news_scrapper,
-}
+# Источники описаны файлами правил в app/news_scrappers/rules; правила
+# компилируются при импорте, ошибка в них останавливает запуск
+SCRAPPERS = get_scrappers()
 
 
-async def run_scrapper_periodically(sleep_seconds: int = SLEEPING_TIME, data_path: str = DATA_FILE_PATH):
-    parser_logger.info("🟢 Scrapper process started")
+async def run_source_periodically(source_name: str, scrapper_function, queue: asyncio.Queue, leases: Optional[LeaseManager] = None):
+    """
+    Опрашивает один источник в собственном цикле с адаптивным интервалом.
+
+    В режиме нескольких воркеров перед каждым циклом захватывается (продлевается)
+    аренда источника; пока источник у другого воркера, цикл ждет. Если воркер
+    держит больше своей доли источников, после цикла он отпускает источник.
+    Обращения к SQLite аренды выполняются в пуле потоков, а не в цикле событий.
 
+    Аргументы:
+        source_name (str): Название источника.
+        scrapper_function: Асинхронная функция скраппера источника.
+        queue (asyncio.Queue): Общая очередь статей для записи.
+        leases (LeaseManager): Менеджер аренды; None — источник опрашивается без аренды.
+    """
+    scheduler = get_scheduler()
+    loop = asyncio.get_running_loop()
     while True:
         try:
-            parser_logger.info("🚀 Starting the scrapper...")
-            async with aiohttp.ClientSession() as session:
-                tasks = [
-                    asyncio.create_task(fetch_news_from_source(session, source_name, scrapper_function))
-                    for source_name, scrapper_function in SCRAPPERS.items()
-                ]
-                
-                with open(data_path, 'a', newline='', encoding='utf-8') as csvfile:
-                    for task in asyncio.as_completed(tasks):
-                        news = await task
-                        write_news_to_csv(DATA_FILE_PATH, news)
-
-            parser_logger.info("✅ Scraping completed")
-            parser_logger.info(f"🕒 Waiting for {sleep_seconds // 60} minutes until the next run...\n")
-            await asyncio.sleep(sleep_seconds)
+            if leases is not None and not await loop.run_in_executor(None, leases.acquire, source_name):
+                await asyncio.sleep(LEASE_RETRY_INTERVAL)
+                continue
+
+            parser_logger.info(f"🚀 Starting {source_name} scrapper...")
+            started = time.perf_counter()
+            articles_count = await fetch_news_from_source(get_session(), source_name, scrapper_function, queue)
+            CYCLE_DURATION.observe(time.perf_counter() - started, source=source_name)
+            CYCLE_ARTICLES.set(articles_count, source=source_name)
+            delay = scheduler.record_source(source_name, articles_count)
+            NEXT_RUN_DELAY.set(delay, source=source_name)
+
+            parser_logger.info(f"✅ {source_name}: scraping completed, {articles_count} new articles")
+            parser_logger.debug(f"Connection pool stats: {get_session_stats()}")
+            if leases is not None and await loop.run_in_executor(None, leases.over_share):
+                await loop.run_in_executor(None, leases.release, source_name)
+                await asyncio.sleep(LEASE_RETRY_INTERVAL)
+                continue
+            parser_logger.info(f"🕒 {source_name}: waiting for {delay / 60:.1f} minutes until the next run...")
+            await asyncio.sleep(delay)
 
         except Exception as e:
-            parser_logger.exception(f"❌ Error during scrapper execution: {e}")
-            parser_logger.info("🔄 Restarting the scrapper in 10 seconds...")
+            parser_logger.exception(f"❌ Error during {source_name} scrapper execution: {e}")
+            parser_logger.info(f"🔄 Restarting {source_name} scrapper in 10 seconds...")
             await asyncio.sleep(10)
 
 
+async def renew_leases_periodically(leases: LeaseManager):
+    """Продлевает аренды воркера каждые LEASE_RENEW_INTERVAL секунд."""
+    loop = asyncio.get_running_loop()
+    while True:
+        await asyncio.sleep(LEASE_RENEW_INTERVAL)
+        try:
+            held = await loop.run_in_executor(None, leases.renew)
+            parser_logger.debug(f"Worker {leases.worker_id} leases renewed: {held}")
+        except Exception as e:
+            parser_logger.error(f"Failed to renew leases: {e}")
+
+
+async def run_news_writer_supervised(queue: asyncio.Queue, data_path, write_batch=None):
+    """
+    Выполняет run_news_writer и перезапускает его, если он завершился с ошибкой.
+
+    Без записи очередь статей переполняется, и скрапперы навсегда останавливаются
+    на queue.put, поэтому задача записи не должна завершаться молча.
+    """
+    while True:
+        try:
+            await run_news_writer(queue, data_path, write_batch)
+            return
+        except Exception as e:
+            parser_logger.exception(f"❌ News writer failed: {e}")
+            parser_logger.info("🔄 Restarting news writer in 1 second...")
+            await asyncio.sleep(1)
+
+
+def write_news_to_worker_segment(batch):
+    try:
+        path = write_worker_segment(WORKER_ID, batch)
+        parser_logger.debug(f"Wrote {len(batch)} articles to worker segment {path.name}")
+    except Exception as e:
+        parser_logger.error(f"Error writing worker segment: {e}", exc_info=True)
+
+
+async def run_scrapper_periodically(sleep_seconds: int = SLEEPING_TIME, data_path: str = DATA_FILE_PATH):
+    parser_logger.info("🟢 Scrapper process started")
+
+    set_scheduler(AdaptiveScheduler(initial_interval=sleep_seconds))
+    queue = asyncio.Queue(maxsize=NEWS_QUEUE_SIZE)
+    QUEUE_DEPTH.set_function(queue.qsize)
+    FRONTIER_ARTICLES.set_function(get_frontier().get_counts)
+    metrics_runner = await start_metrics_server()
+
+    leases = None
+    data_runner = None
+    renew_task = None
+    if WORKER_ID:
+        # Воркер пишет пакеты в свои сегменты, датасет и индекс ссылок пополняет процесс слияния
+        parser_logger.info(f"👷 Running as worker {WORKER_ID}")
+        leases = await asyncio.get_running_loop().run_in_executor(None, LeaseManager, WORKER_ID, SCRAPPERS)
+        set_articles_index(ArticlesIndex(read_only=True))
+        renew_task = asyncio.create_task(renew_leases_periodically(leases))
+        writer_task = asyncio.create_task(run_news_writer_supervised(queue, data_path, write_news_to_worker_segment))
+    else:
+        data_runner = await start_data_server(data_path=data_path)
+        writer_task = asyncio.create_task(run_news_writer_supervised(queue, data_path))
+    source_tasks = [
+        asyncio.create_task(run_source_periodically(source_name, scrapper_function, queue, leases))
+        for source_name, scrapper_function in SCRAPPERS.items()
+    ]
+
+    try:
+        await asyncio.gather(*source_tasks)
+    finally:
+        for task in source_tasks:
+            task.cancel()
+        await asyncio.gather(*source_tasks, return_exceptions=True)
+        try:
+            # Дописываем статьи, которые уже стоят в очереди
+            if not writer_task.done():
+                await queue.put(None)
+                await writer_task
+        finally:
+            if renew_task is not None:
+                renew_task.cancel()
+            if leases is not None:
+                await asyncio.get_running_loop().run_in_executor(None, leases.release_all)
+            if metrics_runner is not None:
+                await metrics_runner.cleanup()
+            if data_runner is not None:
+                await data_runner.cleanup()
+            await close_session()
+            shutdown_parse_executor()
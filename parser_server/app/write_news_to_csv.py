@@ -1,62 +1,209 @@
 import os, csv
+import asyncio
+import sqlite3
+import threading
+import time
+from functools import partial
 from settings.logger_setup import parser_logger, system_logger
-from settings.paths import DATA_FILE_PATH
-from app.helpers.existing_articles import read_existing_articles
+from settings.paths import DATA_FILE_PATH, PARQUET_DIR_PATH, SEGMENTS_DIR_PATH
+from settings.constants import NEWS_COLUMNS, WRITE_BATCH_SIZE, WRITE_FLUSH_INTERVAL
+from settings.env_config import DATASET_FORMATS, NEAR_DUPLICATES_MODE
+from app.helpers.existing_articles import get_articles_index
+from app.helpers.crawl_frontier import get_frontier
 from app.helpers.formats import human_readable_size
-from settings.json_setup import update_json_file
-from datetime import datetime
+from app.helpers.dataset_stats import get_dataset_stats
+from app.helpers.metrics import ARTICLES, NEAR_DUPLICATES, WRITE_DURATION
+from app.helpers.near_duplicates import get_near_duplicate_index
+from app.helpers.parquet_dataset import write_news_to_parquet, get_parquet_dataset_size
+from app.helpers.dataset_segments import write_news_to_segments, get_segments_dataset_size
 
-def write_news_to_csv(file_path = DATA_FILE_PATH, total_news_list = []):
+# Держится на время дописывания пакета в CSV: под ней размер файла всегда
+# приходится на границу строк (используется HTTP API датасета)
+csv_write_lock = threading.Lock()
 
+
+def get_dataset_size(file_path = DATA_FILE_PATH):
+    """
+    Возвращает размер датасета в байтах для основного из включенных форматов.
+
+    Возвращает:
+        int: Размер датасета.
+        None: Если файлы датасета не найдены.
+    """
+    if "csv" in DATASET_FORMATS:
+        return os.path.getsize(file_path) if os.path.exists(file_path) else None
+    if "segments" in DATASET_FORMATS:
+        return get_segments_dataset_size() if os.path.exists(SEGMENTS_DIR_PATH) else None
+    return get_parquet_dataset_size() if os.path.exists(PARQUET_DIR_PATH) else None
+
+
+def filter_near_duplicates(articles, mode = NEAR_DUPLICATES_MODE):
+    """
+    Находит перепечатки уже записанных статей (MinHash/LSH).
+
+    Аргументы:
+        articles (list): Новые статьи пакета.
+        mode (str): "off" — не искать, "flag" — только отметить в индексе, "drop" — убрать из пакета.
+
+    Возвращает:
+        list: Статьи, которые нужно записать в датасет.
+    """
+    if mode not in ("flag", "drop") or not articles:
+        return articles
+
+    drop = mode == "drop"
+    try:
+        checked = get_near_duplicate_index().check_many(articles, drop=drop)
+    except Exception as e:
+        # Ошибка индекса не должна останавливать запись датасета
+        parser_logger.error(f"Near-duplicate check failed: {e}", exc_info=True)
+        return articles
+
+    kept = []
+    for article, match in checked:
+        if match is None:
+            kept.append(article)
+            continue
+
+        duplicate_of, duplicate_source, similarity = match
+        source = article.get("news_source_name", "")
+        NEAR_DUPLICATES.inc(source=source, duplicate_source=duplicate_source or "")
+        parser_logger.debug(
+            f"Near-duplicate ({similarity:.2f}): {article['article_link']} ~ {duplicate_of}"
+        )
+        if drop:
+            ARTICLES.inc(source=source, result="near_duplicate")
+        else:
+            kept.append(article)
+    return kept
+
+
+def write_news_to_csv(file_path = DATA_FILE_PATH, total_news_list = []) -> bool:
+    """
+    Записывает новые статьи пакета в датасет и пополняет индекс ссылок.
+
+    Ошибки записи не пробрасываются (пакет скрапперов не должен останавливать
+    запись), но по возвращаемому значению видно, дошел ли пакет до датасета.
+
+    Аргументы:
+        file_path (str): Путь к CSV файлу.
+        total_news_list (list): Статьи пакета.
+
+    Возвращает:
+        bool: True, если пакет записан (или записывать нечего), False при ошибке записи.
+    """
     if not total_news_list:
         parser_logger.debug(f"No news articles to write. Exiting function.")
-        return
-    
-    existing_articles = read_existing_articles(file_path)
+        return True
 
-    file_exists = os.path.exists(file_path)
-    new_articles_count = 0
+    started = time.perf_counter()
 
     try:
-        parser_logger.debug(f"Start writing news to CSV: {file_path}")
-        with open(file_path, mode="a", encoding="utf-8", newline="") as file:
-            writer = csv.writer(file)
-            if not file_exists or os.path.getsize(file_path) == 0:
-                writer.writerow([
-                    "news_source_name",
-                    "news_source_link",
-                    "category_name",
-                    "category_link",
-                    "article_date",
-                    "article_link",
-                    "article_title",
-                    "article_text",
-                ])
-
-            for article in total_news_list:
-                if article["article_link"] not in existing_articles:
-                    writer.writerow([
-                        article.get("news_source_name", ""),
-                        article.get("news_source_link", ""),
-                        article.get("category_name", ""),
-                        article.get("category_link", ""),
-                        article.get("article_date", ""),
-                        article.get("article_link", ""),
-                        article.get("article_title", ""),
-                        article.get("article_text", ""),
-                    ])
-                    existing_articles.add(article["article_link"])
-                    new_articles_count += 1
-        
-        parser_logger.debug(f"Finished writing to CSV. New articles added: {new_articles_count}")
-
-        if os.path.exists(file_path):
-                file_size = os.path.getsize(file_path)
-                readable_size = human_readable_size(file_size)
-                system_logger.info(f"📦 CSV файл обновлён — размер: {readable_size}")
-                update_json_file("dataset_size", readable_size)
-                update_json_file("dataset_last_update", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        # Ошибка индекса ссылок (поврежденный фильтр, SQLite) — такая же ошибка
+        # записи пакета, она не должна завершать задачу записи
+        existing_articles = get_articles_index()
+        written_links = set()
+        new_articles = []
+
+        for article in total_news_list:
+            link = article["article_link"]
+            if link not in existing_articles and link not in written_links:
+                new_articles.append(article)
+                written_links.add(link)
+            else:
+                ARTICLES.inc(source=article.get("news_source_name", ""), result="duplicate")
+
+        # Счетчики загружаются до записи: иначе при первом запуске они считаются
+        # по CSV, в котором уже есть этот пакет, и пакет учитывается дважды
+        dataset_stats = get_dataset_stats()
+
+        # Отброшенные перепечатки остаются в written_links, чтобы не загружать их снова
+        new_articles = filter_near_duplicates(new_articles)
+        for article in new_articles:
+            ARTICLES.inc(source=article.get("news_source_name", ""), result="new")
+
+        if "csv" in DATASET_FORMATS:
+            parser_logger.debug(f"Start writing news to CSV: {file_path}")
+            with csv_write_lock:
+                file_exists = os.path.exists(file_path)
+                with open(file_path, mode="a", encoding="utf-8", newline="") as file:
+                    writer = csv.writer(file)
+                    if not file_exists or os.path.getsize(file_path) == 0:
+                        writer.writerow(NEWS_COLUMNS)
+
+                    for article in new_articles:
+                        writer.writerow([article.get(column, "") for column in NEWS_COLUMNS])
+
+        if "parquet" in DATASET_FORMATS:
+            parser_logger.debug(f"Start writing news to Parquet: {PARQUET_DIR_PATH}")
+            write_news_to_parquet(new_articles)
+
+        if "segments" in DATASET_FORMATS:
+            parser_logger.debug(f"Start writing news to segments: {SEGMENTS_DIR_PATH}")
+            write_news_to_segments(new_articles)
+
+        existing_articles.add_many(written_links)
+        try:
+            get_frontier().remove_many(article["article_link"] for article in total_news_list)
+        except sqlite3.OperationalError as e:
+            # Пакет уже в датасете; оставшиеся в очереди статьи отсеются по индексу ссылок
+            parser_logger.warning(f"Failed to remove written articles from the crawl frontier: {e}")
+        parser_logger.debug(f"Finished writing news. New articles added: {len(new_articles)}")
+
+        WRITE_DURATION.observe(time.perf_counter() - started)
+        file_size = get_dataset_size(file_path)
+        dataset_stats.record_batch(new_articles, file_size)
+        if file_size is not None:
+                system_logger.info(f"📦 Датасет обновлён — размер: {human_readable_size(file_size)}")
         else:
-                system_logger.warning("⚠️ CSV файл не найден после выполнения скраппера")
+                system_logger.warning("⚠️ Файл датасета не найден после выполнения скраппера")
     except Exception as e:
-        parser_logger.error(f"Error writing to CSV file: {e}", exc_info=True)
\ No newline at end of file
+        parser_logger.error(f"Error writing news dataset: {e}", exc_info=True)
+        return False
+    return True
+
+
+async def run_news_writer(queue: asyncio.Queue, file_path = DATA_FILE_PATH, write_batch = None):
+    """
+    Забирает статьи из очереди и пакетами записывает их в датасет.
+
+    Пакет записывается, когда в нем набирается WRITE_BATCH_SIZE статей или через
+    WRITE_FLUSH_INTERVAL секунд после первой статьи пакета. Запись выполняется в
+    пуле потоков, чтобы не блокировать цикл событий. None в очереди завершает работу.
+
+    Аргументы:
+        queue (asyncio.Queue): Очередь статей от скрапперов.
+        file_path (str): Путь к CSV файлу.
+        write_batch (Callable): Функция записи пакета вместо write_news_to_csv(file_path, batch),
+            например запись в сегмент воркера.
+    """
+    if write_batch is None:
+        write_batch = partial(write_news_to_csv, file_path)
+
+    loop = asyncio.get_running_loop()
+    finished = False
+
+    while not finished:
+        article = await queue.get()
+        if article is None:
+            break
+
+        batch = [article]
+        deadline = loop.time() + WRITE_FLUSH_INTERVAL
+        while len(batch) < WRITE_BATCH_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                article = await asyncio.wait_for(queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            if article is None:
+                finished = True
+                break
+            batch.append(article)
+
+        try:
+            await loop.run_in_executor(None, write_batch, batch)
+        except Exception as e:
+            parser_logger.error(f"Error writing a batch of {len(batch)} articles: {e}", exc_info=True)
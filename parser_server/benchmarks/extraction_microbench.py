@@ -0,0 +1,227 @@
+"""
+Микробенчмарки функций извлечения данных скрапперов.
+
+Для каждого движка разбора, источника и функции правил (extract_categories,
+extract_articles_in_category, extract_article — чистая CPU часть parse_*)
+многократно разбирает HTML фикстуры и печатает распределение времени одного
+вызова (min/p50/p95/p99/max) и пик выделенной памяти (tracemalloc). Результат
+можно сохранить как эталон и сравнивать с ним последующие запуски.
+
+Запуск (из каталога parser_server):
+    python -m benchmarks.extraction_microbench [--repeat 200] [--backend lxml] [--source ria]
+        [--save-baseline bench.json] [--baseline bench.json --threshold 0.1]
+        [--fixtures-dir recorded_pages]
+
+По умолчанию замеры идут на синтетических фикстурах из fixtures/; эталон для
+оценки на реальной разметке строится по каталогу записанных страниц
+(--fixtures-dir) с той же структурой: <источник>/main.html, category.html, article.html.
+"""
+import argparse
+import gc
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Dict, List
+from app.helpers import extraction_rules
+from app.helpers.html_parser import (
+    PARSER_BACKENDS,
+    get_parser_backend,
+    is_parser_backend_available,
+    set_parser_backend,
+)
+from utils.parser_parity_check import FIXTURE_SOURCES, FIXTURES_DIR, read_fixture
+
+EXTRACT_FUNCTIONS = ("extract_categories", "extract_articles_in_category", "extract_article")
+
+# Сколько вызовов выполняется под tracemalloc (он сильно замедляет код)
+ALLOCATION_CALLS = 5
+
+
+def _fixture_call(source: str, function_name: str, fixtures_dir=FIXTURES_DIR):
+    main_url, category_url, article_url = FIXTURE_SOURCES[source]
+    function = getattr(extraction_rules, function_name)
+    if function_name == "extract_categories":
+        args = (source, read_fixture(source, "main", fixtures_dir), main_url)
+    elif function_name == "extract_articles_in_category":
+        args = (source, read_fixture(source, "category", fixtures_dir), category_url)
+    else:
+        args = (source, read_fixture(source, "article", fixtures_dir), article_url)
+    return function, args
+
+
+def _percentile(sorted_values: List[float], share: float) -> float:
+    index = min(len(sorted_values) - 1, int(round(share * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def measure(function, args, repeat: int, warmup: int) -> Dict[str, float]:
+    """
+    Измеряет время одного вызова функции и пик выделенной за вызов памяти.
+
+    Аргументы:
+        function (Callable): Функция извлечения.
+        args (tuple): Аргументы функции.
+        repeat (int): Число замеряемых вызовов.
+        warmup (int): Число вызовов до замеров.
+
+    Возвращает:
+        dict: Время вызова в микросекундах (min, p50, p95, p99, max, mean) и
+              пик памяти за вызов в байтах (alloc_peak).
+    """
+    for _ in range(warmup):
+        function(*args)
+
+    timings = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            started = time.perf_counter_ns()
+            function(*args)
+            timings.append((time.perf_counter_ns() - started) / 1000)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    peaks = []
+    tracemalloc.start()
+    try:
+        for _ in range(ALLOCATION_CALLS):
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            function(*args)
+            peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        tracemalloc.stop()
+
+    timings.sort()
+    return {
+        "calls": repeat,
+        "min": timings[0],
+        "p50": _percentile(timings, 0.50),
+        "p95": _percentile(timings, 0.95),
+        "p99": _percentile(timings, 0.99),
+        "max": timings[-1],
+        "mean": statistics.fmean(timings),
+        "alloc_peak": max(peaks),
+    }
+
+
+def run_microbenchmarks(backends, sources, functions, repeat: int, warmup: int, fixtures_dir=FIXTURES_DIR) -> Dict[str, Dict[str, float]]:
+    """
+    Запускает замеры для всех сочетаний движка, источника и функции.
+
+    Аргументы:
+        fixtures_dir (Path): Каталог страниц источников (<источник>/<страница>.html).
+
+    Возвращает:
+        dict: "движок/источник/функция" -> результат measure() или {"error": ...}.
+    """
+    initial_backend = get_parser_backend()
+    results = {}
+    try:
+        for backend in backends:
+            set_parser_backend(backend)
+            for source in sources:
+                for function_name in functions:
+                    key = f"{backend}/{source}/{function_name}"
+                    function, args = _fixture_call(source, function_name, fixtures_dir)
+                    try:
+                        results[key] = measure(function, args, repeat, warmup)
+                    except Exception as e:
+                        results[key] = {"error": f"{type(e).__name__}: {e}"}
+    finally:
+        set_parser_backend(initial_backend)
+    return results
+
+
+def compare_with_baseline(results, baseline, threshold: float) -> List[str]:
+    """
+    Сравнивает медианное время вызова с эталоном.
+
+    Аргументы:
+        results (dict): Текущие результаты.
+        baseline (dict): Сохраненные результаты.
+        threshold (float): Допустимое замедление, доля (0.1 — 10%).
+
+    Возвращает:
+        list: Ключи замеров, которые стали медленнее больше чем на threshold.
+    """
+    regressions = []
+    print(f"\n{'benchmark':<55} {'base p50':>10} {'p50':>10} {'delta':>8}")
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if not previous or "error" in previous or "error" in current:
+            continue
+        delta = current["p50"] / previous["p50"] - 1
+        flag = ""
+        if delta > threshold:
+            flag = "  REGRESSION"
+            regressions.append(key)
+        print(f"{key:<55} {previous['p50']:>10.1f} {current['p50']:>10.1f} {delta:>+7.1%}{flag}")
+    return regressions
+
+
+def print_results(results):
+    print(f"{'benchmark':<55} {'min':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>9} {'alloc KiB':>10}")
+    for key, result in results.items():
+        if "error" in result:
+            print(f"{key:<55} error: {result['error']}")
+            continue
+        print(
+            f"{key:<55} {result['min']:>8.1f} {result['p50']:>8.1f} {result['p95']:>8.1f} "
+            f"{result['p99']:>8.1f} {result['max']:>9.1f} {result['alloc_peak'] / 1024:>10.1f}"
+        )
+    print("(time per call in microseconds)")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Extraction microbenchmarks over HTML fixtures")
+    parser.add_argument("--repeat", type=int, default=200, help="measured calls per benchmark")
+    parser.add_argument("--warmup", type=int, default=10, help="calls before measuring")
+    parser.add_argument("--backend", action="append", choices=PARSER_BACKENDS, help="parser backend (default: all installed)")
+    parser.add_argument("--source", action="append", choices=sorted(FIXTURE_SOURCES), help="source (default: all)")
+    parser.add_argument("--function", action="append", choices=EXTRACT_FUNCTIONS, help="function (default: all)")
+    parser.add_argument("--fixtures-dir", default=str(FIXTURES_DIR), help="directory with source pages (default: synthetic fixtures)")
+    parser.add_argument("--save-baseline", help="save results as a baseline JSON file")
+    parser.add_argument("--baseline", help="compare with a baseline JSON file")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed p50 slowdown vs baseline")
+    args = parser.parse_args()
+
+    sources = args.source or list(FIXTURE_SOURCES)
+    missing = [
+        f"{source}/{page}.html"
+        for source in sources
+        for page in ("main", "category", "article")
+        if not os.path.isfile(os.path.join(args.fixtures_dir, source, f"{page}.html"))
+    ]
+    if missing:
+        parser.error(f"missing pages in {args.fixtures_dir}: {', '.join(missing)}")
+
+    backends = args.backend or [b for b in PARSER_BACKENDS if is_parser_backend_available(b)]
+    results = run_microbenchmarks(
+        backends, sources, args.function or list(EXTRACT_FUNCTIONS),
+        args.repeat, args.warmup, args.fixtures_dir,
+    )
+    print_results(results)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=4)
+        print(f"\nBaseline saved to {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = compare_with_baseline(results, json.load(f), args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} benchmark(s) slower than baseline by more than {args.threshold:.0%}")
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,246 @@
+"""
+Сквозной бенчмарк скрапперов без доступа к сети.
+
+Запускает сервер-заглушку (benchmarks/stand_in_site.py) в отдельном процессе,
+перенаправляет на него все запросы скрапперов из SCRAPPERS и выполняет один
+цикл сбора со всеми источниками и записью датасета во временный каталог данных.
+Печатает число статей, статьи/сек, время цикла, пиковый RSS и записанные байты.
+
+Запуск (из каталога parser_server):
+    python -m benchmarks.scrapper_throughput [--latency-ms 50] [--error-rate 0.02] [--copies 10]
+        [--sources lenta,ria] [--rate-limit 0] [--output result.json]
+
+Переменные окружения (PARSER_BACKEND, PARSE_WORKERS, DATASET_FORMAT и т.д.)
+действуют так же, как при обычном запуске.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import resource
+import socket
+import sys
+import tempfile
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+from benchmarks.stand_in_site import FIXTURES_DIR, SITE_HOSTS, serve_stand_in_site
+
+
+class StandInSession:
+    """
+    Обертка над aiohttp.ClientSession, отправляющая запросы к сайтам на сервер-заглушку.
+
+    https://lenta.ru/rubrics/world/ превращается в http://127.0.0.1:<port>/lenta.ru/rubrics/world/;
+    семафоры, ограничители частоты и circuit breaker по-прежнему считаются по исходному хосту.
+    """
+
+    def __init__(self, session, base_url: str):
+        self.session = session
+        self.base_url = base_url.rstrip("/")
+
+    def get(self, url, **kwargs):
+        parts = urlsplit(url)
+        target = f"{self.base_url}/{parts.netloc}{parts.path or '/'}"
+        if parts.query:
+            target += f"?{parts.query}"
+        return self.session.get(target, **kwargs)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _dir_size(path) -> int:
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            total += os.path.getsize(os.path.join(root, name))
+    return total
+
+
+async def run_benchmark_cycle(base_url: str, sources, rate_limit=None):
+    """
+    Выполняет один цикл сбора всеми источниками через сервер-заглушку.
+
+    Аргументы:
+        base_url (str): Адрес сервера-заглушки.
+        sources (list): Названия источников из SCRAPPERS.
+        rate_limit (float): Запросов в секунду на хост; None — как в настройках, 0 — без ограничения.
+
+    Возвращает:
+        dict: Статьи от скрапперов, записанные статьи и время цикла.
+    """
+    # Импорт здесь: настройки путей читаются при импорте, а DATA_DIR задается в main()
+    from app.fetch_news_from_source import fetch_news_from_source
+    from app.helpers.existing_articles import get_articles_index
+    from app.helpers.fetch_html import get_host_rate_limiter
+    from app.helpers.http_session import close_session, get_session
+    from app.helpers.parse_workers import shutdown_parse_executor
+    from app.run_scrapper_periodically import SCRAPPERS
+    from app.write_news_to_csv import run_news_writer
+    from settings.constants import NEWS_QUEUE_SIZE
+    from settings.paths import DATA_FILE_PATH
+
+    if rate_limit is not None:
+        for host in SITE_HOSTS:
+            bucket = get_host_rate_limiter(f"https://{host}/")
+            if rate_limit > 0:
+                bucket.rate = rate_limit
+            else:
+                bucket.rate = bucket.capacity = bucket.tokens = 1e9
+
+    index = get_articles_index()
+    rows_before = len(index)
+    session = StandInSession(get_session(), base_url)
+    queue = asyncio.Queue(maxsize=NEWS_QUEUE_SIZE)
+
+    started = time.perf_counter()
+    writer_task = asyncio.create_task(run_news_writer(queue, DATA_FILE_PATH))
+    try:
+        counts = await asyncio.gather(*(
+            fetch_news_from_source(session, source_name, SCRAPPERS[source_name], queue)
+            for source_name in sources
+        ))
+        await queue.put(None)
+        await writer_task
+    finally:
+        writer_task.cancel()
+        wall_time = time.perf_counter() - started
+        await close_session()
+        shutdown_parse_executor()
+
+    return {
+        "articles_by_source": dict(zip(sources, counts)),
+        "articles_scraped": sum(counts),
+        "articles_written": len(index) - rows_before,
+        "wall_time_s": wall_time,
+    }
+
+
+def run_benchmark(args) -> dict:
+    """
+    Запускает сервер-заглушку и цикл сбора, собирает результаты замеров.
+
+    Аргументы:
+        args (argparse.Namespace): Параметры командной строки.
+
+    Возвращает:
+        dict: Параметры запуска и результаты замеров.
+    """
+    data_dir = Path(os.environ["DATA_DIR"])
+    port = _free_port()
+    ctx = multiprocessing.get_context("spawn")
+    ready = ctx.Event()
+    server = ctx.Process(
+        target=serve_stand_in_site,
+        args=(port, ready, args.pages_dir),
+        kwargs={
+            "latency": args.latency_ms / 1000,
+            "jitter": args.jitter,
+            "error_rate": args.error_rate,
+            "copies": args.copies,
+            "seed": args.seed,
+        },
+        daemon=True,
+    )
+    server.start()
+    try:
+        if not ready.wait(timeout=30):
+            raise RuntimeError("Stand-in site did not start")
+        base_url = f"http://127.0.0.1:{port}"
+
+        from app.run_scrapper_periodically import SCRAPPERS
+        from app.write_news_to_csv import get_dataset_size
+        from utils.prelaunch_check import prelaunch_check
+
+        if not prelaunch_check():
+            raise RuntimeError(f"Failed to prepare data directory {data_dir}")
+        sources = args.sources.split(",") if args.sources else list(SCRAPPERS)
+        unknown = [source for source in sources if source not in SCRAPPERS]
+        if unknown:
+            raise ValueError(f"Unknown sources: {unknown}; expected {list(SCRAPPERS)}")
+
+        result = asyncio.run(run_benchmark_cycle(base_url, sources, args.rate_limit))
+
+        async def fetch_site_stats():
+            from aiohttp import ClientSession
+
+            async with ClientSession() as session:
+                async with session.get(f"{base_url}/__stats") as response:
+                    return await response.json()
+
+        result["site"] = asyncio.run(fetch_site_stats())
+    finally:
+        server.terminate()
+        server.join()
+
+    result["articles_per_s"] = result["articles_written"] / result["wall_time_s"] if result["wall_time_s"] else 0.0
+    # ru_maxrss в Linux — в килобайтах; процессы пула разбора сюда не входят
+    result["peak_rss_bytes"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    result["dataset_bytes"] = get_dataset_size() or 0
+    result["bytes_written"] = _dir_size(data_dir)
+    result["config"] = {
+        "latency_ms": args.latency_ms,
+        "jitter": args.jitter,
+        "error_rate": args.error_rate,
+        "copies": args.copies,
+        "rate_limit": args.rate_limit,
+        "sources": sources,
+        "parser_backend": os.environ.get("PARSER_BACKEND", "lxml"),
+        "parse_workers": int(os.environ.get("PARSE_WORKERS", "0")),
+        "dataset_format": os.environ.get("DATASET_FORMAT", "csv"),
+    }
+    return result
+
+
+def print_report(result: dict):
+    mb = 1024 * 1024
+    site = result["site"]
+    print(f"sources:          {', '.join(f'{k}={v}' for k, v in result['articles_by_source'].items())}")
+    print(f"articles:         {result['articles_written']} written / {result['articles_scraped']} scraped")
+    print(f"cycle wall time:  {result['wall_time_s']:.2f} s")
+    print(f"throughput:       {result['articles_per_s']:.1f} articles/s")
+    print(f"peak RSS:         {result['peak_rss_bytes'] / mb:.1f} MiB")
+    print(f"bytes written:    {result['bytes_written'] / mb:.2f} MiB (dataset {result['dataset_bytes'] / mb:.2f} MiB)")
+    print(f"site requests:    {site['requests']} ({site['errors']} injected errors, {site['bytes'] / mb:.2f} MiB served)")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Offline end-to-end scrapper throughput benchmark")
+    parser.add_argument("--latency-ms", type=float, default=50, help="mean response latency of the stand-in site")
+    parser.add_argument("--jitter", type=float, default=0.5, help="latency jitter as a fraction of the mean")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests answered with 503")
+    parser.add_argument("--copies", type=int, default=10, help="how many times category pages are multiplied")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--sources", default="", help="comma-separated SCRAPPERS names (default: all)")
+    parser.add_argument("--rate-limit", type=float, default=None, help="requests/s per host; 0 disables the limit")
+    parser.add_argument("--pages-dir", default=str(FIXTURES_DIR), help="directory with source pages (default: synthetic fixtures)")
+    parser.add_argument("--data-dir", default="", help="dataset directory (default: a temporary one)")
+    parser.add_argument("--output", default="", help="write the result as JSON to this file")
+    parser.add_argument("--verbose", action="store_true", help="keep scrapper logs on the console")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="news-bench-") as tmp_dir:
+        os.environ["DATA_DIR"] = args.data_dir or tmp_dir
+        if not args.verbose:
+            from settings.logger_setup import parser_logger, system_logger
+
+            parser_logger.setLevel(logging.WARNING)
+            system_logger.setLevel(logging.WARNING)
+
+        result = run_benchmark(args)
+
+    print_report(result)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=4, ensure_ascii=False)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
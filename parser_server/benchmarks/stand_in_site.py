@@ -0,0 +1,179 @@
+"""
+Локальный сервер-заглушка сайтов источников для бенчмарков.
+
+Отдает страницы lenta/ria/rbk/gazeta по адресам вида http://127.0.0.1:<port>/<host>/<path>:
+    /                — main.html источника;
+    путь без цифр    — category.html (страница категории);
+    путь с цифрами   — article.html (страница статьи).
+
+По умолчанию это синтетические фикстуры из fixtures/ (см. fixtures/README.md);
+для замеров на реальной разметке передайте каталог записанных страниц (pages_dir).
+
+Страница категории "размножается": содержимое <body> повторяется copies раз,
+и к последнему сегменту пути каждой ссылки добавляется уникальный суффикс
+(параметры запроса скрапперы отбрасывают при канонизации ссылок), поэтому в каждой категории
+оказывается в copies раз больше разных статей. Задержка ответа и доля ответов
+503 задаются параметрами.
+"""
+import asyncio
+import json
+import random
+import re
+from pathlib import Path
+from typing import Dict
+from aiohttp import web
+
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / "fixtures"
+
+# Хост сайта -> каталог страниц источника
+SITE_HOSTS = {
+    "lenta.ru": "lenta",
+    "ria.ru": "ria",
+    "www.rbc.ru": "rbk",
+    "www.gazeta.ru": "gazeta",
+}
+
+PAGES = ("main", "category", "article")
+
+# Ссылка: все до последнего сегмента, имя без расширения, расширение и слеш в конце
+_HREF_PATTERN = re.compile(r'href="([^"?#]*/)([^"/?#.]+)((?:\.[^"/?#]*)?)(/?)([^"]*)"')
+_BODY_PATTERN = re.compile(r"(<body[^>]*>)(.*)(</body>)", re.S | re.I)
+
+
+def load_pages(pages_dir=FIXTURES_DIR) -> Dict[str, Dict[str, str]]:
+    """
+    Читает страницы всех источников.
+
+    Аргументы:
+        pages_dir (Path): Каталог с подкаталогами источников и файлами main/category/article.html.
+
+    Возвращает:
+        dict: Источник -> {"main", "category", "article"} -> HTML.
+    """
+    pages_dir = Path(pages_dir)
+    return {
+        source: {page: (pages_dir / source / f"{page}.html").read_text(encoding="utf-8") for page in PAGES}
+        for source in SITE_HOSTS.values()
+    }
+
+
+def amplify_listing(html: str, tag: str, copies: int) -> str:
+    """
+    Повторяет содержимое <body> страницы категории copies раз с уникальными ссылками.
+
+    Суффикс добавляется к имени последнего сегмента пути: /news/budget/ -> /news/budget-bench-<tag>-<i>/.
+
+    Аргументы:
+        html (str): HTML страницы категории.
+        tag (str): Метка категории, добавляется к ссылкам, чтобы они не совпадали между категориями.
+        copies (int): Сколько раз повторить содержимое.
+
+    Возвращает:
+        str: HTML страницы категории.
+    """
+    match = _BODY_PATTERN.search(html)
+    if match is None:
+        return html
+
+    def with_suffix(body, suffix):
+        return _HREF_PATTERN.sub(
+            lambda m: f'href="{m.group(1)}{m.group(2)}-bench-{suffix}{m.group(3)}{m.group(4)}{m.group(5)}"', body
+        )
+
+    body = "".join(with_suffix(match.group(2), f"{tag}-{i}") for i in range(copies))
+    return html[:match.start(2)] + body + html[match.end(2):]
+
+
+def make_app(pages: Dict[str, Dict[str, str]], latency: float = 0.05, jitter: float = 0.5, error_rate: float = 0.0, copies: int = 10, seed: int = 0) -> web.Application:
+    """
+    Создает приложение сервера-заглушки.
+
+    Аргументы:
+        pages (dict): Страницы источников из load_pages.
+        latency (float): Средняя задержка ответа в секундах.
+        jitter (float): Разброс задержки, доля от latency.
+        error_rate (float): Доля запросов, на которые отвечается 503.
+        copies (int): Во сколько раз размножать страницы категорий.
+        seed (int): Зерно генератора случайных чисел.
+
+    Возвращает:
+        aiohttp.web.Application: Приложение; /__stats отдает счетчики запросов.
+    """
+    rng = random.Random(seed)
+    stats = {"requests": 0, "errors": 0, "bytes": 0, "main": 0, "category": 0, "article": 0}
+
+    async def handle_stats(request):
+        return web.json_response(stats)
+
+    async def handle_page(request):
+        source = SITE_HOSTS.get(request.match_info["host"])
+        if source is None:
+            raise web.HTTPNotFound()
+
+        stats["requests"] += 1
+        if latency > 0:
+            await asyncio.sleep(max(0.0, latency * (1 + rng.uniform(-jitter, jitter))))
+        if rng.random() < error_rate:
+            stats["errors"] += 1
+            raise web.HTTPServiceUnavailable()
+
+        path = "/" + request.match_info["path"]
+        if path == "/":
+            page = "main"
+            html = pages[source]["main"]
+        elif any(char.isdigit() for char in path):
+            page = "article"
+            html = pages[source]["article"]
+        else:
+            page = "category"
+            html = amplify_listing(pages[source]["category"], path.strip("/").replace("/", "-"), copies)
+
+        stats[page] += 1
+        body = html.encode("utf-8")
+        stats["bytes"] += len(body)
+        return web.Response(body=body, content_type="text/html", charset="utf-8")
+
+    app = web.Application()
+    app.router.add_get("/__stats", handle_stats)
+    app.router.add_get("/{host}/{path:.*}", handle_page)
+    return app
+
+
+def serve_stand_in_site(port: int, ready, pages_dir=FIXTURES_DIR, **options):
+    """
+    Запускает сервер-заглушку и работает, пока процесс не будет остановлен.
+
+    Предназначена для запуска в отдельном процессе, чтобы сервер не влиял на
+    замеры скраппера.
+
+    Аргументы:
+        port (int): Порт на 127.0.0.1.
+        ready (multiprocessing.Event): Устанавливается, когда сервер начал принимать запросы.
+        pages_dir (Path): Каталог страниц источников.
+        **options: Параметры make_app (latency, jitter, error_rate, copies, seed).
+    """
+    async def run():
+        runner = web.AppRunner(make_app(load_pages(pages_dir), **options), access_log=None)
+        await runner.setup()
+        await web.TCPSite(runner, "127.0.0.1", port).start()
+        ready.set()
+        await asyncio.Event().wait()
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    import argparse
+    import threading
+
+    parser = argparse.ArgumentParser(description="Serve recorded source pages locally")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency-ms", type=float, default=50)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--copies", type=int, default=10)
+    args = parser.parse_args()
+    print(json.dumps(vars(args)))
+    serve_stand_in_site(
+        args.port, threading.Event(),
+        latency=args.latency_ms / 1000, error_rate=args.error_rate, copies=args.copies,
+    )
@@ -1,5 +1,9 @@
 import asyncio
+import socket
+import sys
 from app.run_scrapper_periodically import run_scrapper_periodically
+from app.merge_worker_segments import run_segment_merger
+from settings.env_config import WORKER_ID
 from utils.prelaunch_check import prelaunch_check
 
 if __name__ == "__main__":    
@@ -7,4 +11,8 @@ if __name__ == "__main__":
     if not prelaunch_check():
         exit(1)
     
-    asyncio.run(run_scrapper_periodically())
\ No newline at end of file
+    # python main.py merge — процесс слияния сегментов воркеров (режим WORKER_ID)
+    if len(sys.argv) > 1 and sys.argv[1] == "merge":
+        asyncio.run(run_segment_merger(WORKER_ID or f"merger-{socket.gethostname()}"))
+    else:
+        asyncio.run(run_scrapper_periodically())
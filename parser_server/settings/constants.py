@@ -1,7 +1,112 @@
 SLEEPING_TIME = 600
 
+# Границы адаптивного интервала опроса источников и категорий (секунды)
+SCHEDULER_MIN_INTERVAL = 120
+SCHEDULER_MAX_INTERVAL = 3600
+# Во сколько раз меняется интервал, если новые статьи были / не были найдены
+SCHEDULER_SPEEDUP = 0.5
+SCHEDULER_SLOWDOWN = 1.5
+# Случайный разброс интервала, доля от интервала
+SCHEDULER_JITTER = 0.1
+
+# Максимальное число одновременных запросов к одному хосту
+HOST_CONCURRENCY_LIMIT = 8
+
+# Token bucket на хост: запросов в секунду и допустимый всплеск
+HOST_RATE_LIMIT = 5
+HOST_RATE_BURST = 10
+
+# Повторы запросов при 429/5xx/таймаутах: число повторов и экспоненциальная задержка (секунды)
+FETCH_MAX_RETRIES = 3
+FETCH_BACKOFF_BASE = 1
+FETCH_BACKOFF_MAX = 30
+
+# Circuit breaker: после стольких неудач подряд хост пропускается на время COOLDOWN (секунды)
+CIRCUIT_BREAKER_THRESHOLD = 5
+CIRCUIT_BREAKER_COOLDOWN = 300
+
+# Настройки пула HTTP соединений, общего для всех циклов скраппера
+CONNECTION_POOL_LIMIT = 100
+DNS_CACHE_TTL = 600
+KEEPALIVE_TIMEOUT = 60
+REQUEST_TIMEOUT = 30
+
+# Фильтр Блума перед индексом ссылок: емкость первого слоя и доля ложных срабатываний
+# (следующие слои вдвое больше, общая доля не превышает удвоенной)
+SEEN_FILTER_INITIAL_CAPACITY = 1_000_000
+SEEN_FILTER_ERROR_RATE = 0.001
+
+# Сколько раз статья из очереди обхода загружается, прежде чем будет помечена как failed
+FRONTIER_MAX_ATTEMPTS = 3
+# Через сколько секунд статья со статусом failed снова ставится в очередь обхода
+FRONTIER_FAILED_COOLDOWN = 24 * 60 * 60
+# После стольких неудачных попыток за все время статья больше не ставится в очередь
+# (статус dropped), а через FRONTIER_DROPPED_RETENTION секунд удаляется из нее
+FRONTIER_MAX_TOTAL_ATTEMPTS = 4 * FRONTIER_MAX_ATTEMPTS
+FRONTIER_DROPPED_RETENTION = 30 * 24 * 60 * 60
+
+# Поиск почти одинаковых статей (MinHash/LSH): длина шингла в словах, длина сигнатуры,
+# полос LSH (NEAR_DUPLICATE_SIGNATURE_SIZE делится на них без остатка), порог сходства Жаккара
+# и сколько дней статья хранится в индексе
+NEAR_DUPLICATE_SHINGLE_SIZE = 5
+NEAR_DUPLICATE_SIGNATURE_SIZE = 128
+NEAR_DUPLICATE_BANDS = 16
+NEAR_DUPLICATE_THRESHOLD = 0.8
+NEAR_DUPLICATE_RETENTION_DAYS = 14
+# Через сколько проверенных пакетов из индекса удаляются статьи старше срока хранения
+NEAR_DUPLICATE_PRUNE_EVERY = 100
+# Сколько кандидатов из корзин LSH сравнивается с одной статьей. Ограничение держит
+# проверку статьи за постоянное время: популярная новость агентства может попасть в
+# корзины сотен статей за срок хранения. Кандидаты берутся по числу общих полос,
+# поэтому отбрасываются наименее похожие; перепечатка с общим сходством не ниже
+# порога почти всегда делит с оригиналом большинство полос и попадает в их число
+NEAR_DUPLICATE_MAX_CANDIDATES = 50
+
+# Режим нескольких воркеров: срок аренды источника и интервал ее продления, пауза между
+# попытками захватить источник и интервал слияния сегментов воркеров в датасет (секунды)
+LEASE_TTL = 90
+LEASE_RENEW_INTERVAL = 30
+LEASE_RETRY_INTERVAL = 30
+MERGE_INTERVAL = 10
+
+# Очередь статей между скрапперами и записью в CSV
+NEWS_QUEUE_SIZE = 500
+WRITE_BATCH_SIZE = 100
+WRITE_FLUSH_INTERVAL = 5
+
 DATA_DIR_NAME = "shared_data"
 DATA_FILE_NAME = "news_data.csv"
+INDEX_FILE_NAME = "articles_index.sqlite"
+SEEN_FILTER_DIR_NAME = "articles_index_bloom"
+FRONTIER_FILE_NAME = "crawl_frontier.sqlite"
+NEAR_DUPLICATES_FILE_NAME = "near_duplicates.sqlite"
+HTML_ARCHIVE_DIR_NAME = "html_archive"
+LEASES_FILE_NAME = "leases.sqlite"
+WORKER_SEGMENTS_DIR_NAME = "worker_segments"
+HTML_ARCHIVE_INDEX_NAME = "archive.sqlite"
+PARQUET_DIR_NAME = "news_parquet"
+SEGMENTS_DIR_NAME = "news_segments"
+SEGMENTS_MANIFEST_NAME = "manifest.json"
+# Каталог правил извлечения источников (app/news_scrappers/rules)
+SCRAPPER_RULES_DIR_NAME = "rules"
+
+# Число файлов в разделе Parquet датасета, после которого они сливаются в один
+PARQUET_COMPACT_MIN_FILES = 16
+
+# Размер сжатого сегмента датасета, после которого начинается новый сегмент
+SEGMENT_MAX_BYTES = 64 * 1024 * 1024
+
+# Колонки датасета новостей
+NEWS_COLUMNS = [
+    "news_source_name",
+    "news_source_link",
+    "category_name",
+    "category_link",
+    "article_date",
+    "article_link",
+    "article_title",
+    "article_text",
+]
 
 LOGS_DIR_NAME = "parser"
 
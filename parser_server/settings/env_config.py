@@ -7,6 +7,47 @@ import os
 # DEPLOY_MODE = os.getenv("DEPLOY_MODE", "dev")
 DEPLOY_MODE = os.environ.get("DEPLOY_MODE", "dev").lower()
 
+# Прореживание DEBUG логов: из каждой строки кода пишется одна запись из N; 1 — писать все
+LOG_DEBUG_SAMPLING = max(1, int(os.environ.get("LOG_DEBUG_SAMPLING", "1")))
+
+# Каталог данных (датасет, индексы, info.json); по умолчанию shared_data в корне проекта
+DATA_DIR = os.environ.get("DATA_DIR", "")
+
+# Движок разбора HTML: "lxml", "html.parser" или "selectolax"
+PARSER_BACKEND = os.environ.get("PARSER_BACKEND", "lxml").lower()
+
+# Число процессов для разбора HTML; 0 — разбор прямо в цикле событий
+PARSE_WORKERS = int(os.environ.get("PARSE_WORKERS", "0"))
+
+# Форматы хранения датасета через запятую: "csv", "parquet", "segments"
+DATASET_FORMATS = {
+    dataset_format.strip()
+    for dataset_format in os.environ.get("DATASET_FORMAT", "csv").lower().split(",")
+    if dataset_format.strip()
+}
+
+# Сжатие сегментов датасета: "gzip" или "zstd"
+SEGMENT_COMPRESSION = os.environ.get("SEGMENT_COMPRESSION", "gzip").lower()
+
+# Сохранять HTML загруженных статей в архив (shared_data/html_archive): "1" — да
+HTML_ARCHIVE_ENABLED = os.environ.get("HTML_ARCHIVE", "0").lower() in ("1", "true", "yes")
+
+# Почти одинаковые статьи (перепечатки одной новости): "off" — не искать (по умолчанию),
+# "flag" — записывать, а пары сохранять в shared_data/near_duplicates.sqlite
+# (в самом датасете статьи не отмечаются), "drop" — не записывать
+NEAR_DUPLICATES_MODE = os.environ.get("NEAR_DUPLICATES", "off").lower()
+
+# Имя воркера в режиме нескольких воркеров (источники распределяются арендой в
+# shared_data/leases.sqlite, датасет собирает процесс "python main.py merge");
+# пусто — один процесс опрашивает все источники и сам пишет датасет
+WORKER_ID = os.environ.get("WORKER_ID", "").strip()
+
+# Порт HTTP эндпоинта метрик (/metrics, формат Prometheus); 0 — не запускать
+METRICS_PORT = int(os.environ.get("METRICS_PORT", "9100"))
+
+# Порт HTTP API датасета (/data), откуда его забирает сервер классификации; 0 — не запускать
+DATA_API_PORT = int(os.environ.get("DATA_API_PORT", "4040"))
+
 # SLEEPING_TIME = 600
 
 # # Называем директории
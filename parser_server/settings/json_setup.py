@@ -16,12 +16,16 @@ def initialize_json_file():
     except:
         return False
 
-def update_json_file(key, value):
-    """Обновляет значение по заданному ключу в JSON-файле."""
-    with open(JSON_DIR_PATH, 'r') as f:
-        json_info = json.load(f)
+def read_json_file():
+    """Читает JSON-файл целиком; возвращает пустой словарь, если файла нет."""
+    if not os.path.exists(JSON_DIR_PATH):
+        return {}
+    with open(JSON_DIR_PATH, 'r', encoding='utf-8') as f:
+        return json.load(f)
 
-    json_info[key] = value
-
-    with open(JSON_DIR_PATH, 'w', encoding='utf-8') as f:
-        json.dump(json_info, f, indent=4, ensure_ascii=False)
\ No newline at end of file
+def write_json_file(data):
+    """Атомарно перезаписывает JSON-файл: пишет во временный файл и заменяет им исходный."""
+    tmp_path = f"{JSON_DIR_PATH}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=4, ensure_ascii=False)
+    os.replace(tmp_path, JSON_DIR_PATH)
@@ -1,6 +1,9 @@
+import atexit
 import logging
-from logging.handlers import TimedRotatingFileHandler
-from settings.env_config import DEPLOY_MODE
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
+from settings.env_config import DEPLOY_MODE, LOG_DEBUG_SAMPLING
 from settings.paths import LOGS_DIR_PATH
 import os
 from datetime import datetime
@@ -11,32 +14,104 @@ class CustomFormatter(logging.Formatter):
             record.process_type = record.name
         return super().format(record)
 
-def setup_logger(name: str) -> logging.Logger:
-    LOGGING_LVL = "INFO" if DEPLOY_MODE == "prod" else "DEBUG"
-    log_directory = LOGS_DIR_PATH
+class DebugSamplingFilter(logging.Filter):
+    """
+    Пропускает каждую N-ю DEBUG запись из одного места вызова.
+
+    Первая запись из каждой строки кода проходит всегда, поэтому редкие
+    сообщения не теряются, а частые (по строке на статью) прореживаются.
+    Записи уровня INFO и выше не фильтруются.
+
+    Аргументы:
+        every (int): Пропускать одну запись из every.
+    """
+
+    def __init__(self, every: int):
+        super().__init__()
+        self.every = every
+        self.counters = {}
+        self.lock = threading.Lock()
+
+    def filter(self, record):
+        if record.levelno > logging.DEBUG:
+            return True
+        key = (record.pathname, record.lineno)
+        with self.lock:
+            count = self.counters.get(key, 0)
+            self.counters[key] = count + 1
+        return count % self.every == 0
+
+class RawQueueHandler(QueueHandler):
+    """
+    Кладет в очередь саму запись, не форматируя ее.
+
+    QueueHandler.prepare форматирует сообщение (вместе с трассировкой
+    исключения) в вызывающем потоке; здесь это делают обработчики в потоке
+    QueueListener. Очередь не покидает процесс, поэтому запись не нужно
+    готовить к сериализации.
+    """
+
+    def prepare(self, record):
+        return record
+
+# Запись в файл и в консоль выполняет фоновый поток QueueListener: логгеры
+# только кладут записи в очередь и не блокируют цикл событий на вводе-выводе
+_log_queue = queue.SimpleQueue()
+_listener = None
+_listener_lock = threading.Lock()
 
-    os.makedirs(log_directory, exist_ok=True)
-    current_date_str = datetime.now().strftime("%Y-%m-%d")
+def _start_listener():
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            return
+        log_directory = LOGS_DIR_PATH
 
-    log_filename = log_directory / f"parser_{current_date_str}.log"
+        os.makedirs(log_directory, exist_ok=True)
+        current_date_str = datetime.now().strftime("%Y-%m-%d")
 
-    log_format = "%(asctime)s - %(levelname)s - %(process_type)s - %(message)s"
-    formatter = CustomFormatter(log_format)
+        log_filename = log_directory / f"parser_{current_date_str}.log"
+
+        log_format = "%(asctime)s - %(levelname)s - %(process_type)s - %(message)s"
+        formatter = CustomFormatter(log_format)
+
+        file_handler = TimedRotatingFileHandler(
+            log_filename, when="midnight", backupCount=30, encoding='utf-8'
+        )
+        file_handler.setFormatter(formatter)
+
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(formatter)
+
+        _listener = QueueListener(_log_queue, file_handler, console_handler)
+        _listener.start()
+        # При выходе дописываем оставшиеся в очереди записи
+        atexit.register(stop_logging)
+
+def stop_logging():
+    """Останавливает фоновый поток логирования, записав все записи из очереди."""
+    global _listener
+    with _listener_lock:
+        if _listener is None:
+            return
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+def setup_logger(name: str) -> logging.Logger:
+    LOGGING_LVL = "INFO" if DEPLOY_MODE == "prod" else "DEBUG"
+    _start_listener()
 
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, LOGGING_LVL))
 
-    file_handler = TimedRotatingFileHandler(
-        log_filename, when="midnight", backupCount=30, encoding='utf-8'
-    )
-    file_handler.setFormatter(formatter)
-
-    console_handler = logging.StreamHandler()
-    console_handler.setFormatter(formatter)
+    queue_handler = RawQueueHandler(_log_queue)
+    if LOG_DEBUG_SAMPLING > 1:
+        queue_handler.addFilter(DebugSamplingFilter(LOG_DEBUG_SAMPLING))
 
     if not logger.handlers:
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+        logger.addHandler(queue_handler)
 
     logger.propagate = False
 
@@ -1,11 +1,24 @@
 from pathlib import Path
-from settings.constants import DATA_DIR_NAME, DATA_FILE_NAME, LOGS_DIR_NAME, JSON_FILE_NAME
+from settings.env_config import DATA_DIR
+from settings.constants import DATA_DIR_NAME, DATA_FILE_NAME, LOGS_DIR_NAME, JSON_FILE_NAME, INDEX_FILE_NAME, SEEN_FILTER_DIR_NAME, FRONTIER_FILE_NAME, NEAR_DUPLICATES_FILE_NAME, HTML_ARCHIVE_DIR_NAME, LEASES_FILE_NAME, WORKER_SEGMENTS_DIR_NAME, PARQUET_DIR_NAME, SEGMENTS_DIR_NAME, SCRAPPER_RULES_DIR_NAME
 
 BASE_PROJECT_DIR = Path(__file__).resolve().parent.parent.parent
+# Каталог parser_server (в контейнере — /app)
+BASE_DIR = Path(__file__).resolve().parent.parent
+SCRAPPER_RULES_DIR_PATH = BASE_DIR / "app" / "news_scrappers" / SCRAPPER_RULES_DIR_NAME
 
-DATA_DIR_PATH = BASE_PROJECT_DIR / DATA_DIR_NAME
-DATA_FILE_PATH = BASE_PROJECT_DIR / DATA_DIR_NAME / DATA_FILE_NAME
+DATA_DIR_PATH = Path(DATA_DIR) if DATA_DIR else BASE_PROJECT_DIR / DATA_DIR_NAME
+DATA_FILE_PATH = DATA_DIR_PATH / DATA_FILE_NAME
+INDEX_FILE_PATH = DATA_DIR_PATH / INDEX_FILE_NAME
+SEEN_FILTER_DIR_PATH = DATA_DIR_PATH / SEEN_FILTER_DIR_NAME
+FRONTIER_FILE_PATH = DATA_DIR_PATH / FRONTIER_FILE_NAME
+NEAR_DUPLICATES_FILE_PATH = DATA_DIR_PATH / NEAR_DUPLICATES_FILE_NAME
+HTML_ARCHIVE_DIR_PATH = DATA_DIR_PATH / HTML_ARCHIVE_DIR_NAME
+LEASES_FILE_PATH = DATA_DIR_PATH / LEASES_FILE_NAME
+WORKER_SEGMENTS_DIR_PATH = DATA_DIR_PATH / WORKER_SEGMENTS_DIR_NAME
+PARQUET_DIR_PATH = DATA_DIR_PATH / PARQUET_DIR_NAME
+SEGMENTS_DIR_PATH = DATA_DIR_PATH / SEGMENTS_DIR_NAME
 
 LOGS_DIR_PATH = BASE_PROJECT_DIR / "logs" / LOGS_DIR_NAME
 
-JSON_DIR_PATH = BASE_PROJECT_DIR / DATA_DIR_NAME / JSON_FILE_NAME
\ No newline at end of file
+JSON_DIR_PATH = DATA_DIR_PATH / JSON_FILE_NAME
\ No newline at end of file
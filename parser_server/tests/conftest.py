@@ -0,0 +1,10 @@
+import atexit
+import os
+import shutil
+import tempfile
+
+# Тесты пишут датасет, индексы и info.json во временный каталог, а не в shared_data.
+# Переменная задается до импорта settings, потому что пути вычисляются при импорте.
+_data_dir = tempfile.mkdtemp(prefix="parser_tests_")
+os.environ["DATA_DIR"] = _data_dir
+atexit.register(shutil.rmtree, _data_dir, ignore_errors=True)
@@ -0,0 +1,70 @@
+"""
+Очередь обхода: общий файл нескольких процессов и ограничение числа попыток.
+
+Запуск (из каталога parser_server):
+    python -m pytest tests/test_crawl_frontier.py
+"""
+import sqlite3
+import threading
+from app.helpers.crawl_frontier import CrawlFrontier, DROPPED, FAILED, FETCHED, PENDING
+from settings.constants import FRONTIER_MAX_ATTEMPTS, FRONTIER_MAX_TOTAL_ATTEMPTS
+
+CATEGORY = {"name": "Политика", "link": "https://example.org/politics/"}
+
+
+def _states(frontier):
+    return dict(frontier.connection.execute("SELECT article_link, state FROM frontier"))
+
+
+def test_reopening_resets_only_own_fetched_articles(tmp_path):
+    path = tmp_path / "frontier.sqlite"
+    first = CrawlFrontier(path, owner="worker-1")
+    second = CrawlFrontier(path, owner="worker-2")
+    first.add_many("Lenta", CATEGORY, [{"link": "a"}, {"link": "b"}])
+    first.mark_fetched("a")
+    second.mark_fetched("b")
+
+    # worker-1 перезапускается: его статья снова pending, статья worker-2 остается в работе
+    restarted = CrawlFrontier(path, owner="worker-1")
+    assert _states(restarted) == {"a": PENDING, "b": FETCHED}
+
+
+def test_failed_articles_are_dropped_after_lifetime_attempts(tmp_path):
+    frontier = CrawlFrontier(tmp_path / "frontier.sqlite")
+    frontier.add_many("Lenta", CATEGORY, [{"link": "dead"}])
+
+    rounds = 0
+    while _states(frontier)["dead"] != DROPPED:
+        for _ in range(FRONTIER_MAX_ATTEMPTS):
+            frontier.mark_failed("dead")
+        assert _states(frontier)["dead"] == FAILED
+        frontier.requeue_failed("Lenta", cooldown=0)
+        rounds += 1
+        assert rounds <= FRONTIER_MAX_TOTAL_ATTEMPTS
+
+    assert rounds * FRONTIER_MAX_ATTEMPTS == FRONTIER_MAX_TOTAL_ATTEMPTS
+    # dropped статья не возвращается в очередь и не добавляется заново из категории
+    assert frontier.requeue_failed("Lenta", cooldown=0) == 0
+    assert frontier.add_many("Lenta", CATEGORY, [{"link": "dead"}]) == []
+
+    frontier.connection.execute("UPDATE frontier SET updated_at = '2000-01-01 00:00:00'")
+    frontier.requeue_failed("Lenta", cooldown=0)
+    assert _states(frontier) == {}
+
+
+def test_waits_for_a_lock_held_by_another_process(tmp_path):
+    path = tmp_path / "frontier.sqlite"
+    frontier = CrawlFrontier(path)
+    frontier.add_many("Lenta", CATEGORY, [{"link": "a"}])
+
+    # Другой процесс держит блокировку записи 0.2 с
+    other = sqlite3.connect(str(path), isolation_level=None, check_same_thread=False)
+    other.execute("BEGIN IMMEDIATE")
+    try:
+        timer = threading.Timer(0.2, lambda: other.execute("COMMIT"))
+        timer.start()
+        frontier.mark_fetched("a")
+        timer.join()
+    finally:
+        other.close()
+    assert _states(frontier) == {"a": FETCHED}
@@ -0,0 +1,61 @@
+"""
+Счетчики датасета в info.json после записи пакетов.
+
+Запуск (из каталога parser_server):
+    python -m pytest tests/test_dataset_stats.py
+"""
+import csv
+from settings.json_setup import read_json_file
+from settings.paths import DATA_FILE_PATH
+from app.write_news_to_csv import write_news_to_csv
+
+
+def _article(number, source="Lenta", category="Политика"):
+    return {
+        "news_source_name": source,
+        "news_source_link": "https://example.org/",
+        "category_name": category,
+        "category_link": "https://example.org/politics/",
+        "article_date": "2026-10-17T14:35:00+03:00",
+        "article_link": f"https://example.org/news/{number}/",
+        "article_title": f"Статья {number}",
+        "article_text": f"Текст статьи номер {number}.",
+    }
+
+
+def _csv_rows():
+    with open(DATA_FILE_PATH, encoding="utf-8", newline="") as file:
+        return list(csv.DictReader(file))
+
+
+def test_first_batch_is_counted_once():
+    # Каталог данных пуст: счетчики строятся впервые во время записи пакета
+    assert not DATA_FILE_PATH.exists()
+    batch = [_article(1), _article(2), _article(3, source="RIA")]
+
+    assert write_news_to_csv(DATA_FILE_PATH, batch)
+
+    info = read_json_file()
+    assert len(_csv_rows()) == len(batch)
+    assert info["dataset_rows"] == len(batch)
+    assert info["rows_by_source"] == {"Lenta": 2, "RIA": 1}
+    assert info["rows_by_category"] == {"Lenta": {"Политика": 2}, "RIA": {"Политика": 1}}
+
+    # Следующий пакет (с повтором уже записанной статьи) добавляет только новые строки
+    assert write_news_to_csv(DATA_FILE_PATH, [_article(3, source="RIA"), _article(4, category="Спорт")])
+
+    info = read_json_file()
+    assert len(_csv_rows()) == 4
+    assert info["dataset_rows"] == 4
+    assert info["rows_by_category"] == {"Lenta": {"Политика": 2, "Спорт": 1}, "RIA": {"Политика": 1}}
+
+
+def test_index_error_does_not_escape(monkeypatch):
+    # Ошибка индекса ссылок возвращает False, а не завершает задачу записи
+    from app import write_news_to_csv as writer
+
+    def broken_index():
+        raise OSError("index is unavailable")
+
+    monkeypatch.setattr(writer, "get_articles_index", broken_index)
+    assert writer.write_news_to_csv(DATA_FILE_PATH, [_article(100)]) is False
@@ -0,0 +1,258 @@
+"""
+Разбор дат статей без locale совпадает с прежним разбором через strptime и ru_RU.UTF-8.
+
+Прежний parse_time_text разбирал строки форматами strptime с системной locale
+ru_RU.UTF-8. Эталон здесь — те же форматы strptime, но названия месяцев
+заменяются английскими, поэтому сравнение не зависит от установленных locale.
+Если ru_RU.UTF-8 установлена, отдельный тест проверяет, что такая замена дает
+тот же результат, что и сама locale.
+
+Строки, которые прежний разбор не понимал, а новый понимает намеренно
+(EXTENDED_CASES), проверяются отдельно.
+
+Запуск (из каталога parser_server):
+    python -m pytest tests/test_date_parser.py
+"""
+import locale
+import re
+from datetime import datetime
+import pytest
+from app.helpers import date_parser
+from app.helpers.date_parser import MOSCOW_TZ, parse_time_text, parse_time_texts
+
+# Форматы прежнего parse_time_text
+LEGACY_FORMATS = {
+    "ria": "%H:%M %d.%m.%Y",
+    "lenta": "%H:%M, %d %B %Y",
+    "gazeta": "%d %B %Y, %H:%M",
+    "rbk": "%d %b, %H:%M",
+}
+
+# Названия месяцев ru_RU.UTF-8: %B strptime принимает только полные названия в
+# родительном падеже, %b — только сокращения (у мая оно совпадает с полным)
+LEGACY_MONTHS = {
+    "января": "January", "февраля": "February", "марта": "March", "апреля": "April",
+    "мая": "May", "июня": "June", "июля": "July", "августа": "August",
+    "сентября": "September", "октября": "October", "ноября": "November", "декабря": "December",
+    "янв": "Jan", "фев": "Feb", "мар": "Mar", "апр": "Apr", "июн": "Jun",
+    "июл": "Jul", "авг": "Aug", "сен": "Sep", "окт": "Oct", "ноя": "Nov", "дек": "Dec",
+}
+_LEGACY_MONTH_PATTERN = re.compile(
+    "|".join(sorted(LEGACY_MONTHS, key=len, reverse=True)), re.IGNORECASE
+)
+
+
+def legacy_parse_time_text(time_text, name, now, month_names=True):
+    """Прежний parse_time_text с заданным текущим временем (now — aware datetime в MOSCOW_TZ)."""
+    if month_names:
+        # С ru_RU английские названия месяцев не разбирались
+        if re.search(r"[a-z]", time_text, re.IGNORECASE):
+            return None
+        time_text = _LEGACY_MONTH_PATTERN.sub(lambda found: LEGACY_MONTHS[found.group(0).lower()], time_text)
+    try:
+        if name == "rbk" and len(time_text) == 5 and ":" in time_text:
+            article_time = datetime.strptime(time_text, "%H:%M").replace(
+                year=now.year, month=now.month, day=now.day)
+        elif name == "rbk":
+            article_time = datetime.strptime(time_text, LEGACY_FORMATS[name]).replace(year=now.year)
+        elif name in LEGACY_FORMATS:
+            article_time = datetime.strptime(time_text, LEGACY_FORMATS[name])
+        else:
+            return None
+    except ValueError:
+        return None
+    return MOSCOW_TZ.localize(article_time).isoformat()
+
+
+def expected(time_text, name, now):
+    return legacy_parse_time_text(time_text, name, now) or time_text
+
+
+@pytest.fixture
+def frozen_now(monkeypatch):
+    """Подменяет текущее время в date_parser; возвращает функцию, задающую его."""
+    current = {}
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return current["now"].astimezone(tz) if tz is not None else current["now"].replace(tzinfo=None)
+
+    def freeze(year, month, day, hour=12, minute=0):
+        current["now"] = MOSCOW_TZ.localize(datetime(year, month, day, hour, minute))
+        return current["now"]
+
+    monkeypatch.setattr(date_parser, "datetime", FrozenDatetime)
+    return freeze
+
+
+SOURCE_CASES = {
+    "ria": [
+        "14:35 17.10.2026",
+        "9:05 17.10.2026",
+        "00:00 01.01.2026",
+        "23:59 31.12.2025",
+        "23:59 31.01.2026",
+        "00:00 01.02.2026",
+        "12:00 29.02.2024",
+        "12:00 29.02.2026",
+        "12:00 31.04.2026",
+        "12:00 17.13.2026",
+        "24:00 17.10.2026",
+        "14:35  17.10.2026",
+        "14:35 17.10.2026 ",
+        "14:35 17.10.26",
+        "14:35 17.10.2010",
+        "14:35 26.10.2014",
+        "14:35",
+        "сегодня, 14:35",
+        "вчера, 14:35",
+        "",
+    ],
+    "lenta": [
+        "14:35, 17 октября 2026",
+        "9:05, 7 октября 2026",
+        "14:35, 17 Октября 2026",
+        "00:00, 1 января 2026",
+        "23:59, 31 декабря 2025",
+        "23:59, 31 января 2026",
+        "12:00, 29 февраля 2024",
+        "12:00, 29 февраля 2026",
+        "12:00, 31 апреля 2026",
+        "14:35,17 октября 2026",
+        "14:35, 17 October 2026",
+        "14:35",
+        "сегодня, 14:35",
+        "вчера, 14:35",
+        "Вчера в 14:35",
+    ],
+    "gazeta": [
+        "17 октября 2026, 14:35",
+        "7 октября 2026, 9:05",
+        "1 января 2026, 00:00",
+        "31 декабря 2025, 23:59",
+        "30 ноября 2026, 23:59",
+        "1 декабря 2026, 00:00",
+        "29 февраля 2024, 12:00",
+        "29 февраля 2026, 12:00",
+        "31 июня 2026, 12:00",
+        "17 мая 2026, 14:35",
+        "17 октября 2026 14:35",
+        "14:35",
+        "сегодня, 14:35",
+        "вчера, 14:35",
+    ],
+}
+
+RBK_CASES = [
+    "14:35",
+    "00:00",
+    "23:59",
+    "9:05",
+    "24:00",
+    "17 окт, 14:35",
+    "1 янв, 00:00",
+    "31 дек, 23:59",
+    "31 янв, 23:59",
+    "1 фев, 00:00",
+    "28 фев, 12:00",
+    "31 апр, 12:00",
+    "17 мая, 14:35",
+    "17 окт 2026, 14:35",
+    "сегодня, 14:35",
+    "вчера, 14:35",
+]
+
+# Текущий день для rbk: середина года, конец и начало года, 29 февраля
+RBK_TODAY = [(2026, 10, 17), (2025, 12, 31), (2026, 1, 1), (2024, 2, 29)]
+
+
+@pytest.mark.parametrize(
+    "name,time_text",
+    [(name, time_text) for name, cases in SOURCE_CASES.items() for time_text in cases],
+)
+def test_matches_legacy_strptime(frozen_now, name, time_text):
+    now = frozen_now(2026, 10, 17)
+    assert parse_time_text(time_text, name) == expected(time_text, name, now)
+
+
+@pytest.mark.parametrize("today", RBK_TODAY)
+@pytest.mark.parametrize("time_text", RBK_CASES)
+def test_rbk_matches_legacy_strptime(frozen_now, today, time_text):
+    now = frozen_now(*today)
+    assert parse_time_text(time_text, "rbk") == expected(time_text, "rbk", now)
+
+
+@pytest.mark.parametrize("today", RBK_TODAY)
+def test_rbk_time_only_uses_moscow_day(frozen_now, today):
+    # Около полуночи UTC день в Москве уже следующий
+    now = frozen_now(*today, hour=0, minute=30)
+    assert parse_time_text("00:15", "rbk") == f"{now:%Y-%m-%d}T00:15:00+03:00"
+    assert parse_time_text("00:15", "rbk") == expected("00:15", "rbk", now)
+
+
+def test_relative_days_are_not_resolved(frozen_now):
+    # Ни прежний, ни новый разбор не понимают "сегодня"/"вчера": строка возвращается как есть
+    frozen_now(2026, 10, 17)
+    for name in ("ria", "lenta", "gazeta", "rbk"):
+        assert parse_time_text("сегодня, 14:35", name) == "сегодня, 14:35"
+        assert parse_time_text("вчера, 14:35", name) == "вчера, 14:35"
+
+
+# Строки, которые прежний разбор возвращал как есть: (источник, строка, текущий день, результат)
+EXTENDED_CASES = [
+    # Именительный падеж и сокращения, которых нет в таблицах ru_RU
+    ("lenta", "14:35, 17 октябрь 2026", (2026, 10, 17), "2026-10-17T14:35:00+03:00"),
+    ("gazeta", "17 май 2026, 14:35", (2026, 10, 17), "2026-05-17T14:35:00+03:00"),
+    ("rbk", "17 сент, 14:35", (2026, 10, 17), "2026-09-17T14:35:00+03:00"),
+    ("rbk", "17 нояб, 14:35", (2026, 10, 17), "2026-11-17T14:35:00+03:00"),
+    # Сокращение вместо полного названия и наоборот
+    ("lenta", "14:35, 17 окт 2026", (2026, 10, 17), "2026-10-17T14:35:00+03:00"),
+    ("rbk", "17 октября, 14:35", (2026, 10, 17), "2026-10-17T14:35:00+03:00"),
+    # strptime без года проверял 29 февраля по 1900 году и отвергал его
+    ("rbk", "29 фев, 12:00", (2024, 2, 29), "2024-02-29T12:00:00+03:00"),
+]
+
+
+@pytest.mark.parametrize("name,time_text,today,result", EXTENDED_CASES)
+def test_extended_cases(frozen_now, name, time_text, today, result):
+    now = frozen_now(*today)
+    assert legacy_parse_time_text(time_text, name, now) is None
+    assert parse_time_text(time_text, name) == result
+
+
+def test_unknown_source_returns_text():
+    assert parse_time_text("14:35 17.10.2026", "unknown") == "14:35 17.10.2026"
+
+
+def test_parse_time_texts_matches_single_calls(frozen_now):
+    frozen_now(2026, 10, 17)
+    for name, cases in SOURCE_CASES.items():
+        assert parse_time_texts(cases, name) == [parse_time_text(time_text, name) for time_text in cases]
+    assert parse_time_texts(RBK_CASES, "rbk") == [parse_time_text(time_text, "rbk") for time_text in RBK_CASES]
+
+
+def _ru_locale_available():
+    saved = locale.setlocale(locale.LC_TIME)
+    try:
+        locale.setlocale(locale.LC_TIME, "ru_RU.UTF-8")
+    except locale.Error:
+        return False
+    finally:
+        locale.setlocale(locale.LC_TIME, saved)
+    return True
+
+
+@pytest.mark.skipif(not _ru_locale_available(), reason="ru_RU.UTF-8 locale is not installed")
+def test_month_translation_matches_ru_locale():
+    now = MOSCOW_TZ.localize(datetime(2026, 10, 17, 12, 0))
+    saved = locale.setlocale(locale.LC_TIME)
+    try:
+        locale.setlocale(locale.LC_TIME, "ru_RU.UTF-8")
+        cases = [(name, time_text) for name, texts in SOURCE_CASES.items() for time_text in texts]
+        cases += [("rbk", time_text) for time_text in RBK_CASES]
+        cases += [(name, time_text) for name, time_text, _, _ in EXTENDED_CASES]
+        with_locale = [legacy_parse_time_text(text, name, now, month_names=False) for name, text in cases]
+    finally:
+        locale.setlocale(locale.LC_TIME, saved)
+    assert with_locale == [legacy_parse_time_text(text, name, now) for name, text in cases]
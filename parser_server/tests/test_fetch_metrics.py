@@ -0,0 +1,37 @@
+"""
+Метки источников и размер ответов в метриках загрузки.
+
+Запуск (из каталога parser_server):
+    python -m pytest tests/test_fetch_metrics.py
+"""
+from types import SimpleNamespace
+import pytest
+from app.helpers.fetch_html import _wire_size, get_host_source
+
+
+@pytest.mark.parametrize("host,source", [
+    ("lenta.ru", "Lenta"),
+    ("www.gazeta.ru", "Gazeta"),
+    ("gazeta.ru", "Gazeta"),
+    ("sportrbc.rbc.ru", "RBK"),
+    ("ria.ru:443", "RIA"),
+    ("moslenta.ru", "other"),
+])
+def test_host_source(host, source):
+    assert get_host_source(host) == source
+
+
+def _response(headers, content_length=None):
+    return SimpleNamespace(headers=headers, content_length=content_length)
+
+
+def test_wire_size_uses_content_length():
+    assert _wire_size(_response({"Content-Encoding": "gzip"}, 120), b"x" * 900) == 120
+
+
+def test_wire_size_of_uncompressed_chunked_body():
+    assert _wire_size(_response({}), b"x" * 900) == 900
+
+
+def test_wire_size_of_compressed_chunked_body_is_unknown():
+    assert _wire_size(_response({"Content-Encoding": "br"}), b"x" * 900) is None
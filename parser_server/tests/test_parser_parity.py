@@ -0,0 +1,47 @@
+"""
+Совпадение данных, извлеченных разными движками разбора HTML, на фикстурах.
+
+Запуск (из каталога parser_server):
+    python -m pytest tests/test_parser_parity.py
+"""
+import pytest
+from app.helpers.html_parser import (
+    PARSER_BACKENDS,
+    get_parser_backend,
+    is_parser_backend_available,
+    set_parser_backend,
+)
+from utils.parser_parity_check import (
+    FIXTURE_SOURCES,
+    REFERENCE_BACKEND,
+    empty_fields,
+    extract_fixture_fields,
+)
+
+
+def _extract_with(backend, source):
+    initial_backend = get_parser_backend()
+    set_parser_backend(backend)
+    try:
+        return extract_fixture_fields(source)
+    finally:
+        set_parser_backend(initial_backend)
+
+
+@pytest.fixture(scope="module")
+def reference_fields():
+    return {source: _extract_with(REFERENCE_BACKEND, source) for source in FIXTURE_SOURCES}
+
+
+@pytest.mark.parametrize("source", sorted(FIXTURE_SOURCES))
+def test_reference_backend_extracts_every_fixture(reference_fields, source):
+    assert empty_fields(reference_fields[source]) == []
+
+
+@pytest.mark.parametrize("source", sorted(FIXTURE_SOURCES))
+@pytest.mark.parametrize("backend", [backend for backend in PARSER_BACKENDS if backend != REFERENCE_BACKEND])
+def test_backend_matches_reference(reference_fields, backend, source):
+    if not is_parser_backend_available(backend):
+        pytest.skip(f"{backend} is not installed")
+
+    assert _extract_with(backend, source) == reference_fields[source]
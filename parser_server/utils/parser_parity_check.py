@@ -0,0 +1,119 @@
+"""
+Проверка того, что все движки разбора HTML извлекают одинаковые данные.
+
+Запускает функции extract_* правил каждого источника на HTML из fixtures/ с каждым
+движком из PARSER_BACKENDS и сравнивает результат с эталонным "html.parser".
+Код возврата 1, если результаты различаются или извлечение упало либо ничего
+не извлекло хотя бы одним движком.
+
+Запуск (из каталога parser_server):
+    python -m utils.parser_parity_check
+"""
+import sys
+from pathlib import Path
+from typing import Dict, List
+from app.helpers import extraction_rules
+from app.helpers.html_parser import (
+    PARSER_BACKENDS,
+    get_parser_backend,
+    is_parser_backend_available,
+    set_parser_backend,
+)
+
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / "fixtures"
+
+REFERENCE_BACKEND = "html.parser"
+
+# Источник -> (главная страница, страница категории, страница статьи)
+FIXTURE_SOURCES = {
+    "lenta": ("https://lenta.ru/", "https://lenta.ru/rubrics/russia/", "https://lenta.ru/news/2026/10/17/budget/"),
+    "ria": ("https://ria.ru/", "https://ria.ru/politics/", "https://ria.ru/20261017/summit-1945000001.html"),
+    "rbk": ("https://www.rbc.ru/", "https://www.rbc.ru/politics/", "https://www.rbc.ru/politics/17/10/2026/6711aa01"),
+    "gazeta": ("https://www.gazeta.ru/", "https://www.gazeta.ru/politics/", "https://www.gazeta.ru/politics/news/2026/10/17/24000001.shtml"),
+}
+
+
+def read_fixture(source: str, page: str, fixtures_dir=FIXTURES_DIR) -> str:
+    """Читает HTML фикстуру страницы источника (main, category или article) из fixtures_dir."""
+    return (Path(fixtures_dir) / source / f"{page}.html").read_text(encoding="utf-8")
+
+
+def extract_fixture_fields(source: str, fixtures_dir=FIXTURES_DIR) -> Dict[str, object]:
+    """
+    Извлекает данные из всех фикстур источника текущим движком разбора.
+
+    Аргументы:
+        source (str): Название источника из FIXTURE_SOURCES.
+        fixtures_dir (Path): Каталог страниц источников.
+
+    Возвращает:
+        dict: Результаты extract_categories, extract_articles_in_category и extract_article.
+
+    Исключения:
+        Exception: Исключение функции извлечения пробрасывается: упавшее
+                   извлечение — ошибка, даже если все движки падают одинаково.
+    """
+    main_url, category_url, article_url = FIXTURE_SOURCES[source]
+    return {
+        "categories": extraction_rules.extract_categories(source, read_fixture(source, "main", fixtures_dir), main_url),
+        "articles_in_category": extraction_rules.extract_articles_in_category(
+            source, read_fixture(source, "category", fixtures_dir), category_url
+        ),
+        "article": extraction_rules.extract_article(source, read_fixture(source, "article", fixtures_dir), article_url),
+    }
+
+
+def empty_fields(extracted: Dict[str, object]) -> List[str]:
+    """Возвращает поля, из которых ничего не извлечено: каждая фикстура должна давать данные."""
+    return [field for field, value in extracted.items() if not value]
+
+
+def parser_parity_check() -> bool:
+    """
+    Сравнивает результаты всех установленных движков с эталонным.
+
+    Проверка не пройдена, если извлечение упало или ничего не извлекло
+    (любым движком, включая эталонный) либо если результат отличается от эталона.
+
+    Возвращает:
+        bool: True, если все движки извлекли одинаковые непустые данные.
+    """
+    initial_backend = get_parser_backend()
+    results = {}
+    ok = True
+    try:
+        for backend in PARSER_BACKENDS:
+            if not is_parser_backend_available(backend):
+                print(f"[skip] {backend}: not installed")
+                continue
+            set_parser_backend(backend)
+            results[backend] = {}
+            for source in FIXTURE_SOURCES:
+                try:
+                    results[backend][source] = extract_fixture_fields(source)
+                except Exception as e:
+                    ok = False
+                    print(f"[error] {backend} / {source}: {type(e).__name__}: {e}")
+    finally:
+        set_parser_backend(initial_backend)
+
+    reference = results[REFERENCE_BACKEND]
+    for backend, fields in results.items():
+        backend_ok = len(fields) == len(FIXTURE_SOURCES)
+        for source, extracted in fields.items():
+            for field in empty_fields(extracted):
+                backend_ok = False
+                print(f"[empty] {backend} / {source} / {field}")
+            if source not in reference:
+                continue
+            for field, value in extracted.items():
+                if value != reference[source][field]:
+                    backend_ok = False
+                    print(f"[diff] {backend} / {source} / {field}:\n  {REFERENCE_BACKEND}: {reference[source][field]!r}\n  {backend}: {value!r}")
+        print(f"[{'ok' if backend_ok else 'fail'}] {backend}")
+        ok = ok and backend_ok
+    return ok
+
+
+if __name__ == "__main__":
+    sys.exit(0 if parser_parity_check() else 1)
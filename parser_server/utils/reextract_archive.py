@@ -0,0 +1,131 @@
+"""
+Повторное извлечение статей из архива HTML без обращения к сайтам.
+
+Для последней загрузки каждой статьи архива (shared_data/html_archive) заново
+запускает extract_article по правилам ее источника в пуле процессов и записывает
+собранные строки датасета в отдельный CSV файл. Так изменения в разборе можно
+применить к уже загруженным статьям со скоростью диска.
+
+Запуск (из каталога parser_server):
+    python -m utils.reextract_archive [--source rbk] [--since 2026-10-01] [--workers 4] [--output path.csv]
+"""
+import argparse
+import csv
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Tuple
+from app.helpers.extraction_rules import extract_article, get_source_rules
+from app.helpers.html_archive import HtmlArchive
+from app.helpers.html_parser import PARSER_BACKENDS, get_parser_backend, set_parser_backend
+from settings.constants import NEWS_COLUMNS
+from settings.paths import DATA_DIR_PATH, HTML_ARCHIVE_DIR_PATH
+
+DEFAULT_OUTPUT_PATH = DATA_DIR_PATH / "news_reextracted.csv"
+
+
+def _extract_entry(task: Tuple[Dict[str, str], str]) -> Tuple[Dict[str, str], Optional[Dict[str, str]], Optional[str]]:
+    entry, object_path = task
+    try:
+        html = HtmlArchive.read_object(object_path)
+        return entry, extract_article(entry["news_source_name"], html, entry["article_link"]), None
+    except Exception as e:
+        return entry, None, f"{type(e).__name__}: {e}"
+
+
+def build_row(entry: Dict[str, str], full_article: Dict[str, str]) -> Dict[str, str]:
+    """
+    Собирает строку датасета так же, как скрапперы.
+
+    Аргументы:
+        entry (dict): Запись индекса архива.
+        full_article (dict): Результат extract_article.
+
+    Возвращает:
+        dict: Строка датасета с ключами из NEWS_COLUMNS.
+    """
+    return {
+        "news_source_name": entry["news_source_name"],
+        "news_source_link": get_source_rules()[entry["news_source_name"]].url,
+        "category_name": entry["category_name"] or "",
+        "category_link": entry["category_link"] or "",
+        "article_date": full_article.get("date", ""),
+        "article_link": entry["article_link"],
+        "article_title": full_article.get("title", entry["article_title"] or ""),
+        "article_text": full_article.get("text", ""),
+    }
+
+
+def reextract_archive(source=None, since=None, workers=None, output_path=DEFAULT_OUTPUT_PATH, archive_dir=HTML_ARCHIVE_DIR_PATH) -> Dict[str, int]:
+    """
+    Заново извлекает статьи из архива HTML и записывает их в CSV файл.
+
+    Аргументы:
+        source (str): Только статьи этого источника; None — все.
+        since (str): Только загрузки не раньше этой даты.
+        workers (int): Число процессов; None — по числу ядер.
+        output_path (Path): CSV файл для собранных строк (перезаписывается).
+        archive_dir (Path): Каталог архива.
+
+    Возвращает:
+        dict: Число записей архива, записанных строк, пустых результатов и ошибок.
+    """
+    archive = HtmlArchive(archive_dir)
+    tasks = [
+        (entry, str(archive.object_path(entry["content_hash"])))
+        for entry in archive.iter_latest(source, since)
+        if entry["news_source_name"] in get_source_rules()
+    ]
+    archive.close()
+
+    stats = {"entries": len(tasks), "rows": 0, "empty": 0, "errors": 0}
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=set_parser_backend,
+        initargs=(get_parser_backend(),),
+    ) as executor, open(output_path, "w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(NEWS_COLUMNS)
+        for entry, full_article, error in executor.map(_extract_entry, tasks, chunksize=16):
+            if error is not None:
+                stats["errors"] += 1
+                print(f"[error] {entry['article_link']}: {error}")
+            elif not full_article:
+                stats["empty"] += 1
+            else:
+                row = build_row(entry, full_article)
+                writer.writerow([row[column] for column in NEWS_COLUMNS])
+                stats["rows"] += 1
+    return stats
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Re-extract articles from the raw HTML archive")
+    parser.add_argument("--source", choices=sorted(get_source_rules()), help="only this source")
+    parser.add_argument("--since", help="only fetches since this date (YYYY-MM-DD[ HH:MM:SS])")
+    parser.add_argument("--workers", type=int, default=None, help="number of processes (default: CPU count)")
+    parser.add_argument("--backend", choices=PARSER_BACKENDS, default=None, help="HTML parser backend")
+    parser.add_argument("--output", default=str(DEFAULT_OUTPUT_PATH), help="output CSV file")
+    args = parser.parse_args()
+
+    if not os.path.exists(HTML_ARCHIVE_DIR_PATH):
+        print(f"HTML archive not found: {HTML_ARCHIVE_DIR_PATH}")
+        return 1
+    if args.backend:
+        set_parser_backend(args.backend)
+
+    started = time.perf_counter()
+    stats = reextract_archive(args.source, args.since, args.workers, args.output)
+    elapsed = time.perf_counter() - started
+    print(
+        f"{stats['entries']} archived pages -> {stats['rows']} rows "
+        f"({stats['empty']} empty, {stats['errors']} errors) in {elapsed:.1f}s, written to {args.output}"
+    )
+    return 0 if stats["errors"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())